@@ -1,13 +1,21 @@
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
-from trade_simulation import (
+from utils import strategy
+from utils.trade_simulation import (
     TRADE_MAP,
     trade_from_choices,
     simulate_trade,
     pv_k,
 )
 
+LEGS = ("call", "put", "stock", "pvk")
+SCENARIO_COLUMNS = ("S", "K", "C", "P", "r", "T")
+# payoff_simulation's default grid, as multiples of spot
+PAYOFF_MONEYNESS = (0.8, 0.9, 1.0, 1.1, 1.2)
+
 
 def action_name(leg: str, sign: int) -> str:
     """Return human readable action name for a trade leg."""
@@ -61,3 +69,107 @@ def payoff_simulation(params: dict, trade: dict, spots=None):
         spots = np.linspace(0.8 * params["S"], 1.2 * params["S"], 5)
     cf0, pnls = simulate_trade(params, trade, S_future=spots)
     return cf0, pnls
+
+
+def _leg_mask_labels(fn):
+    """``fn(mismatched)`` for every subset of legs, indexed by bitmask."""
+    return np.array(
+        [fn([leg for bit, leg in enumerate(LEGS) if mask >> bit & 1]) for mask in range(1 << len(LEGS))],
+        dtype=object,
+    )
+
+
+_MISMATCH_LABELS = _leg_mask_labels(",".join)
+_HINT_LABELS = _leg_mask_labels(lambda legs: hint_message(legs) or "")
+
+
+def correct_trades(S, K, C, P, r, T):
+    """Required leg signs per row, as ``parity.arbitrage_strategy`` would pick them.
+
+    Returns a ``(n, 4)`` integer array ordered as :data:`LEGS`. Rows with a
+    missing (non-finite) quote have no parity difference to trade on and
+    get the "No arbitrage" row of zeros.
+    """
+    diff = np.asarray(C) - P - (np.asarray(S) - pv_k(np.asarray(K), r, T))
+    diff = np.where(np.isfinite(diff), diff, 0.0)
+    table = np.array(
+        [
+            [TRADE_MAP["Buy call, sell put, buy stock, borrow PV(K)"][leg] for leg in LEGS],
+            [TRADE_MAP["No arbitrage"][leg] for leg in LEGS],
+            [TRADE_MAP["Sell call, buy put, short stock, lend PV(K)"][leg] for leg in LEGS],
+        ]
+    )
+    return table[np.sign(diff).astype(np.intp) + 1]
+
+
+def grade_submissions(submissions):
+    """Grade many submissions at once.
+
+    ``submissions`` is a DataFrame (or Arrow table) with one row per
+    submission: the signed legs in :data:`LEGS` and the scenario in
+    :data:`SCENARIO_COLUMNS`. Returns a DataFrame, aligned with the input,
+    holding what :func:`compare_trades`, :func:`hint_message` and
+    :func:`payoff_simulation` give for each row: ``matches``,
+    ``mismatched`` (comma-separated legs), ``hint``, ``correct``, ``cf0``
+    and ``pnl_80`` ... ``pnl_120`` at the default terminal spots.
+    ``valid`` is false where a scenario value is missing; such rows are
+    graded against "No arbitrage" but never count as ``correct``.
+    """
+    if isinstance(submissions, (pa.Table, pa.RecordBatch)):
+        submissions = submissions.to_pandas()
+    missing = [c for c in LEGS + SCENARIO_COLUMNS if c not in submissions.columns]
+    if missing:
+        raise ValueError(f"Submissions are missing columns {missing}")
+    S, K, C, P, r, T = (submissions[c].to_numpy(dtype=float) for c in SCENARIO_COLUMNS)
+    user = np.column_stack([submissions[leg].to_numpy(dtype=float) for leg in LEGS])
+    want = correct_trades(S, K, C, P, r, T)
+    valid = np.isfinite(np.column_stack([S, K, C, P, r, T])).all(axis=1)
+
+    mismatch = user != want
+    mask = mismatch @ (1 << np.arange(len(LEGS)))
+    with np.errstate(invalid="ignore"):  # 0 * inf on rows that are not valid
+        cf0 = -user[:, 0] * C - user[:, 1] * P - user[:, 2] * S + user[:, 3] * pv_k(K, r, T)
+
+    # one strategy.LEG_DTYPE row of call, put, stock and pvk legs per submission
+    legs = np.zeros(user.shape, dtype=strategy.LEG_DTYPE)
+    legs["kind"] = [strategy.LEG_KINDS.index(leg) for leg in LEGS]
+    legs["strike"] = K[:, None]
+    legs["qty"] = user
+    end = strategy.payoff(legs, S[:, None] * np.asarray(PAYOFF_MONEYNESS))
+    graded = {
+        "matches": len(LEGS) - mismatch.sum(axis=1),
+        "mismatched": _MISMATCH_LABELS[mask],
+        "hint": _HINT_LABELS[mask],
+        "correct": (mask == 0) & valid,
+        "valid": valid,
+        "cf0": cf0,
+    }
+    for i, m in enumerate(PAYOFF_MONEYNESS):
+        graded[f"pnl_{round(m * 100)}"] = cf0 + end[:, i]
+    return pd.DataFrame(graded, index=submissions.index)
+
+
+def grade_parquet(source, destination, batch_size=65_536, keep_columns=None):
+    """Grade a Parquet file of submissions into a Parquet file of results.
+
+    Submissions are read and graded ``batch_size`` rows at a time, each
+    batch becoming one row group, so cohorts larger than memory work too.
+    ``keep_columns`` (e.g. a student id) are copied through in front of
+    the grades. Returns the number of rows written.
+    """
+    keep_columns = list(keep_columns or [])
+    columns = keep_columns + list(LEGS + SCENARIO_COLUMNS)
+    rows, writer = 0, None
+    try:
+        for batch in pq.ParquetFile(str(source)).iter_batches(batch_size=batch_size, columns=columns):
+            frame = batch.to_pandas()
+            graded = pd.concat([frame[keep_columns], grade_submissions(frame)], axis=1)
+            table = pa.Table.from_pandas(graded, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(str(destination), table.schema)
+            writer.write_table(table, row_group_size=table.num_rows)
+            rows += table.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
@@ -0,0 +1 @@
+"""Micro-benchmarks for optionsMock. Run from the repo root with ``python -m benchmarks.<name>``."""
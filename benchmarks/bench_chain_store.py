@@ -0,0 +1,73 @@
+"""Write/read throughput of chain snapshots: pickle versus Arrow IPC and Parquet."""
+
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from utils import chain_store
+from utils.options_chain import chain_frame, format_chain
+
+
+def _best_of(fn, repeat):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(n_strikes=2_000, n_expiries=50, repeat=5):
+    chain = chain_frame(100.0, 0.03, np.linspace(1 / 52, 2.0, n_expiries), np.linspace(50, 150, n_strikes), 0.25)
+    display = format_chain(chain)  # what generate_chain returns and pages used to pickle
+    one_T = chain["T"].iloc[len(chain) // 2]
+    one_label = chain["Expiry"].iloc[len(chain) // 2]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {name: os.path.join(tmp, f"chain.{ext}") for name, ext in
+                 (("pickle (display)", "display.pkl"), ("pickle", "pkl"), ("ipc", "arrow"), ("parquet", "parquet"))}
+        rows = [
+            (
+                "pickle (display)",
+                lambda: display.to_pickle(paths["pickle (display)"]),
+                lambda: pd.read_pickle(paths["pickle (display)"]),
+                lambda: (lambda df: df[df["Expiry"] == one_label])(pd.read_pickle(paths["pickle (display)"])),
+            ),
+            (
+                "pickle",
+                lambda: chain.to_pickle(paths["pickle"]),
+                lambda: pd.read_pickle(paths["pickle"]),
+                lambda: (lambda df: df[df["T"] == one_T])(pd.read_pickle(paths["pickle"])),
+            ),
+        ]
+        for name in ("ipc", "parquet"):
+            rows.append(
+                (
+                    name,
+                    lambda p=paths[name]: chain_store.write_chain(chain, p),
+                    lambda p=paths[name]: chain_store.read_chain(p),
+                    lambda p=paths[name]: chain_store.read_chain(p, expiry=one_T),
+                )
+            )
+
+        print(f"rows: {len(chain):,}")
+        print(f"{'':<18}{'write':>10}{'read all':>11}{'1 expiry':>11}{'size':>10}")
+        for name, write, read, read_one in rows:
+            t_write = _best_of(write, repeat)
+            t_read = _best_of(read, repeat)
+            t_one = _best_of(read_one, repeat)
+            size = os.path.getsize(paths[name]) / 2**20
+            print(f"{name:<18}{t_write * 1e3:>8.1f}ms{t_read * 1e3:>9.1f}ms{t_one * 1e3:>9.2f}ms{size:>8.1f}MB")
+
+        before = pa.total_allocated_bytes()
+        table = chain_store.read_chain_table(paths["ipc"], expiry=one_T)
+        print(f"ipc single-expiry table: {table.num_rows} rows, "
+              f"{pa.total_allocated_bytes() - before} bytes allocated (memory-mapped)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Streaming a multi-underlying chain to Parquet with memory bounded by the block size.
+
+The same chain is written with two block sizes. Peak Python/NumPy memory
+(tracemalloc) and the Arrow pool high-water mark must scale with the block,
+not with the total row count; the run fails with an AssertionError if not.
+"""
+
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pyarrow as pa
+
+from utils import chain_store
+
+# 13 float columns plus two object columns of 8-byte pointers
+_BYTES_PER_ROW = 15 * 8
+
+
+def _stream(path, n_underlyings, chunk_rows):
+    underlyings = ((f"U{i:04d}", 50.0 + i % 100) for i in range(n_underlyings))
+    expiries = np.linspace(1 / 12, 2.0, 24)
+    strikes = np.linspace(25, 175, 500)
+    return chain_store.write_chain_parquet(path, underlyings, 0.03, expiries, strikes, 0.25, chunk_rows)
+
+
+def main(n_underlyings=200, chunk_sizes=(16_384, 131_072), slack=12):
+    with tempfile.TemporaryDirectory() as tmp:
+        _stream(os.path.join(tmp, "warmup.parquet"), 2, 1_024)  # lazy imports, dictionaries
+        for chunk_rows in chunk_sizes:
+            path = os.path.join(tmp, f"chain_{chunk_rows}.parquet")
+            pool = pa.default_memory_pool()
+            arrow_before = pool.max_memory()
+            tracemalloc.start()
+            start = time.perf_counter()
+            rows = _stream(path, n_underlyings, chunk_rows)
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            block = chunk_rows * _BYTES_PER_ROW
+            total = rows * _BYTES_PER_ROW
+            print(
+                f"chunk {chunk_rows:>7,}: {rows:,} rows in {elapsed:.2f}s "
+                f"({rows / elapsed / 1e6:.2f}M rows/s), file {os.path.getsize(path) / 2**20:.1f}MB"
+            )
+            print(
+                f"  peak traced {peak / 2**20:6.1f}MB, arrow pool max {pool.max_memory() / 2**20:6.1f}MB, "
+                f"one block {block / 2**20:.1f}MB, whole chain {total / 2**20:.0f}MB"
+            )
+            assert peak < slack * block, "streaming peak is not bounded by the block size"
+            assert peak < total / 4, "streaming held a large fraction of the chain"
+            # the pool's high-water mark is process-wide, so only check it grew by at most a few blocks
+            assert pool.max_memory() - arrow_before < slack * block
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Carr-Madan FFT strike grids against the closed-form Black-Scholes path."""
+
+import time
+
+import numpy as np
+
+from utils import option_pricing as op
+from utils.fft_pricing import fft_prices
+
+HESTON = {"v0": 0.04, "kappa": 2.0, "theta": 0.05, "xi": 0.5, "rho": -0.7}
+
+
+def _best_time(fn, repeat=5):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(S=100.0, r=0.03, q=0.01, sigma=0.25):
+    expiries = np.array([1 / 12, 0.25, 0.5, 1.0, 2.0])
+    for n_strikes in (50, 500, 2_000):
+        strikes = np.linspace(0.6 * S, 1.6 * S, n_strikes)
+        T = expiries[:, None]
+        calls, puts = fft_prices(S, r, expiries, strikes, q, model="bs", sigma=sigma)
+        err = max(
+            np.abs(calls - op.call_price(S, strikes, r, T, sigma, q)).max(),
+            np.abs(puts - op.put_price(S, strikes, r, T, sigma, q)).max(),
+        )
+        t_fft = _best_time(lambda: fft_prices(S, r, expiries, strikes, q, model="bs", sigma=sigma))
+        t_bs = _best_time(lambda: op.price_and_greeks(S, strikes, r, T, sigma, q))
+        t_scalar = _best_time(lambda: [op.call_price(S, K, r, t, sigma, q) for t in expiries for K in strikes], 1)
+        t_heston = _best_time(lambda: fft_prices(S, r, expiries, strikes, q, model="heston", **HESTON))
+        print(
+            f"{len(expiries)} expiries x {n_strikes:>5} strikes | max |fft - BS| {err:.1e} | "
+            f"fft bs {t_fft * 1e3:6.2f} ms, fft heston {t_heston * 1e3:6.2f} ms, "
+            f"closed form array {t_bs * 1e3:6.2f} ms, per-strike loop {t_scalar * 1e3:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
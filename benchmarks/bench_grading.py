@@ -0,0 +1,94 @@
+"""Batch grading throughput (rows/sec) versus grading one submission at a time."""
+
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from arbitrage_simulator import (
+    LEGS,
+    PAYOFF_MONEYNESS,
+    compare_trades,
+    grade_parquet,
+    grade_submissions,
+    hint_message,
+    payoff_simulation,
+)
+from utils import parity
+from utils.trade_simulation import TRADE_MAP
+
+
+def _submissions(n, seed):
+    rng = np.random.default_rng(seed)
+    S = rng.uniform(80, 120, n)
+    K = np.round(rng.uniform(80, 120, n) * 2) / 2
+    r = rng.uniform(0.0, 0.05, n)
+    T = rng.uniform(0.25, 1.0, n)
+    C = np.maximum(S - K * np.exp(-r * T), 0) + rng.uniform(1, 6, n)
+    P = C - S + K * np.exp(-r * T) + rng.normal(scale=0.5, size=n)
+    frame = pd.DataFrame({"student": np.arange(n), "S": S, "K": K, "C": C, "P": P, "r": r, "T": T})
+    for leg in LEGS:
+        frame[leg] = rng.choice([-1, 0, 1], n, p=[0.4, 0.2, 0.4])
+    return frame
+
+
+def _grade_one(row):
+    params = {k: row[k] for k in ("S", "K", "C", "P", "r", "T")}
+    trade = {leg: int(row[leg]) for leg in LEGS}
+    _, diff = parity.parity_violation(params)
+    matches, mismatched = compare_trades(trade, TRADE_MAP[parity.arbitrage_strategy(diff)])
+    spots = np.asarray(PAYOFF_MONEYNESS) * params["S"]
+    cf0, pnls = payoff_simulation(params, trade, spots=spots)
+    return matches, ",".join(mismatched), hint_message(mismatched) or "", cf0, list(pnls.values())
+
+
+def main(n_rows=500_000, n_loop=5_000, seed=0):
+    frame = _submissions(n_rows, seed)
+
+    start = time.perf_counter()
+    graded = grade_submissions(frame)
+    t_batch = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ref = [_grade_one(row) for row in frame.head(n_loop).to_dict("records")]
+    t_loop = time.perf_counter() - start
+    pnl_columns = [f"pnl_{round(m * 100)}" for m in PAYOFF_MONEYNESS]
+    head = graded.head(n_loop)
+    assert head["matches"].tolist() == [g[0] for g in ref]
+    assert head["mismatched"].tolist() == [g[1] for g in ref]
+    assert head["hint"].tolist() == [g[2] for g in ref]
+    assert np.allclose(head["cf0"], [g[3] for g in ref])
+    assert np.allclose(head[pnl_columns].to_numpy(), [g[4] for g in ref])
+
+    # a missing quote is graded against "No arbitrage" and is never correct
+    gaps = frame.head(8).copy()
+    gaps.loc[gaps.index[:4], "C"] = np.nan
+    gaps.loc[gaps.index[4:6], "P"] = np.inf
+    gaps.loc[gaps.index[6], LEGS] = 0
+    gaps.loc[gaps.index[6], "S"] = np.nan
+    flagged = grade_submissions(gaps)
+    assert not flagged["valid"][:7].any() and flagged["valid"].iloc[7]
+    assert not flagged["correct"][:7].any()
+    assert flagged["matches"][:7].tolist() == (gaps[list(LEGS)][:7] == 0).sum(axis=1).tolist()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source, destination = os.path.join(tmp, "submissions.parquet"), os.path.join(tmp, "grades.parquet")
+        frame.to_parquet(source, index=False)
+        start = time.perf_counter()
+        rows = grade_parquet(source, destination, keep_columns=["student"])
+        t_file = time.perf_counter() - start
+        back = pd.read_parquet(destination)
+        assert rows == n_rows and back["student"].tolist() == frame["student"].tolist()
+        assert np.array_equal(back["matches"].to_numpy(), graded["matches"].to_numpy())
+
+    print(f"submissions:           {n_rows:,}")
+    print(f"one at a time:         {n_loop / t_loop:14,.0f} rows/s")
+    print(f"grade_submissions:     {n_rows / t_batch:14,.0f} rows/s")
+    print(f"grade_parquet (I/O):   {n_rows / t_file:14,.0f} rows/s")
+    print(f"fully correct:         {graded['correct'].mean():.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Higher-order Greeks: finite-difference cross-check and marginal cost on 1M contracts."""
+
+import time
+
+import numpy as np
+
+from utils import option_pricing as op
+
+# analytic Greek -> (first-order function, bumped input, scale to repo units)
+# vanna/volga are per 1% vol, charm/color per calendar day (hence -1/365 on T)
+FD_CHECKS = {
+    "vanna": (op.call_delta, "sigma", 1 / 100),
+    "volga": (op.vega, "sigma", 1 / 100),
+    "call_charm": (op.call_delta, "T", -1 / 365),
+    "put_charm": (op.put_delta, "T", -1 / 365),
+    "speed": (op.gamma, "S", 1.0),
+    "color": (op.gamma, "T", -1 / 365),
+}
+
+# max relative error allowed against the central difference; the
+# truncation error of a 1e-4 relative bump is ~1e-4 on the worst contracts
+FD_TOL = {name: 1e-3 for name in FD_CHECKS}
+
+
+def _inputs(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return {
+        "S": rng.uniform(50, 150, n),
+        "K": rng.uniform(50, 150, n),
+        "r": 0.03,
+        "T": rng.uniform(0.05, 2.0, n),
+        "sigma": rng.uniform(0.1, 0.7, n),
+        "q": 0.01,
+    }
+
+
+def _best_of(fn, repeat):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def fd_errors(n=10_000, h=1e-4):
+    """Max relative error of each analytic Greek against a central difference."""
+    args = _inputs(n, seed=1)
+    pg = op.price_and_greeks(**args, keys=tuple(FD_CHECKS))
+    errors = {}
+    for name, (fn, bumped, scale) in FD_CHECKS.items():
+        step = h * np.maximum(np.abs(args[bumped]), 1.0)
+        up = dict(args, **{bumped: args[bumped] + step})
+        down = dict(args, **{bumped: args[bumped] - step})
+        fd = scale * (fn(**up) - fn(**down)) / (2 * step)
+        errors[name] = np.max(np.abs(pg[name] - fd) / np.maximum(np.abs(fd), 1e-8))
+    return errors
+
+
+def main(n=1_000_000, repeat=3):
+    args = _inputs(n)
+    first = _best_of(lambda: op.price_and_greeks(**args), repeat)
+    both = _best_of(
+        lambda: op.price_and_greeks(**args, keys=op.FIRST_ORDER_KEYS + op.HIGHER_ORDER_KEYS), repeat
+    )
+    higher = _best_of(lambda: op.price_and_greeks(**args, keys=op.HIGHER_ORDER_KEYS), repeat)
+
+    print(f"contracts: {n:,}")
+    print(f"first order only:       {first * 1e3:8.1f} ms")
+    print(f"first + higher order:   {both * 1e3:8.1f} ms  (+{(both / first - 1) * 100:.0f}%)")
+    print(f"higher order only:      {higher * 1e3:8.1f} ms")
+    print("finite-difference check (max rel err):")
+    for name, err in fd_errors().items():
+        print(f"  {name:<11} {err:.2e}")
+        assert err < FD_TOL[name], (name, err)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Round-trip 100k mixed call/put quotes through ``implied_vol``."""
+
+import time
+
+import numpy as np
+
+from utils import option_pricing as op
+from utils.implied_vol import implied_vol
+
+
+def main(n=100_000, r=0.03, q=0.01, seed=0):
+    rng = np.random.default_rng(seed)
+    S = rng.uniform(50, 150, n)
+    K = S * np.exp(rng.uniform(-0.6, 0.6, n))
+    T = rng.uniform(0.02, 2.0, n)
+    sigma = rng.uniform(0.05, 1.5, n)
+    kind = np.where(rng.random(n) < 0.5, "call", "put")
+    pg = op.price_and_greeks(S, K, r, T, sigma, q)
+    prices = np.where(kind == "call", pg["call_price"], pg["put_price"])
+
+    start = time.perf_counter()
+    iv, violation, unconverged = implied_vol(prices, S, K, r, T, q, kind)
+    elapsed = time.perf_counter() - start
+
+    # ignore quotes whose time value is lost to round-off
+    time_value = np.minimum(pg["call_price"], pg["put_price"])
+    ok = ~violation & (time_value > 1e-6)
+    assert not unconverged[ok].any()
+    assert np.isnan(iv[unconverged]).all()
+    # a single iteration cannot solve everything; those quotes are flagged
+    iv_1, _, unconverged_1 = implied_vol(prices, S, K, r, T, q, kind, max_iter=1)
+    assert unconverged_1.any() and np.isnan(iv_1[unconverged_1]).all()
+    print(f"quotes:          {n:,}")
+    print(f"solve time:      {elapsed * 1e3:.1f} ms")
+    print(f"bound violations: {violation.sum()}")
+    print(f"unconverged:      {unconverged.sum()}")
+    print(f"max |iv - sigma|: {np.max(np.abs(iv[ok] - sigma[ok])):.2e}")
+
+
+if __name__ == "__main__":
+    main()
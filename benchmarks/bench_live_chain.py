@@ -0,0 +1,86 @@
+"""``LiveChain`` spot/vol/time ticks versus rebuilding a 100k-row chain each tick."""
+
+import time
+
+import numpy as np
+
+from utils import option_pricing as op
+from utils.live_chain import LiveChain
+from utils.options_chain import chain_frame
+
+# (dS, d(sigma), dt) moves that large-move bounds have underestimated
+STRESS_MOVES = [(3, 0, 0), (0, 0.05, 0), (5, 0.05, 0), (-5, -0.05, 0), (2, 0.02, 1 / 365), (0, 0, 1 / 365)]
+
+
+def _max_errors(live):
+    """Largest price and delta error of ``live`` against a full reprice."""
+    keys = ("call_price", "put_price", "call_delta", "put_delta")
+    ref = op.price_and_greeks.__wrapped__(live.S, live.K, live.r, live.T, live.sigma, live.q, keys=keys)
+    price = max(np.abs(live.values[k] - ref[k]).max() for k in ("call_price", "put_price"))
+    delta = max(np.abs(live.values[k] - ref[k]).max() for k in ("call_delta", "put_delta"))
+    return price, delta
+
+
+def _check_accuracy(n_random=200, seed=1):
+    """Prices and deltas stay within ``tol`` for stress and random moves."""
+    strikes = np.linspace(50, 150, 201)
+    expiries = np.array([1 / 52, 1 / 12, 0.25, 1.0])
+    rng = np.random.default_rng(seed)
+    moves = [(tol, 0.2, *move) for tol in (1e-4, 1e-3, 1e-2) for move in STRESS_MOVES]
+    for _ in range(n_random):
+        sigma, scale = rng.uniform(0.1, 0.6), 10 ** rng.uniform(-3.5, -0.5)
+        dS = 100 * np.expm1(scale * rng.standard_normal())
+        dsig = max(0.05 - sigma, sigma * scale * rng.standard_normal())
+        moves.append((10 ** rng.uniform(-5, -2), sigma, dS, dsig, rng.uniform(0, 1 / 365)))
+    worst = 0.0
+    for tol, sigma, dS, dsig, dt in moves:
+        live = LiveChain(100.0, 0.03, expiries, strikes, sigma, q=0.01, tol=tol)
+        # two steps, so the second starts from a mix of old and new anchors
+        for _ in range(2):
+            live.update(S=live.S + dS / 2, sigma=live.sigma[0] + dsig / 2, dt=dt / 2)
+            price, delta = _max_errors(live)
+            assert price <= tol and delta <= tol, (tol, sigma, dS, dsig, dt, price, delta)
+            worst = max(worst, price / tol, delta / tol)
+    return worst
+
+
+def main(n_strikes=2_000, n_expiries=50, ticks=50, seed=0):
+    r = 0.03
+    strikes = np.linspace(50, 150, n_strikes)
+    expiries = np.linspace(1 / 52, 2.0, n_expiries)
+    rng = np.random.default_rng(seed)
+
+    S, sigma, dt = 100.0, 0.25, 1 / (365 * 24 * 3600)  # one tick per second
+    live = LiveChain(S, r, expiries, strikes, sigma)
+    t_live = t_full = 0.0
+    max_err = max_ratio = 0.0
+    for _ in range(ticks):
+        S *= np.exp(0.0002 * rng.standard_normal())
+        sigma += 0.0001 * rng.standard_normal()
+
+        start = time.perf_counter()
+        live.update(S=S, sigma=sigma, dt=dt)
+        t_live += time.perf_counter() - start
+
+        start = time.perf_counter()
+        ref = chain_frame(S, r, expiries - live.elapsed, strikes, sigma)
+        t_full += time.perf_counter() - start
+
+        err = np.abs(live.values["call_price"] - ref["Call Price"].to_numpy())
+        max_err = max(max_err, err.max())
+        max_ratio = max(max_ratio, np.max(err / np.maximum(live.error_bound, live.tol)))
+
+    totals = live.totals
+    print(f"rows x ticks:       {n_strikes * n_expiries:,} x {ticks}")
+    print(f"rebuild per tick:   {t_full / ticks * 1e3:8.1f} ms")
+    print(f"LiveChain per tick: {t_live / ticks * 1e3:8.1f} ms")
+    print(f"taylor / full:      {totals['taylor'] / totals['rows']:.3f} / {totals['full'] / totals['rows']:.3f}")
+    print(f"changed rows:       {totals['changed'] / totals['rows']:.3f}")
+    print(f"max price error:    {max_err:.2e}  (tol {live.tol:.0e})")
+    print(f"max error / max(bound, tol): {max_ratio:.2f}")
+    assert max_err <= live.tol, max_err
+    print(f"stress moves, max error / tol: {_check_accuracy():.2f}")
+
+
+if __name__ == "__main__":
+    main()
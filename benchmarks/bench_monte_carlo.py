@@ -0,0 +1,64 @@
+"""Monte Carlo estimators against the closed-form Black-Scholes oracle."""
+
+import os
+import time
+
+import numpy as np
+
+from utils import normal
+from utils import option_pricing as op
+from utils.monte_carlo import PAYOFFS, mc_price, mc_stream
+
+
+def _closed_form(S, K, r, T, sigma, q):
+    D2 = op.d2(S, K, r, T, sigma, q)
+    disc = np.exp(-r * T)
+    return {
+        "call": op.call_price(S, K, r, T, sigma, q),
+        "put": op.put_price(S, K, r, T, sigma, q),
+        "digital_call": disc * normal.cdf(D2),
+        "digital_put": disc * normal.cdf(-D2),
+    }
+
+
+ESTIMATORS = (
+    ("plain", False, False),
+    ("antithetic", True, False),
+    ("control", False, True),
+    ("anti+cv", True, True),
+)
+MAX_Z = 4.0
+
+
+def main(n_paths=4_000_000, seed=2024):
+    params = (100.0, 105.0, 0.05, 0.75, 0.25, 0.02)
+    oracle = _closed_form(*params)
+    print(f"{'payoff':<13}{'estimator':<12}{'price':>10}{'oracle':>10}{'stderr':>11}{'z':>7}{'ms':>8}")
+    for kind in PAYOFFS:
+        for label, anti, cv in ESTIMATORS:
+            start = time.perf_counter()
+            res = mc_price(*params, kind=kind, n_paths=n_paths, antithetic=anti, control_variate=cv, seed=seed)
+            elapsed = time.perf_counter() - start
+            err = res["price"] - float(oracle[kind])
+            # a vanilla under its own control variate is exact up to round-off
+            if res["stderr"] > 1e-8 * abs(float(oracle[kind])):
+                z = err / res["stderr"]
+                assert abs(z) < MAX_Z, (kind, label, z)
+            else:
+                z = 0.0
+                assert abs(err) < 1e-8, (kind, label, err)
+            print(
+                f"{kind:<13}{label:<12}{res['price']:>10.5f}{float(oracle[kind]):>10.5f}"
+                f"{res['stderr']:>11.2e}{z:>7.2f}{elapsed * 1e3:>8.0f}"
+            )
+
+    print("\nstreaming digital_call across a process pool:")
+    workers = max(2, os.cpu_count() or 1)
+    for est in mc_stream(*params, kind="digital_call", n_paths=n_paths, chunk_size=n_paths // 4,
+                         antithetic=True, seed=seed, workers=workers):
+        print(f"  {est['paths']:>10,} paths  {est['price']:.5f} +/- {est['stderr']:.1e}")
+    assert abs(est["price"] - float(oracle["digital_call"])) < MAX_Z * est["stderr"]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Normal CDF/PDF backends against the previous ``scipy.stats.norm`` path."""
+
+import threading
+import timeit
+
+import numpy as np
+from scipy.stats import norm
+
+from utils import normal
+from utils import option_pricing as op
+
+
+def _per_call(stmt, number):
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number
+
+
+def _check_scoping():
+    """A use_backend scope in one thread is invisible to the others."""
+    default = normal.get_backend()
+    other = "fast" if default == "exact" else "exact"
+    inside, checked = threading.Event(), threading.Event()
+    seen = {}
+
+    def worker():
+        with normal.use_backend(other):
+            seen["worker"] = normal.get_backend()
+            inside.set()
+            checked.wait()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    inside.wait()
+    seen["main"] = normal.get_backend()
+    checked.set()
+    thread.join()
+    assert seen == {"worker": other, "main": default}, seen
+
+
+def main():
+    _check_scoping()
+    x_scalar = 0.3
+    x_array = np.random.default_rng(0).normal(size=1_000_000)
+
+    rows = [
+        ("cdf scalar", lambda: norm.cdf(x_scalar), lambda: normal.cdf(x_scalar, "exact"),
+         lambda: normal.cdf(x_scalar, "fast"), 20_000),
+        ("pdf scalar", lambda: norm.pdf(x_scalar), lambda: normal.pdf(x_scalar, "exact"),
+         lambda: normal.pdf(x_scalar, "fast"), 20_000),
+        ("cdf 1e6", lambda: norm.cdf(x_array), lambda: normal.cdf(x_array, "exact"),
+         lambda: normal.cdf(x_array, "fast"), 5),
+        ("pdf 1e6", lambda: norm.pdf(x_array), lambda: normal.pdf(x_array, "exact"),
+         lambda: normal.pdf(x_array, "fast"), 5),
+    ]
+    print(f"{'':<12}{'scipy.stats':>14}{'exact':>14}{'fast':>14}")
+    for name, ref, exact, fast, number in rows:
+        times = [_per_call(fn, number) * 1e6 for fn in (ref, exact, fast)]
+        print(f"{name:<12}" + "".join(f"{t:>12.2f}us" for t in times))
+
+    for backend in normal.BACKENDS:
+        with normal.use_backend(backend):
+            t = _per_call(lambda: op.call_price(100.0, 95.0, 0.03, 0.5, 0.25), 20_000)
+        print(f"call_price scalar ({backend}): {t * 1e6:.2f}us")
+
+    err = np.max(np.abs(normal.cdf(x_array, "fast") - norm.cdf(x_array)))
+    assert err < 7.5e-8, err
+    print(f"fast cdf max abs error on sample: {err:.2e} (documented bound 7.5e-08)")
+
+
+if __name__ == "__main__":
+    main()
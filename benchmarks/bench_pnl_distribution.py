@@ -0,0 +1,60 @@
+"""Closed-form P&L distribution statistics versus Monte Carlo on the same trades."""
+
+import time
+
+import numpy as np
+
+from utils.pnl_distribution import PnLDistribution
+from utils.strategy import make_legs, pnl
+
+
+def _best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _monte_carlo(legs, ST, level):
+    p = pnl(legs, ST)
+    x = np.quantile(p, 1 - level)
+    return {
+        "expected_pnl": p.mean(),
+        "prob_profit": (p > 0).mean(),
+        "var": -x,
+        "es": -p[p <= x].mean(),
+    }
+
+
+def main(n_paths=4_000_000, level=0.95, repeat=200, seed=0):
+    S, r, T, sigma = 100.0, 0.03, 0.5, 0.25
+    trades = {
+        "long call": make_legs("call", 100, T, 1, 6.0),
+        "short straddle": make_legs(["call", "put"], 100, T, -1, [7.0, 6.0]),
+        "butterfly": make_legs("call", [90, 100, 110], T, [1, -2, 1], [13.0, 7.0, 3.0]),
+        "protective put": make_legs(["stock", "put", "pvk"], [0, 95, 50], T, 1, [100.0, 4.0, -49.0]),
+        "short call": make_legs("call", 105, T, -1, 5.0),
+    }
+    z = np.random.default_rng(seed).standard_normal(n_paths)
+    ST = S * np.exp((r - 0.5 * sigma**2) * T + sigma * np.sqrt(T) * z)
+
+    print(f"{'trade':16s} {'stat':13s} {'closed form':>12s} {'monte carlo':>12s}")
+    for name, legs in trades.items():
+        exact = PnLDistribution(legs, S, r, T, sigma).summary(level)
+        mc = _monte_carlo(legs, ST, level)
+        for key in ("expected_pnl", "prob_profit", "var", "es"):
+            print(f"{name:16s} {key:13s} {exact[key]:12.4f} {mc[key]:12.4f}")
+            # Monte Carlo noise at this path count is well under 0.1 on every statistic
+            assert abs(exact[key] - mc[key]) < 0.1, (name, key, exact[key], mc[key])
+
+    for name, legs in trades.items():
+        t = _best_of(lambda: PnLDistribution(legs, S, r, T, sigma).summary(level), repeat)
+        print(f"{name:16s} closed form: {t * 1e6:7.0f} us")
+    t_mc = _best_of(lambda: _monte_carlo(trades["short straddle"], ST, level), 3)
+    print(f"monte carlo ({n_paths:,} paths): {t_mc * 1e3:.0f} ms per trade")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Cost of one Streamlit-style rerun with the pricing cache warm versus bypassed."""
+
+import timeit
+
+import numpy as np
+
+from utils import normal
+from utils import option_pricing as op
+from utils import pricing_cache
+
+
+def _rerun(sc):
+    """The pricing calls a trading page makes for one unchanged scenario."""
+    args = (sc["S"], sc["K"], sc["r"], sc["T"], sc["sigma"])
+    op.price_and_greeks(*args)
+    op.call_price(*args)
+    op.put_price(*args)
+    op.call_delta(*args)
+    op.put_delta(*args)
+
+
+def _per_call(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number
+
+
+def _check_backend_keys(sc):
+    """A result cached under one normal backend is not served under another."""
+    args = (sc["S"], sc["K"], sc["r"], sc["T"], sc["sigma"])
+    strikes = np.linspace(60, 140, 81)
+    pricing_cache.clear_cache()
+    for backend in normal.BACKENDS:
+        with pricing_cache.bypass(), normal.use_backend(backend):
+            expected = (op.call_price(*args), op.price_and_greeks(args[0], strikes, *args[2:]))
+        # warm the cache under every other backend first
+        for other in normal.BACKENDS:
+            if other != backend:
+                with normal.use_backend(other):
+                    op.call_price(*args)
+                    op.price_and_greeks(args[0], strikes, *args[2:])
+        with normal.use_backend(backend):
+            price, pg = op.call_price(*args), op.price_and_greeks(args[0], strikes, *args[2:])
+        assert price == expected[0], (backend, price, expected[0])
+        assert all(np.array_equal(pg[k], expected[1][k]) for k in pg), backend
+    pricing_cache.clear_cache()
+
+
+def main(number=5_000):
+    sc = {"S": 101.3, "K": 100.0, "r": 0.03, "T": 0.25, "sigma": 0.22}
+    strikes = np.linspace(80, 120, 41)
+    _check_backend_keys(sc)
+
+    rows = [
+        ("scalar rerun", lambda: _rerun(sc), number),
+        ("41-strike row", lambda: op.price_and_greeks(sc["S"], strikes, sc["r"], sc["T"], sc["sigma"]), number // 5),
+    ]
+    pricing_cache.clear_cache()
+    print(f"{'':<16}{'bypassed':>12}{'cached':>12}")
+    for name, fn, n in rows:
+        with pricing_cache.bypass():
+            cold = _per_call(fn, n)
+        fn()
+        warm = _per_call(fn, n)
+        print(f"{name:<16}{cold * 1e6:>10.1f}us{warm * 1e6:>10.1f}us")
+    print(pricing_cache.cache_info())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""``find_arbitrage`` box/butterfly/calendar search versus nested Python loops."""
+
+import itertools
+import time
+import tracemalloc
+
+import numpy as np
+
+from utils.options_chain import chain_frame
+from utils.static_arbitrage import BLOCK_SIZE, find_arbitrage
+
+
+def _best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _quotes(n_strikes, n_expiries, r, seed, low=60, high=140):
+    strikes = np.linspace(low, high, n_strikes)
+    expiries = np.linspace(1 / 12, 2.0, n_expiries)
+    chain = chain_frame(100.0, r, expiries, strikes, 0.25)
+    shape = (n_expiries, n_strikes)
+    call = chain["Call Price"].to_numpy().reshape(shape).copy()
+    put = chain["Put Price"].to_numpy().reshape(shape).copy()
+    K = chain["Strike"].to_numpy()[:n_strikes]
+    half = 0.02 + 0.01 * np.random.default_rng(seed).random(shape)
+    return K, expiries, call, put, half
+
+
+def _loop_boxes(cb, ca, pb, pa, K, T, r, fee):
+    """Brute-force best long/short box edge, one pair at a time."""
+    best = -np.inf
+    for t in range(len(T)):
+        for i, j in itertools.combinations(range(len(K)), 2):
+            pv = (K[j] - K[i]) * np.exp(-r * T[t])
+            long = pv - (ca[t, i] - cb[t, j] + pa[t, j] - pb[t, i]) - fee
+            short = (cb[t, i] - ca[t, j] + pb[t, j] - pa[t, i]) - pv - fee
+            best = max(best, long, short)
+    return best
+
+
+def _check_memory(n_strikes=1_000, n_expiries=40, seed=0):
+    """Peak allocation stays near the block size on a chain with ~20M box edges."""
+    # half-point strikes, so none collapse onto each other when rounded
+    K, T, call, put, half = _quotes(n_strikes, n_expiries, 0.03, seed, 50, 50 + 0.5 * (n_strikes - 1))
+    quotes = dict(call_bid=call - half, call_ask=call + half, put_bid=put - half, put_ask=put + half)
+    tracemalloc.start()
+    start = time.perf_counter()
+    find_arbitrage(**quotes, K=K, T=T, rates=0.03)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    full = n_expiries * n_strikes * (n_strikes - 1) // 2 * 8
+    # a few dozen block-sized temporaries at most, against one full (nT, n_pairs) grid
+    assert peak < 32 * BLOCK_SIZE * 8, peak
+    return elapsed, peak, full
+
+
+def main(n_strikes=161, n_expiries=24, repeat=5, seed=0):
+    r = 0.03
+    K, T, call, put, half = _quotes(n_strikes, n_expiries, r, seed)
+
+    # one of each: a rich call spread (box), a rich body (fly), an inverted calendar
+    call[5, 40] -= 0.6
+    call[5, 41] += 0.6
+    put[10, 80] += 0.8
+    call[3, 100] = call[4, 100] + 0.5
+    quotes = dict(call_bid=call - half, call_ask=call + half, put_bid=put - half, put_ask=put + half)
+    costs = {"call": 0.01, "put": 0.01}
+
+    # large top_k so the weaker calendar survives the cut next to the boxes
+    table = find_arbitrage(**quotes, K=K, T=T, rates=r, costs=costs, top_k=1_000)
+    t_vec = _best_of(lambda: find_arbitrage(**quotes, K=K, T=T, rates=r, costs=costs), repeat)
+
+    boxes = table[table["Type"].str.endswith("box")]
+    start = time.perf_counter()
+    loop_best = _loop_boxes(*quotes.values(), K, T, r, 2 * costs["call"] + 2 * costs["put"])
+    t_loop = time.perf_counter() - start
+    assert np.isclose(boxes["Edge"].max(), loop_best), (boxes["Edge"].max(), loop_best)
+
+    found = set(table["Type"])
+    assert {"long box", "short box", "put butterfly", "calendar"} <= found, found
+    assert np.all(np.diff(table["Edge"].to_numpy()) <= 0)
+    # every locked leg set must leave a non-negative payoff across terminal spots
+    for legs in table["Legs"]:
+        if len({leg["T"] for leg in legs}) > 1:
+            continue
+        ST = np.linspace(0, 300, 601)
+        payoff = sum(
+            leg["qty"]
+            * (np.maximum(ST - leg["K"], 0) if leg["leg"] == "call"
+               else np.maximum(leg["K"] - ST, 0) if leg["leg"] == "put"
+               else -leg["K"])
+            for leg in legs
+        )
+        assert payoff.min() > -1e-9
+
+    n_pairs = n_expiries * n_strikes * (n_strikes - 1) // 2
+    print(f"chain:              {n_expiries} expiries x {n_strikes} strikes ({n_pairs:,} box pairs)")
+    print(f"opportunities:      {len(table)}  ({', '.join(sorted(found))})")
+    print(f"best edge:          {table['Edge'].iloc[0]:.4f}  [{table['Type'].iloc[0]}]")
+    print(f"box loop:           {t_loop * 1e3:8.1f} ms")
+    print(f"find_arbitrage:     {t_vec * 1e3:8.1f} ms  (boxes, butterflies and calendars)")
+    elapsed, peak, full = _check_memory()
+    print(f"1,000 x 40 chain:   {elapsed * 1e3:8.1f} ms, peak alloc {peak / 1e6:.1f} MB "
+          f"(one unblocked box grid {full / 1e6:.0f} MB)")
+
+
+if __name__ == "__main__":
+    main()
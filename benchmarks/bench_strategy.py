@@ -0,0 +1,77 @@
+"""Structured-array strategy payoffs versus a per-price, per-leg Python loop."""
+
+import time
+
+import numpy as np
+
+from utils.option_pricing import call_price, put_price
+from utils.strategy import LEG_KINDS, make_legs, mark, payoff
+
+
+def _best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _loop_payoff(legs, ST):
+    out = []
+    for s in ST:
+        total = 0.0
+        for kind, K, _, qty, _ in legs.tolist():
+            name = LEG_KINDS[kind]
+            unit = {"call": max(s - K, 0), "put": max(K - s, 0), "stock": s, "pvk": -K}[name]
+            total += qty * unit
+        out.append(total)
+    return np.array(out)
+
+
+def main(n_legs=50, n_points=10_000, repeat=20, seed=0):
+    rng = np.random.default_rng(seed)
+    r, sigma = 0.03, 0.25
+    kinds = rng.choice(LEG_KINDS, n_legs, p=[0.45, 0.45, 0.05, 0.05])
+    legs = make_legs(
+        kinds,
+        strike=np.round(rng.uniform(70, 130, n_legs) * 2) / 2,
+        expiry=rng.choice([0.25, 0.5, 1.0], n_legs),
+        qty=rng.integers(-5, 6, n_legs),
+        price=rng.uniform(0, 10, n_legs),
+    )
+    ST = np.linspace(0, 250, n_points)
+
+    t_vec = _best_of(lambda: payoff(legs, ST), repeat)
+    start = time.perf_counter()
+    ref = _loop_payoff(legs, ST)
+    t_loop = time.perf_counter() - start
+    assert np.allclose(payoff(legs, ST), ref)
+
+    # marking at the first expiry: expired legs at intrinsic, the rest at Black-Scholes
+    t0 = legs["expiry"].min()
+    marked = mark(legs, ST[1:], r, sigma, t=t0)
+    ref_mark = np.zeros(n_points - 1)
+    for leg in legs:
+        tau, K, qty = leg["expiry"] - t0, leg["strike"], leg["qty"]
+        name = LEG_KINDS[leg["kind"]]
+        if name == "stock":
+            ref_mark += qty * ST[1:]
+        elif name == "pvk":
+            ref_mark -= qty * K * np.exp(-r * tau)
+        elif tau <= 0:
+            ref_mark += qty * np.maximum((ST[1:] - K) * (1 if name == "call" else -1), 0)
+        else:
+            price = call_price if name == "call" else put_price
+            ref_mark += qty * price(ST[1:], K, r, tau, sigma)
+    assert np.allclose(marked, ref_mark)
+    t_mark = _best_of(lambda: mark(legs, ST[1:], r, sigma, t=t0), repeat)
+
+    print(f"legs x points:     {n_legs} x {n_points:,}")
+    print(f"python loop:       {t_loop * 1e3:8.1f} ms")
+    print(f"payoff:            {t_vec * 1e3:8.2f} ms")
+    print(f"mark (BS):         {t_mark * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""SVI surface: calibration time/accuracy and cached lookups for a 100k-row chain."""
+
+import time
+
+import numpy as np
+
+from utils.options_chain import chain_frame
+from utils.vol_surface import VolSurface, svi_total_variance
+
+
+def _best_of(fn, repeat):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _true_params(T, rng):
+    n = len(T)
+    return np.column_stack(
+        [
+            0.02 * T + 0.005,
+            0.08 + 0.04 * rng.random(n),
+            -0.7 + 0.4 * rng.random(n),
+            0.05 * rng.standard_normal(n),
+            0.05 + 0.25 * rng.random(n),
+        ]
+    )
+
+
+def main(n_quote_expiries=50, n_quote_strikes=200, seed=0, repeat=3):
+    S, r = 100.0, 0.03
+    rng = np.random.default_rng(seed)
+    T = np.linspace(1 / 12, 2.0, n_quote_expiries)
+    K = np.linspace(60, 160, n_quote_strikes)
+    params = _true_params(T, rng)
+    k = np.log(K[None, :] / (S * np.exp(r * T[:, None])))
+    ivs = np.sqrt(svi_total_variance(k, *params.T[..., None]) / T[:, None])
+    noisy = ivs + 0.001 * rng.standard_normal(ivs.shape)
+
+    calib = _best_of(lambda: VolSurface.calibrate(S, r, T, K, ivs), repeat)
+    surface = VolSurface.calibrate(S, r, T, K, ivs)
+    fit_err = np.abs(surface.sigma(K[None, :], T[:, None]) - ivs).max()
+    noisy_err = np.abs(VolSurface.calibrate(S, r, T, K, noisy).sigma(K[None, :], T[:, None]) - ivs).max()
+
+    strikes = np.linspace(50, 150, 2_000)
+    expiries = np.linspace(1 / 12, 2.0, 50)
+    lookup = _best_of(lambda: surface.total_variance(strikes[None, :], expiries[:, None]), repeat)
+    memo = _best_of(lambda: surface.sigma(strikes[None, :], expiries[:, None]), repeat)
+    k_chain = np.log(strikes[None, :] / (S * np.exp(r * expiries[:, None])))
+    hi = np.broadcast_to(np.clip(np.searchsorted(surface.expiries, expiries), 1, len(T) - 1)[:, None], k_chain.shape)
+    # without the table: evaluate both bracketing slices' SVI for every row
+    direct = _best_of(
+        lambda: [svi_total_variance(k_chain, *np.moveaxis(surface.params[i], -1, 0)) for i in (hi - 1, hi)],
+        repeat,
+    )
+    flat = _best_of(lambda: chain_frame(S, r, expiries, strikes, 0.25), repeat)
+    smile = _best_of(lambda: chain_frame(S, r, expiries, strikes, surface), repeat)
+
+    print(f"calibration ({n_quote_expiries} x {n_quote_strikes} quotes): {calib * 1e3:8.1f} ms")
+    print(f"max vol error, exact quotes:      {fit_err:.2e}")
+    print(f"max vol error, 10bp noisy quotes: {noisy_err:.2e}")
+    print(f"table lookup on 100k rows:        {lookup * 1e3:8.1f} ms")
+    print(f"sigma() repeat build (memoized):  {memo * 1e3:8.1f} ms")
+    print(f"same rows, SVI evaluated directly: {direct * 1e3:7.1f} ms")
+    print(f"chain_frame flat / surface:       {flat * 1e3:8.1f} / {smile * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
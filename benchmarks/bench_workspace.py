@@ -0,0 +1,83 @@
+"""Allocation and time per reprice: ``PricingWorkspace`` versus ``price_and_greeks``."""
+
+import time
+import tracemalloc
+
+import numpy as np
+
+from utils import normal
+from utils import option_pricing as op
+from utils.pricing_workspace import PricingWorkspace
+
+
+def _peak_bytes(fn):
+    fn()  # warm up lazy imports and caches
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def _best_time(fn, repeat=5):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _check_tails():
+    """The workspace matches the fused kernel on deep out-of-the-money strikes.
+
+    Put values there are tiny, so a parity subtraction would lose them;
+    the absolute floor only forgives rounding among subnormals.
+    """
+    K = np.concatenate([np.linspace(20, 60, 41), np.linspace(150, 400, 26)])
+    T = np.array([[1 / 52], [0.25], [1.0]])
+    shape = np.broadcast_shapes(K.shape, T.shape)
+    for backend in normal.BACKENDS:
+        with normal.use_backend(backend):
+            ref = op.price_and_greeks.__wrapped__(100.0, K, 0.03, T, 0.2, 0.01)
+            out = PricingWorkspace(shape).price_and_greeks(100.0, K, 0.03, T, 0.2, 0.01)
+        for key, val in ref.items():
+            assert np.allclose(out[key], val, rtol=1e-12, atol=1e-300), (backend, key)
+
+
+def main(shape=(40, 2_000)):
+    _check_tails()
+    rng = np.random.default_rng(0)
+    K = rng.uniform(50, 150, shape)
+    T = rng.uniform(0.05, 2.0, shape)
+    sigma = rng.uniform(0.1, 0.7, shape)
+    grid_bytes = np.prod(shape) * 8
+    print(f"grid {shape}, one float64 grid = {grid_bytes / 1e6:.2f} MB")
+
+    def allocating():
+        op.price_and_greeks(101.0, K, 0.03, T, sigma, 0.01)
+
+    report = [("price_and_greeks", allocating)]
+    for dtype in (np.float64, np.float32):
+        ws = PricingWorkspace(shape, dtype)
+        ws.load(100.0, K, T, sigma)
+        report.append((f"workspace {np.dtype(dtype).name}", lambda ws=ws: ws.price_and_greeks(101.0, None, 0.03, None, None, 0.01)))
+
+    # allowance for interpreter bookkeeping; the fast backend's sign mask
+    # is one byte per element on top of that
+    overhead = 64 * 1024
+    for backend in normal.BACKENDS:
+        budget = overhead + (np.prod(shape) if backend == "fast" else 0)
+        with normal.use_backend(backend):
+            for name, fn in report:
+                peak = _peak_bytes(fn)
+                elapsed = _best_time(fn)
+                print(f"[{backend}] {name:<20} {elapsed * 1e3:7.2f} ms   peak alloc {peak / 1e6:8.3f} MB")
+                if name.startswith("workspace"):
+                    assert peak <= budget, (backend, name, peak, budget)
+                else:
+                    assert peak > 10 * grid_bytes, (backend, name, peak)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,16 @@
 import streamlit as st
 from utils import parity
 from utils import trade_simulation as ts
+from utils.rng import session_service
 
 st.header("Mock Trade Simulation")
 
 difficulty = st.session_state.get("difficulty", "Standard")
 
 if st.button("Generate Scenario") or "sim_params" not in st.session_state:
-    st.session_state.sim_params = parity.generate_parameters(difficulty=difficulty)
+    st.session_state.sim_params = parity.generate_parameters(
+        difficulty=difficulty, rng=session_service(st.session_state).stream("parity")
+    )
 params = st.session_state.sim_params
 
 eq = (
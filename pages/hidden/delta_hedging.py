@@ -1,5 +1,11 @@
+import numpy as np
+import pandas as pd
 import streamlit as st
 from utils import delta_hedging as dh
+from utils import hedge_sweep as hs
+from utils import pnl_attribution as pa
+from utils.rng import session_service
+from utils.strategy import make_legs
 
 st.header("Delta Hedging Simulation")
 
@@ -16,7 +22,8 @@ hedge_ratio = st.slider("Hedge Ratio (shares)", -2.0, 2.0, 0.0, step=0.1)
 col1, col2 = st.columns(2)
 if col1.button("Next Step"):
     st.session_state.dh_state = dh.update_state(
-        st.session_state.dh_state, hedge_ratio, K, r, T, dt
+        st.session_state.dh_state, hedge_ratio, K, r, T, dt,
+        rng=session_service(st.session_state).normals("delta_hedging"),
     )
 if col2.button("Reset"):
     st.session_state.dh_state = dh.init_state(S0, K, r, T)
@@ -29,3 +36,61 @@ st.line_chart(
     }
 )
 
+
+st.subheader("Backtest Over Many Paths")
+col1, col2, col3 = st.columns(3)
+n_paths = col1.select_slider("Paths", [1_000, 10_000, 100_000], value=10_000)
+n_steps = col2.select_slider("Rebalances", [12, 52, 252], value=52)
+strategy = col3.selectbox("Hedge", ["Delta", "Hedge ratio above", "None"])
+if st.button("Run Backtest"):
+    rule = {"Delta": "delta", "Hedge ratio above": hedge_ratio, "None": "none"}[strategy]
+    result = dh.hedge_backtest(S0, K, r, T, dh.ndefault_sigma, n_paths, n_steps, rule)
+    summary = dh.hedge_summary(result)
+    m1, m2, m3 = st.columns(3)
+    m1.metric("Mean P&L", f"{summary['mean_pnl']:.3f}")
+    m2.metric("P&L std", f"{summary['std_pnl']:.3f}")
+    m3.metric("Mean turnover", f"{summary['mean_turnover']:.2f} sh")
+    counts, edges = np.histogram(result["pnl"], bins=50)
+    st.bar_chart(pd.DataFrame({"Paths": counts}, index=np.round(0.5 * (edges[:-1] + edges[1:]), 2)))
+    st.caption("Hedged P&L at expiry of a short call, one bar per P&L bucket")
+
+    # explain a sample of the paths step by step (path matrices for every
+    # path of the largest runs would not fit in memory)
+    n_explain = min(n_paths, 2_000)
+    paths = dh.simulate_paths(S0, r, dh.ndefault_sigma, T, n_explain, n_steps)
+    hedged = dh.hedge_paths(paths, K, r, T, dh.ndefault_sigma, rule, keep_positions=True)
+    times = np.linspace(0.0, T, n_steps + 1)
+    parts = pa.attribute(
+        make_legs("call", K, T, -1), paths, times, r, dh.ndefault_sigma, hedge=hedged["positions"]
+    )
+    buckets = pa.bucket_summary(parts, 4, times)
+    st.bar_chart(buckets[["delta", "gamma", "theta", "residual", "hedge"]])
+    st.dataframe(pa.path_totals(parts).describe().loc[["mean", "std"]])
+    st.caption(
+        f"Greek attribution of the short call and its hedge over {n_explain:,} paths, "
+        "mean per quarter of the run (before financing)"
+    )
+
+st.subheader("Compare Hedging Policies")
+cost_bp = st.slider("Transaction cost (bp of notional)", 0, 50, 10)
+if st.button("Run Policy Sweep"):
+    frontier = hs.sweep_policies(
+        [
+            ("interval", 1),
+            ("interval", 4),
+            ("delta_band", 0.05),
+            ("delta_band", 0.15),
+            ("whalley_wilmott", 0.1),
+            ("whalley_wilmott", 1.0),
+            ("gamma_band", 1.0),
+            ("gamma_band", 3.0),
+        ],
+        [cost_bp / 1e4],
+        S0, K, r, T, dh.ndefault_sigma, n_paths=5_000, n_steps=52,
+    )
+    st.dataframe(
+        frontier[["policy", "param", "std_pnl", "mean_costs", "mean_turnover", "frontier"]].rename(
+            columns={"std_pnl": "Hedging error", "mean_costs": "Cost", "mean_turnover": "Turnover"}
+        )
+    )
+    st.caption("Frontier rows have no other policy that is both cheaper and tighter")
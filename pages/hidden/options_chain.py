@@ -1,6 +1,8 @@
 import streamlit as st
 import numpy as np
-from utils.options_chain import generate_chain
+from utils.live_chain import LiveChain
+from utils.options_chain import chain_frame, format_chain
+from utils.rng import session_service
 
 st.header("Options Chain Builder")
 
@@ -16,26 +18,62 @@ if difficulty == "Easy":
     spot = int(spot)
     width = int(width)
 
-strikes = np.arange(spot - 2 * width, spot + 2 * width + width, width)
+# the strike ladder stays put until spot moves a full width from its centre,
+# so small spot edits keep the same grid
+center = st.session_state.get("chain_center")
+if center is None or abs(spot - center) >= width:
+    center = spot
+    st.session_state["chain_center"] = center
+strikes = np.arange(center - 2 * width, center + 2 * width + width, width)
 if difficulty == "Easy":
     strikes = strikes.astype(int)
 expiries_months = st.multiselect("Expiry Months", options=[1, 2, 3], default=[1, 2, 3])
 expiries = [m / 12 for m in expiries_months]
 
+heston = None
+if st.checkbox("Stochastic volatility smile (Heston)"):
+    col1, col2 = st.columns(2)
+    with col1:
+        v0 = st.number_input("Initial Variance (v0)", value=vol**2, format="%.4f")
+        kappa = st.number_input("Mean Reversion (kappa)", value=2.0)
+        theta = st.number_input("Long-run Variance (theta)", value=vol**2, format="%.4f")
+    with col2:
+        xi = st.number_input("Vol of Vol (xi)", value=0.5)
+        rho = st.slider("Spot/Vol Correlation (rho)", -0.99, 0.99, -0.7)
+    heston = {"v0": v0, "kappa": kappa, "theta": theta, "xi": xi, "rho": rho}
+
 if expiries:
-    df_chain = generate_chain(spot, r, expiries, strikes, vol)
-    st.dataframe(df_chain)
+    if heston is None:
+        # spot/vol edits within the ladder reprice the existing chain incrementally
+        grid = (r, tuple(expiries), tuple(strikes))
+        live = st.session_state.get("live_chain")
+        if live is None or st.session_state.get("live_chain_grid") != grid:
+            live = LiveChain(spot, r, expiries, strikes, vol)
+            st.session_state["live_chain"] = live
+            st.session_state["live_chain_grid"] = grid
+        else:
+            live.update(S=spot, sigma=vol)
+            stats = live.last_update
+            st.caption(
+                f"Incremental update: {stats['taylor_fraction']:.0%} Taylor, "
+                f"{stats['full_fraction']:.0%} repriced, {stats['changed']} rows changed"
+            )
+        chain = live.frame
+    else:
+        chain = chain_frame(spot, r, expiries, strikes, vol, heston=heston)
+    st.dataframe(format_chain(chain))
     if st.button("Random Prompt"):
-        row = df_chain.sample(1).iloc[0]
-        mkt_price = row["Call Price"] * (1 + np.random.uniform(-0.2, 0.2))
+        rng = session_service(st.session_state).stream("options_chain")
+        row = chain.sample(1, random_state=rng).iloc[0]
+        mkt_price = row["Call Price"] * (1 + rng.uniform(-0.2, 0.2))
         st.write(
-            f"Strike {row['Strike']}, Exp {row['Expiry']:.2f}yr, Market Price {mkt_price:.2f}"
+            f"Strike {row['Strike']}, Exp {row['T']:.2f}yr, Market Price {mkt_price:.2f}"
         )
         choice = st.radio("Call value vs Theoretical?", ("Overpriced", "Underpriced"))
         if st.button("Check Value"):
             answer = "Overpriced" if mkt_price > row["Call Price"] else "Underpriced"
             st.write("Correct" if choice == answer else f"Incorrect, was {answer}")
         st.write(
-            f"Delta-neutral hedge: {-row['Call Delta']:.2f} shares; RevCon: {row['RevCon']:.2f}"
+            f"Delta-neutral hedge: {-row['Call Delta'] * 100:.2f} shares; RevCon: {row['RevCon']:.2f}"
         )
 
@@ -1,13 +1,16 @@
 import streamlit as st
 import numpy as np
 from utils import parity
+from utils.rng import session_service
 
 st.header("Put-Call Parity Practice")
 
 difficulty = st.session_state.get("difficulty", "Standard")
 
 if st.button("Generate New Parameters") or "pcp_params" not in st.session_state:
-    st.session_state.pcp_params = parity.generate_parameters(difficulty=difficulty)
+    st.session_state.pcp_params = parity.generate_parameters(
+        difficulty=difficulty, rng=session_service(st.session_state).stream("parity")
+    )
 params = st.session_state.pcp_params
 
 param_eq = (
@@ -2,8 +2,9 @@ import numpy as np
 import pandas as pd
 import streamlit as st
 
-from utils import greeks, option_pricing as op, scenario_generator
+from utils import option_pricing as op, scenario_generator
 from utils.market_maker import MarketMaker
+from utils.rng import session_service
 from utils.ui_config import difficulty_selector
 
 st.set_page_config(page_title="Market Maker")
@@ -16,16 +17,19 @@ if (
     st.button("Generate New Scenario", key="maker_new")
     or "scenario" not in st.session_state
 ):
-    st.session_state.scenario = scenario_generator.generate_scenario()
+    st.session_state.scenario = scenario_generator.generate_scenario(
+        rng=session_service(st.session_state).stream("scenario")
+    )
     for key in ["maker_step1", "maker_step2", "maker_step3", "maker_step4"]:
         st.session_state.pop(key, None)
 
 sc = st.session_state.scenario
 
-call_delta = greeks.call_delta(sc["S"], sc["K"], sc["r"], sc["T"], sc["sigma"])
-put_delta = greeks.put_delta(sc["S"], sc["K"], sc["r"], sc["T"], sc["sigma"])
-call_theo = op.call_price(sc["S"], sc["K"], sc["r"], sc["T"], sc["sigma"])
-put_theo = op.put_price(sc["S"], sc["K"], sc["r"], sc["T"], sc["sigma"])
+pg = op.price_and_greeks(sc["S"], sc["K"], sc["r"], sc["T"], sc["sigma"])
+call_delta = pg["call_delta"]
+put_delta = pg["put_delta"]
+call_theo = pg["call_price"]
+put_theo = pg["put_price"]
 
 call_edge = call_theo - sc["C_mkt"]
 put_edge = put_theo - sc["P_mkt"]
@@ -2,8 +2,10 @@ import numpy as np
 import pandas as pd
 import streamlit as st
 
-from utils import greeks, option_pricing as op, scenario_generator
+from utils import option_pricing as op, scenario_generator
 from utils.market_taker import MarketTaker
+from utils.pnl_distribution import trade_pnl_stats
+from utils.rng import session_service
 from utils.ui_config import difficulty_selector
 
 st.set_page_config(page_title="Market Taker")
@@ -13,16 +15,19 @@ st.title("Market Taker Practice")
 difficulty_selector()
 
 if st.button("Generate New Scenario", key="taker_new") or "scenario" not in st.session_state:
-    st.session_state.scenario = scenario_generator.generate_scenario()
+    st.session_state.scenario = scenario_generator.generate_scenario(
+        rng=session_service(st.session_state).stream("scenario")
+    )
     for key in ["taker_step1", "taker_step2", "taker_step3", "taker_step4"]:
         st.session_state.pop(key, None)
 
 sc = st.session_state.scenario
 
-call_delta = greeks.call_delta(sc["S"], sc["K"], sc["r"], sc["T"], sc["sigma"])
-put_delta = greeks.put_delta(sc["S"], sc["K"], sc["r"], sc["T"], sc["sigma"])
-call_theo = op.call_price(sc["S"], sc["K"], sc["r"], sc["T"], sc["sigma"])
-put_theo = op.put_price(sc["S"], sc["K"], sc["r"], sc["T"], sc["sigma"])
+pg = op.price_and_greeks(sc["S"], sc["K"], sc["r"], sc["T"], sc["sigma"])
+call_delta = pg["call_delta"]
+put_delta = pg["put_delta"]
+call_theo = pg["call_price"]
+put_theo = pg["put_price"]
 
 call_edge = call_theo - sc["C_mkt"]
 put_edge = put_theo - sc["P_mkt"]
@@ -139,6 +144,16 @@ if st.session_state.get("taker_step1"):
                 f"Expected {correct_call_act}/{correct_put_act} profit ${expected_edge:.2f}"
             )
 
+        # distribution of the submitted trade held to expiry, in closed form
+        side = {"Buy": 1, "Sell": -1, "No": 0}
+        trade = {"call": side[call_action.split()[0]], "put": side[put_action.split()[0]], "stock": 0, "pvk": 0}
+        stats = trade_pnl_stats(sc, trade)
+        st.caption(
+            f"Your trade held to expiry: expected P&L ${stats['expected_pnl']:.2f}, "
+            f"P(profit) {stats['prob_profit']:.0%}, 95% VaR ${stats['var']:.2f}, "
+            f"ES ${stats['es']:.2f}"
+        )
+
 if st.session_state.get("taker_step2"):
     st.markdown("### Step 3: Greek Risk Analysis")
     with st.form("taker_step3"):
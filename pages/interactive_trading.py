@@ -4,9 +4,9 @@ import numpy as np
 import plotly.graph_objects as go
 from utils import trade_simulation as ts
 from utils import scenario_generator
-from utils import greeks
 from utils import option_pricing as op
 from utils.live_trader import LiveTrader
+from utils.rng import session_service
 
 # Page configuration
 st.set_page_config(
@@ -20,7 +20,9 @@ st.title("Options Trading Simulator")
 
 # Scenario Generation
 if st.button("Generate New Scenario", key="generate_new_scenario") or "scenario" not in st.session_state:
-    st.session_state.scenario = scenario_generator.generate_scenario()
+    st.session_state.scenario = scenario_generator.generate_scenario(
+        rng=session_service(st.session_state).stream("scenario")
+    )
     # Reset all state when new scenario is generated
     for key in ['pos_greeks', 'checked_greeks', 'user_sel', 'step1_complete', 'step2_complete', 'step3_complete', 'trading_stage', 'initial_position', 'market_events', 'event_response']:
         st.session_state.pop(key, None)
@@ -31,9 +33,11 @@ sc = st.session_state.scenario
 st.subheader("Market Scenario")
 
 # --- Calculated Values ---
-call_delta = greeks.call_delta(sc['S'], sc['K'], sc['r'], sc['T'], sc['sigma'])
-call_theo = op.call_price(sc['S'], sc['K'], sc['r'], sc['T'], sc['sigma'])
-put_theo = op.put_price(sc['S'], sc['K'], sc['r'], sc['T'], sc['sigma'])
+# one fused pass for prices and every Greek used on this page
+pg = op.price_and_greeks(sc['S'], sc['K'], sc['r'], sc['T'], sc['sigma'])
+call_delta = pg['call_delta']
+call_theo = pg['call_price']
+put_theo = pg['put_price']
 discount_factor = np.exp(-sc['r'] * sc['T'])
 
 # --- Table 1: Market Parameters ---
@@ -71,7 +75,7 @@ st.table(option_df)
 st.subheader("Market Analysis Training")
 
 # Calculate all the key metrics
-put_delta = greeks.put_delta(sc["S"], sc["K"], sc["r"], sc["T"], sc["sigma"])
+put_delta = pg["put_delta"]
 call_edge = call_theo - sc["C_mkt"]
 put_edge = put_theo - sc["P_mkt"]
 discount_factor = np.exp(-sc["r"] * sc["T"])
@@ -303,10 +307,10 @@ if st.session_state.get("step3_complete", False):
         if call_mult:
             apply_greeks(call_mult, {
                 'delta': call_delta,
-                'gamma': greeks.gamma(sc['S'], sc['K'], sc['r'], sc['T'], sc['sigma']),
-                'theta': greeks.call_theta(sc['S'], sc['K'], sc['r'], sc['T'], sc['sigma']),
-                'vega':  greeks.vega(sc['S'], sc['K'], sc['r'], sc['T'], sc['sigma']),
-                'rho':   greeks.call_rho(sc['S'], sc['K'], sc['r'], sc['T'], sc['sigma']),
+                'gamma': pg['gamma'],
+                'theta': pg['call_theta'],
+                'vega':  pg['vega'],
+                'rho':   pg['call_rho'],
             })
 
         # Put leg
@@ -314,10 +318,10 @@ if st.session_state.get("step3_complete", False):
         if put_mult:
             apply_greeks(put_mult, {
                 'delta': put_delta,
-                'gamma': greeks.gamma(sc['S'], sc['K'], sc['r'], sc['T'], sc['sigma']),
-                'theta': greeks.put_theta(sc['S'], sc['K'], sc['r'], sc['T'], sc['sigma']),
-                'vega':  greeks.vega(sc['S'], sc['K'], sc['r'], sc['T'], sc['sigma']),
-                'rho':   greeks.put_rho(sc['S'], sc['K'], sc['r'], sc['T'], sc['sigma']),
+                'gamma': pg['gamma'],
+                'theta': pg['put_theta'],
+                'vega':  pg['vega'],
+                'rho':   pg['put_rho'],
             })
 
         return total
@@ -0,0 +1,194 @@
+"""Arrow IPC / Parquet snapshots of option chains.
+
+Snapshots hold the numeric chain (the columns of
+:func:`utils.options_chain.chain_frame`) under a fixed schema: rows are
+sorted by ``T`` then ``Strike``, ``Expiry`` is dictionary encoded, and
+every expiry is its own IPC record batch / Parquet row group. The list of
+expiries is kept in the schema metadata, so a single expiry can be read
+without touching the rest of the file.
+
+IPC files (``.arrow``, ``.feather``, ``.ipc``) are written uncompressed
+and reloaded through a memory map, which makes single-expiry reads
+zero-copy. Parquet (``.parquet``) is smaller on disk but always decodes.
+
+For chains too large to materialise, :func:`write_chain_parquet` streams
+the blocks of :func:`~utils.options_chain.chain_blocks` (many
+underlyings, one slab at a time) straight into row groups.
+
+The display frame from :func:`generate_chain` drops ``T`` and turns IV
+into strings, so snapshot the numeric chain and apply
+:func:`~utils.options_chain.format_chain` after loading.
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+from .options_chain import chain_blocks
+
+SCHEMA_VERSION = "1"
+
+CHAIN_SCHEMA = pa.schema(
+    [
+        ("Expiry", pa.dictionary(pa.int16(), pa.string())),
+        ("T", pa.float64()),
+        ("Strike", pa.float64()),
+        ("Call Price", pa.float64()),
+        ("Put Price", pa.float64()),
+        ("Call Delta", pa.float64()),
+        ("Put Delta", pa.float64()),
+        ("Gamma", pa.float64()),
+        ("Vega", pa.float64()),
+        ("Call Rho", pa.float64()),
+        ("Put Rho", pa.float64()),
+        ("RevCon", pa.float64()),
+        ("IV", pa.float64()),
+    ]
+)
+
+# chain_blocks output: the snapshot columns led by the underlying symbol
+STREAM_SCHEMA = pa.schema([("Underlying", pa.dictionary(pa.int32(), pa.string()))] + list(CHAIN_SCHEMA))
+
+FORMATS = ("ipc", "parquet")
+_SUFFIXES = {".arrow": "ipc", ".feather": "ipc", ".ipc": "ipc", ".parquet": "parquet"}
+
+
+def _format(path, fmt):
+    if fmt is None:
+        fmt = _SUFFIXES.get(Path(path).suffix.lower())
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown snapshot format {fmt!r} for {path}; expected one of {FORMATS}")
+    return fmt
+
+
+def chain_to_table(chain, **metadata):
+    """Convert a numeric chain (DataFrame or object with ``.frame``) to a sorted Arrow table.
+
+    Keyword arguments (e.g. ``S=100, r=0.03``) are stored as JSON in the
+    schema metadata next to the expiry list.
+    """
+    df = getattr(chain, "frame", chain)
+    if "T" not in df.columns or not pd.api.types.is_numeric_dtype(df["IV"]):
+        raise ValueError(
+            "Snapshots store the numeric chain; pass chain_frame(...) output and "
+            "apply format_chain after loading"
+        )
+    T, K = df["T"].to_numpy(), df["Strike"].to_numpy()
+    dT, dK = np.diff(T), np.diff(K)
+    if not np.all((dT > 0) | ((dT == 0) & (dK >= 0))):  # chain_frame output is already sorted
+        df = df.iloc[np.lexsort((K, T))]
+    arrays = [
+        pa.array(df[name].astype(str), pa.string()).dictionary_encode().cast(field.type)
+        if pa.types.is_dictionary(field.type)
+        else pa.array(df[name].to_numpy(dtype=np.float64), field.type)
+        for name, field in zip(CHAIN_SCHEMA.names, CHAIN_SCHEMA)
+    ]
+    expiries = np.unique(df["T"].to_numpy()).tolist()
+    meta = {
+        "optionsmock.schema_version": SCHEMA_VERSION,
+        "optionsmock.expiries": json.dumps(expiries),
+        "optionsmock.metadata": json.dumps(metadata),
+    }
+    return pa.Table.from_arrays(arrays, schema=CHAIN_SCHEMA.with_metadata(meta))
+
+
+def _expiry_batches(table):
+    """Split a sorted chain table into one record batch per expiry."""
+    T = table.column("T").to_numpy()
+    starts = np.flatnonzero(np.r_[True, T[1:] != T[:-1]])
+    stops = np.r_[starts[1:], len(T)]
+    return [table.slice(a, b - a).combine_chunks().to_batches()[0] for a, b in zip(starts, stops)]
+
+
+def write_chain(chain, path, fmt=None, **metadata):
+    """Write a chain snapshot; the format follows the file suffix unless ``fmt`` is given."""
+    fmt = _format(path, fmt)
+    table = chain_to_table(chain, **metadata)
+    batches = _expiry_batches(table)
+    if fmt == "ipc":
+        with pa.OSFile(str(path), "wb") as sink, ipc.new_file(sink, table.schema) as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+    else:
+        with pq.ParquetWriter(str(path), table.schema) as writer:
+            for batch in batches:
+                writer.write_batch(batch, row_group_size=batch.num_rows)
+
+
+def _expiry_index(schema, expiry):
+    expiries = json.loads(schema.metadata[b"optionsmock.expiries"])
+    matches = np.flatnonzero(np.isclose(expiries, expiry, rtol=0, atol=1e-9))
+    if not matches.size:
+        raise KeyError(f"Expiry {expiry!r} not in snapshot; available: {expiries}")
+    return int(matches[0])
+
+
+def read_chain_table(path, expiry=None, fmt=None):
+    """Read a snapshot as an Arrow table, optionally just one expiry (``T`` in years).
+
+    IPC snapshots are memory-mapped, so the returned columns point straight
+    into the file's pages.
+    """
+    fmt = _format(path, fmt)
+    if fmt == "ipc":
+        reader = ipc.open_file(pa.memory_map(str(path), "r"))
+        if expiry is None:
+            return reader.read_all()
+        batch = reader.get_batch(_expiry_index(reader.schema, expiry))
+        return pa.Table.from_batches([batch], schema=reader.schema)
+    parquet = pq.ParquetFile(str(path), memory_map=True)
+    schema = parquet.schema_arrow
+    if expiry is None:
+        return parquet.read()
+    return parquet.read_row_group(_expiry_index(schema, expiry))
+
+
+def read_chain(path, expiry=None, fmt=None):
+    """Read a snapshot back into a chain DataFrame (``Expiry`` as categorical)."""
+    return read_chain_table(path, expiry, fmt).to_pandas()
+
+
+def snapshot_info(path, fmt=None):
+    """Return the expiries and user metadata stored with a snapshot."""
+    fmt = _format(path, fmt)
+    if fmt == "ipc":
+        schema = ipc.open_file(pa.memory_map(str(path), "r")).schema
+    else:
+        schema = pq.read_schema(str(path))
+    return {
+        "expiries": json.loads(schema.metadata[b"optionsmock.expiries"]),
+        "metadata": json.loads(schema.metadata[b"optionsmock.metadata"]),
+        "schema_version": schema.metadata[b"optionsmock.schema_version"].decode(),
+    }
+
+
+def chain_batches(underlyings, r, expiries, strikes, sigma, chunk_rows=65_536):
+    """Arrow record batches of :func:`~utils.options_chain.chain_blocks`, one per block."""
+    for block in chain_blocks(underlyings, r, expiries, strikes, sigma, chunk_rows):
+        arrays = [
+            pa.array(block[name], pa.string()).dictionary_encode().cast(field.type)
+            if pa.types.is_dictionary(field.type)
+            else pa.array(block[name], field.type)
+            for name, field in zip(STREAM_SCHEMA.names, STREAM_SCHEMA)
+        ]
+        yield pa.RecordBatch.from_arrays(arrays, schema=STREAM_SCHEMA)
+
+
+def write_chain_parquet(path, underlyings, r, expiries, strikes, sigma, chunk_rows=65_536):
+    """Stream a multi-underlying chain straight into a Parquet file.
+
+    Each block becomes one row group as soon as it is priced, so the
+    whole chain is never in memory. Returns the number of rows written.
+    """
+    rows = 0
+    # dictionary pages only pay off for the label columns; prices are all distinct
+    with pq.ParquetWriter(str(path), STREAM_SCHEMA, use_dictionary=["Underlying", "Expiry"]) as writer:
+        for batch in chain_batches(underlyings, r, expiries, strikes, sigma, chunk_rows):
+            writer.write_batch(batch, row_group_size=batch.num_rows)
+            rows += batch.num_rows
+    return rows
@@ -1,12 +1,22 @@
 import numpy as np
+from . import option_pricing as op
 from .option_pricing import call_price, call_delta
 
+STRATEGIES = ("delta", "none")
+
+# every step reprices a fresh column of spots, so skip the pricing cache
+_price_and_greeks = op.price_and_greeks.__wrapped__
+
 
 ndefault_sigma = 0.2
 
-def simulate_step(S_prev, r, sigma, dt):
-    """Simulate next stock price using geometric Brownian motion"""
-    dW = np.random.normal(scale=np.sqrt(dt))
+def simulate_step(S_prev, r, sigma, dt, rng=None):
+    """Simulate next stock price using geometric Brownian motion
+
+    ``rng`` is a ``np.random.Generator`` or a :class:`utils.rng.NormalBuffer`.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    dW = np.sqrt(dt) * rng.standard_normal()
     return S_prev * np.exp((r - 0.5 * sigma ** 2) * dt + sigma * dW)
 
 
@@ -22,8 +32,8 @@ def init_state(S0, K, r, T, sigma=ndefault_sigma):
     }
 
 
-def update_state(state, hedge_ratio, K, r, T, dt, sigma=ndefault_sigma):
-    S_new = simulate_step(state["S"], r, sigma, dt)
+def update_state(state, hedge_ratio, K, r, T, dt, sigma=ndefault_sigma, rng=None):
+    S_new = simulate_step(state["S"], r, sigma, dt, rng)
     t_new = state["t"] + dt
     option_new = call_price(S_new, K, r, T - t_new, sigma)
     delta_new = call_delta(S_new, K, r, T - t_new, sigma)
@@ -44,3 +54,140 @@ def update_state(state, hedge_ratio, K, r, T, dt, sigma=ndefault_sigma):
         "delta": delta_new,
     })
     return state
+
+
+def simulate_paths(S0, r, sigma, T, n_paths, n_steps, seed=None):
+    """GBM spot matrix of shape ``(n_paths, n_steps + 1)``, starting at ``S0``.
+
+    Uses the same step as :func:`simulate_step`, for all paths at once.
+    """
+    rng = np.random.default_rng(seed)
+    dt = T / n_steps
+    log_steps = (r - 0.5 * sigma**2) * dt + sigma * np.sqrt(dt) * rng.standard_normal((n_paths, n_steps))
+    paths = np.empty((n_paths, n_steps + 1))
+    paths[:, 0] = S0
+    np.cumsum(log_steps, axis=1, out=paths[:, 1:])
+    np.exp(paths[:, 1:], out=paths[:, 1:])
+    paths[:, 1:] *= S0
+    return paths
+
+
+def _target(strategy):
+    """Hedge position rule ``(step, S, delta, position) -> shares``."""
+    if callable(strategy):
+        return strategy
+    if strategy == "delta":
+        return lambda step, S, delta, position: delta
+    if strategy == "none":
+        return lambda step, S, delta, position: np.zeros_like(S)
+    if isinstance(strategy, (int, float)):
+        return lambda step, S, delta, position: np.full_like(S, float(strategy))
+    raise ValueError(f"Unknown strategy {strategy!r}; expected one of {STRATEGIES}, a hedge ratio or a callable")
+
+
+def _hedge(spot_at, n_paths, S0, K, r, T, sigma, n_steps, strategy, cost, keep_positions=False):
+    """Run a short-call hedge forward one column of spots at a time."""
+    target = _target(strategy)
+    dt = T / n_steps
+    growth = np.exp(r * dt)
+
+    S = np.full(n_paths, float(S0))
+    pg = _price_and_greeks(S0, K, r, T, sigma, keys=("call_price", "call_delta"))
+    premium = float(pg["call_price"])
+    delta = np.full(n_paths, float(pg["call_delta"]))
+    position = np.asarray(target(0, S, delta, np.zeros(n_paths)), dtype=float)
+    turnover = np.abs(position)
+    costs = cost * turnover * S
+    bank = premium - position * S - costs
+    sq_error = np.zeros(n_paths)
+    held = [position] if keep_positions else None
+
+    for step in range(1, n_steps + 1):
+        S = spot_at(step)
+        bank *= growth
+        if step < n_steps:
+            pg = _price_and_greeks(S, K, r, T - step * dt, sigma, keys=("call_price", "call_delta"))
+            option, delta = pg["call_price"], pg["call_delta"]
+        else:
+            option = np.maximum(S - K, 0.0)
+        # marked P&L of the short call plus its hedge
+        value = bank + position * S - option
+        sq_error += value * value
+        if step < n_steps:
+            new = np.asarray(target(step, S, delta, position), dtype=float)
+            traded = np.abs(new - position)
+            fee = cost * traded * S
+            bank -= (new - position) * S + fee
+            turnover += traded
+            costs += fee
+            position = new
+            if keep_positions:
+                held.append(position)
+
+    result = {
+        "pnl": value,
+        "tracking_error": np.sqrt(sq_error / n_steps),
+        "turnover": turnover,
+        "costs": costs,
+        "premium": premium,
+    }
+    if keep_positions:
+        result["positions"] = np.column_stack(held)
+    return result
+
+
+def hedge_paths(paths, K, r, T, sigma, strategy="delta", cost=0.0, keep_positions=False):
+    """Hedge a short call along given spot paths (``(n_paths, n_steps + 1)``).
+
+    See :func:`hedge_backtest` for ``strategy``, ``cost`` and the result.
+    With ``keep_positions`` the result also holds ``positions``, the
+    shares held over each step as an ``(n_paths, n_steps)`` matrix.
+    """
+    n_paths, n_cols = paths.shape
+    return _hedge(
+        lambda step: paths[:, step], n_paths, paths[0, 0], K, r, T, sigma, n_cols - 1, strategy, cost, keep_positions
+    )
+
+
+def hedge_backtest(S0, K, r, T, sigma, n_paths, n_steps, strategy="delta", cost=0.0, seed=None):
+    """Hedge a short call over ``n_paths`` simulated GBM paths.
+
+    Sells the call for its Black-Scholes premium and rebalances a share
+    position every ``T / n_steps`` years, financed in a bank account at
+    ``r``. ``strategy`` is ``"delta"`` (Black-Scholes delta), ``"none"``,
+    a fixed hedge ratio in shares, or a callable
+    ``(step, S, delta, position) -> shares`` applied to whole columns.
+    ``cost`` is charged as a fraction of the traded notional. ``seed`` is
+    an int, a ``SeedSequence`` or a ``np.random.Generator``.
+
+    Spots are drawn one step at a time, so memory stays ``O(n_paths)``.
+    Returns per-path arrays: ``pnl`` (hedged P&L at expiry),
+    ``tracking_error`` (RMS of the marked hedged P&L over the steps),
+    ``turnover`` (shares traded) and ``costs``, plus the ``premium``.
+    """
+    rng = np.random.default_rng(seed)
+    dt = T / n_steps
+    drift, vol = (r - 0.5 * sigma**2) * dt, sigma * np.sqrt(dt)
+    S = np.full(n_paths, float(S0))
+
+    def spot_at(step):
+        z = rng.standard_normal(n_paths)
+        z *= vol
+        z += drift
+        np.exp(z, out=z)
+        return np.multiply(S, z, out=S)
+
+    return _hedge(spot_at, n_paths, S0, K, r, T, sigma, n_steps, strategy, cost)
+
+
+def hedge_summary(result, level=0.95):
+    """Mean, spread and tail of a :func:`hedge_backtest` result."""
+    pnl = result["pnl"]
+    return {
+        "mean_pnl": float(pnl.mean()),
+        "std_pnl": float(pnl.std()),
+        "var": float(-np.quantile(pnl, 1 - level)),
+        "mean_tracking_error": float(result["tracking_error"].mean()),
+        "mean_turnover": float(result["turnover"].mean()),
+        "mean_costs": float(result["costs"].mean()),
+    }
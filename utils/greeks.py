@@ -1,5 +1,6 @@
 import numpy as np
 from .option_pricing import (
+    price_and_greeks,
     call_delta,
     put_delta,
     gamma,
@@ -12,32 +13,41 @@ from .option_pricing import (
 
 
 GREEK_KEYS = ["delta", "gamma", "vega", "theta", "rho"]
+HIGHER_ORDER_KEYS = ["vanna", "volga", "charm", "speed", "color"]
 
+# Greeks that differ between calls and puts; the rest are shared
+_SIDED = {"delta", "theta", "rho", "charm"}
 
-def compute_greeks(S, K, r, T, sigma, option_type="call"):
-    """Return dictionary of option Greeks."""
-    if option_type == "call":
-        return {
-            "delta": call_delta(S, K, r, T, sigma),
-            "gamma": gamma(S, K, r, T, sigma),
-            "vega": vega(S, K, r, T, sigma),
-            "theta": call_theta(S, K, r, T, sigma),
-            "rho": call_rho(S, K, r, T, sigma),
-        }
-    else:
-        return {
-            "delta": put_delta(S, K, r, T, sigma),
-            "gamma": gamma(S, K, r, T, sigma),
-            "vega": vega(S, K, r, T, sigma),
-            "theta": put_theta(S, K, r, T, sigma),
-            "rho": put_rho(S, K, r, T, sigma),
-        }
+
+def _output_key(name, side):
+    return f"{side}_{name}" if name in _SIDED else name
+
+
+def _side_greeks(pg, side, names=GREEK_KEYS):
+    """Pick one side's Greeks out of a ``price_and_greeks`` result."""
+    return {name: pg[_output_key(name, side)] for name in names}
+
+
+def compute_greeks(S, K, r, T, sigma, option_type="call", q=0.0, names=None):
+    """Return dictionary of option Greeks.
+
+    ``names`` selects from ``GREEK_KEYS`` and ``HIGHER_ORDER_KEYS``; only the
+    requested Greeks are evaluated. Defaults to the first-order ``GREEK_KEYS``.
+    """
+    side = "call" if option_type == "call" else "put"
+    names = GREEK_KEYS if names is None else list(names)
+    unknown = [n for n in names if n not in GREEK_KEYS + HIGHER_ORDER_KEYS]
+    if unknown:
+        raise ValueError(f"Unknown Greeks {unknown}; expected names from {GREEK_KEYS + HIGHER_ORDER_KEYS}")
+    keys = tuple(dict.fromkeys(_output_key(n, side) for n in names))
+    return _side_greeks(price_and_greeks(S, K, r, T, sigma, q, keys=keys), side, names)
 
 
 def net_position_greeks(trade, S, K, r, T, sigma):
     """Sum Greeks for a trade dictionary."""
-    call_g = compute_greeks(S, K, r, T, sigma, "call")
-    put_g = compute_greeks(S, K, r, T, sigma, "put")
+    pg = price_and_greeks(S, K, r, T, sigma)
+    call_g = _side_greeks(pg, "call")
+    put_g = _side_greeks(pg, "put")
     # stock Greeks
     stock = {"delta": 1.0, "gamma": 0.0, "vega": 0.0, "theta": 0.0, "rho": 0.0}
     bond = {"delta": 0.0, "gamma": 0.0, "vega": 0.0, "theta": 0.0, "rho": -K * T * np.exp(-r * T) / 100}
@@ -0,0 +1,132 @@
+"""Compare hedging policies and transaction costs over one shared set of paths.
+
+Every policy is a rebalancing rule for the short-call hedge of
+:func:`utils.delta_hedging.hedge_paths`:
+
+``interval``
+    Rebalance to delta every ``param`` steps.
+``delta_band``
+    Rebalance to delta when the position is more than ``param`` shares away.
+``whalley_wilmott``
+    Keep the position inside the Whalley-Wilmott utility band
+    ``delta +- (3/2 e^{-r tau} cost S gamma^2 / param)^{1/3}``, trading
+    only to its nearest edge; ``param`` is the risk aversion.
+``gamma_band``
+    Rebalance to delta when the position is more than ``param`` times the
+    expected one-step delta move, ``gamma S sigma sqrt(dt)``, away.
+
+:func:`sweep_policies` simulates the paths once and evaluates every
+``(policy, param, cost)`` combination on them. With ``workers`` the paths
+are placed in shared memory and the evaluations fan out over a process
+pool; workers map that block instead of receiving a copy.
+"""
+
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from . import option_pricing as op
+from .delta_hedging import hedge_paths, hedge_summary, simulate_paths
+
+POLICIES = ("interval", "delta_band", "whalley_wilmott", "gamma_band")
+
+_gamma = op.gamma.__wrapped__
+
+# per-worker view of the shared path matrix, set by _attach
+_worker = {}
+
+
+def make_policy(name, param, K, r, T, sigma, n_steps, cost=0.0):
+    """Rebalancing rule ``(step, S, delta, position) -> shares`` for ``hedge_paths``."""
+    dt = T / n_steps
+
+    def gamma(step, S):
+        return _gamma(S, K, r, T - step * dt, sigma)
+
+    if name == "interval":
+        every = max(int(param), 1)
+        return lambda step, S, delta, position: delta if step % every == 0 else position
+    if name == "delta_band":
+        return lambda step, S, delta, position: np.where(np.abs(delta - position) > param, delta, position)
+    if name == "whalley_wilmott":
+
+        def whalley_wilmott(step, S, delta, position):
+            tau = T - step * dt
+            half = np.cbrt(1.5 * np.exp(-r * tau) * cost * S * gamma(step, S) ** 2 / param)
+            return np.clip(position, delta - half, delta + half)
+
+        return whalley_wilmott
+    if name == "gamma_band":
+
+        def gamma_band(step, S, delta, position):
+            half = param * gamma(step, S) * S * sigma * np.sqrt(dt)
+            return np.where(np.abs(delta - position) > half, delta, position)
+
+        return gamma_band
+    raise ValueError(f"Unknown policy {name!r}; expected one of {POLICIES}")
+
+
+def _evaluate(paths, name, param, cost, K, r, T, sigma):
+    n_steps = paths.shape[1] - 1
+    policy = make_policy(name, param, K, r, T, sigma, n_steps, cost)
+    summary = hedge_summary(hedge_paths(paths, K, r, T, sigma, policy, cost))
+    return {"policy": name, "param": param, "cost": cost, **summary}
+
+
+def _attach(shm_name, shape):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker["shm"] = shm
+    _worker["paths"] = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+
+
+def _evaluate_shared(name, param, cost, K, r, T, sigma):
+    return _evaluate(_worker["paths"], name, param, cost, K, r, T, sigma)
+
+
+def efficient_frontier(table, error="std_pnl", spend="mean_costs"):
+    """Flag the rows no other row beats on both hedging error and cost.
+
+    The frontier is taken separately for each transaction ``cost`` rate,
+    since that is a market condition rather than a choice.
+    """
+    table = table.sort_values(["cost", spend, error], kind="stable").reset_index(drop=True)
+    best_before = table.groupby("cost")[error].transform(lambda e: e.cummin().shift(fill_value=np.inf))
+    return table.assign(frontier=table[error] < best_before)
+
+
+def sweep_policies(
+    policies, costs, S0, K, r, T, sigma, n_paths=10_000, n_steps=52, seed=None, workers=None
+):
+    """Evaluate every ``(policy, param)`` in ``policies`` at every rate in ``costs``.
+
+    ``policies`` is a list of ``(name, param)`` pairs with names from
+    :data:`POLICIES`; ``costs`` are proportional transaction costs. All
+    combinations hedge the same simulated paths. Returns the
+    :func:`efficient_frontier` table of :func:`~utils.delta_hedging.hedge_summary`
+    columns, one row per combination.
+    """
+    for name, _ in policies:
+        if name not in POLICIES:
+            raise ValueError(f"Unknown policy {name!r}; expected one of {POLICIES}")
+    paths = simulate_paths(S0, r, sigma, T, n_paths, n_steps, seed)
+    jobs = [(name, param, cost) for (name, param), cost in itertools.product(policies, costs)]
+
+    if workers is None:
+        rows = [_evaluate(paths, *job, K, r, T, sigma) for job in jobs]
+    else:
+        shm = shared_memory.SharedMemory(create=True, size=paths.nbytes)
+        try:
+            np.ndarray(paths.shape, dtype=paths.dtype, buffer=shm.buf)[:] = paths
+            del paths
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_attach, initargs=(shm.name, (n_paths, n_steps + 1))
+            ) as pool:
+                futures = [pool.submit(_evaluate_shared, *job, K, r, T, sigma) for job in jobs]
+                rows = [f.result() for f in futures]
+        finally:
+            shm.close()
+            shm.unlink()
+    return efficient_frontier(pd.DataFrame(rows))
@@ -0,0 +1,116 @@
+"""Vectorized implied volatility for whole option chains."""
+
+import numpy as np
+
+from . import option_pricing as op
+
+SIGMA_MIN = 1e-4
+SIGMA_MAX = 5.0
+
+# every iteration prices fresh sigmas, so skip the pricing cache
+_price_and_greeks = op.price_and_greeks.__wrapped__
+_KEYS = ("call_price", "put_price", "vega", "d1", "d2")
+
+
+def no_arbitrage_bounds(S, K, r, T, q=0.0, kind="call"):
+    """Return (lower, upper) model-free price bounds for European options."""
+    S_q = np.asarray(S) * np.exp(-q * np.asarray(T))
+    K_r = np.asarray(K) * np.exp(-r * np.asarray(T))
+    is_call = np.asarray(kind) == "call"
+    lower = np.where(is_call, np.maximum(S_q - K_r, 0.0), np.maximum(K_r - S_q, 0.0))
+    upper = np.where(is_call, S_q, K_r)
+    return lower, upper
+
+
+def _initial_guess(otm_price, S_q, K_r, T):
+    """Corrado-Miller rational approximation, written for the OTM option."""
+    # the formula is stated for calls; the OTM put maps onto it via parity
+    call = otm_price + np.maximum(S_q - K_r, 0.0)
+    half_gap = 0.5 * (S_q - K_r)
+    disc = (call - half_gap) ** 2 - (S_q - K_r) ** 2 / np.pi
+    guess = (
+        np.sqrt(2 * np.pi) / (S_q + K_r)
+        * (call - half_gap + np.sqrt(np.maximum(disc, 0.0)))
+        / np.sqrt(T)
+    )
+    # Brenner-Subrahmanyam fallback where the approximation degenerates
+    fallback = np.sqrt(2 * np.pi / T) * otm_price / S_q
+    guess = np.where(np.isfinite(guess) & (guess > 0), guess, fallback)
+    return np.clip(guess, 0.05, 2.0)
+
+
+def implied_vol(prices, S, K, r, T, q=0.0, kind="call", tol=1e-10, max_iter=50):
+    """Back out Black-Scholes implied volatility for arrays of quotes.
+
+    ``kind`` is ``"call"``, ``"put"`` or an array of those strings. Every
+    quote is converted to its out-of-the-money equivalent through put-call
+    parity, seeded with a rational approximation and refined with Halley
+    steps that fall back to bisection whenever they leave the bracket.
+    Converged elements are masked out of later iterations.
+
+    Returns ``(iv, violation, unconverged)``: ``violation`` flags quotes
+    outside the no-arbitrage bounds and ``unconverged`` those still not
+    solved after ``max_iter`` iterations. Both have NaN ``iv``.
+    """
+    prices, S, K, T, r, q, kind = np.broadcast_arrays(
+        *map(np.asarray, (prices, S, K, T, r, q, kind))
+    )
+    shape = prices.shape
+    prices, S, K, T, r, q = (a.astype(float).ravel() for a in (prices, S, K, T, r, q))
+    is_call = kind.ravel() == "call"
+
+    lower, upper = no_arbitrage_bounds(S, K, r, T, q, kind.ravel())
+    slack = 1e-12 * upper  # tolerate round-off in quotes sitting on a bound
+    violation = (prices < lower - slack) | (prices >= upper) | ~(T > 0)
+
+    S_q = S * np.exp(-q * T)
+    K_r = K * np.exp(-r * T)
+    otm_call = K_r >= S_q
+    # put-call parity: C - P = S e^{-qT} - K e^{-rT}
+    otm_price = np.where(is_call == otm_call, prices, prices - np.where(is_call, 1, -1) * (S_q - K_r))
+
+    iv = np.full(prices.shape, np.nan)
+    lo = np.full(prices.shape, SIGMA_MIN)
+    hi = np.full(prices.shape, SIGMA_MAX)
+    # prices at or below the intrinsic floor map to zero volatility
+    floor = ~violation & (otm_price <= 0)
+    iv[floor] = 0.0
+
+    active = np.flatnonzero(~violation & ~floor)
+    sigma = _initial_guess(otm_price[active], S_q[active], K_r[active], T[active])
+
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        args = (S[active], K[active], r[active], T[active], sigma, q[active])
+        pg = _price_and_greeks(*args, keys=_KEYS)
+        model = np.where(otm_call[active], pg["call_price"], pg["put_price"])
+        diff = model - otm_price[active]
+        vega = pg["vega"] * 100  # per unit of volatility
+
+        lo[active] = np.where(diff < 0, sigma, lo[active])
+        hi[active] = np.where(diff > 0, sigma, hi[active])
+
+        done = np.abs(diff) <= tol * otm_price[active]
+        iv[active[done]] = sigma[done]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = diff / vega
+            volga_ratio = pg["d1"] * pg["d2"] / sigma  # volga / vega
+            step = newton / (1.0 - 0.5 * newton * volga_ratio)
+            step = np.where(np.isfinite(step), step, newton)
+            candidate = sigma - step
+        a, b = lo[active], hi[active]
+        bad = ~np.isfinite(candidate) | (candidate <= a) | (candidate >= b)
+        candidate = np.where(bad, 0.5 * (a + b), candidate)
+
+        stalled = np.abs(candidate - sigma) <= tol * sigma
+        iv[active[stalled & ~done]] = candidate[stalled & ~done]
+
+        keep = ~(done | stalled)
+        active = active[keep]
+        sigma = candidate[keep]
+
+    unconverged = np.zeros(prices.shape, dtype=bool)
+    unconverged[active] = True
+    return iv.reshape(shape)[()], violation.reshape(shape)[()], unconverged.reshape(shape)[()]
@@ -0,0 +1,241 @@
+"""Incremental repricing of an option chain on spot, vol and time updates.
+
+:class:`LiveChain` keeps every row's last full Black-Scholes evaluation
+(its *anchor*) together with first- and higher-order Greeks. On an update
+each row is first moved with a Taylor expansion in delta, gamma, vega and
+theta around its anchor. The leading neglected terms (speed, vanna, volga,
+charm, color) give a per-row error estimate, doubled for margin, and rows
+whose estimate exceeds ``tol`` are fully repriced, which also resets their
+anchor. The estimate uses Greeks at the anchor, so it is only trusted near
+it: a row is also repriced once its d1 or d2 has moved by more than
+``sqrt(tol)``. Delta's own remainder is then about ``N''(d) / 2 * tol <
+0.13 tol``, and ``benchmarks/bench_live_chain.py`` checks that prices and
+deltas stay within ``tol`` for spot, vol and time moves. Puts follow from
+put-call parity, so they carry the same error as the call.
+
+Each update returns only the rows whose displayed values moved by at least
+``display_tol`` since they were last emitted, and records how many rows
+took each path in :attr:`LiveChain.last_update` and :attr:`LiveChain.totals`.
+"""
+
+import numpy as np
+import pandas as pd
+
+from . import option_pricing as op
+from .options_chain import _expiry_label
+
+# partial reprices are one-off subsets, so skip the pricing cache
+_price_and_greeks = op.price_and_greeks.__wrapped__
+
+_ANCHOR_KEYS = (
+    "call_price",
+    "call_delta",
+    "gamma",
+    "vega",
+    "call_theta",
+    "call_rho",
+    "put_rho",
+    "vanna",
+    "volga",
+    "call_charm",
+    "speed",
+    "color",
+)
+# the estimate is a leading-order envelope; scale it up for margin
+_SAFETY = 2.0
+# values compared against display_tol to decide which rows changed
+_WATCHED = ("call_price", "put_price", "call_delta", "put_delta")
+
+
+class LiveChain:
+    """A chain that reprices incrementally as spot, vol and time move.
+
+    ``sigma`` is a flat volatility or an ``expiries x strikes`` grid. Rows
+    are ordered like :func:`utils.options_chain.chain_frame` and
+    :attr:`frame` has the same columns, so :func:`format_chain` applies.
+    """
+
+    def __init__(self, S, r, expiries, strikes, sigma, q=0.0, tol=1e-3, display_tol=5e-3):
+        T = np.asarray(expiries, dtype=float)
+        K = np.round(np.asarray(strikes, dtype=float) * 2) / 2  # .0 or .5 increments
+        labels = np.array([_expiry_label(int(round(t * 12))) for t in T], dtype=object)
+        # categorical, so building the diff frame does not re-encode strings
+        names, codes = np.unique(labels, return_inverse=True)
+        self.labels = pd.Categorical.from_codes(np.repeat(codes, K.size), names)
+        self.T0 = np.repeat(T, K.size)
+        self.K = np.tile(K, T.size)
+        self.r, self.q = r, q
+        self.tol, self.display_tol = tol, display_tol
+        self.radius = np.sqrt(tol)  # largest d1/d2 shift a row moves by Taylor
+
+        self.S = float(S)
+        self._shape = (T.size, K.size)
+        self.sigma = np.broadcast_to(np.asarray(sigma, dtype=float), self._shape).ravel().copy()
+        self.elapsed = 0.0
+
+        n = self.K.size
+        self._anchor = {key: np.empty(n) for key in ("S", "sigma", "T", "d1", "d2")}
+        self._greeks = {key: np.empty(n) for key in _ANCHOR_KEYS}
+        self._bound = {key: np.empty(n) for key in ("speed", "vanna", "volga", "charm", "color", "theta")}
+        self.values = {
+            key: np.empty(n) for key in ("call_price", "put_price", "call_delta", "put_delta", "gamma", "vega")
+        }
+        self.error_bound = np.zeros(n)
+        self._reprice(slice(None))
+        self._shown = {key: self.values[key].copy() for key in _WATCHED}
+
+        self.totals = {"updates": 0, "rows": 0, "taylor": 0, "full": 0, "changed": 0}
+        self.last_update = None
+
+    @property
+    def T(self):
+        return self.T0 - self.elapsed
+
+    def _reprice(self, idx):
+        """Full Black-Scholes evaluation of rows ``idx``, which become anchors."""
+        S, K, T, sigma = self.S, self.K[idx], self.T[idx], self.sigma[idx]
+        pg = _price_and_greeks(S, K, self.r, T, sigma, self.q, keys=(*_ANCHOR_KEYS, "d1", "d2"))
+        self._anchor["S"][idx] = S
+        self._anchor["sigma"][idx] = sigma
+        self._anchor["T"][idx] = T
+        self._anchor["d1"][idx] = pg["d1"]
+        self._anchor["d2"][idx] = pg["d2"]
+        for key in _ANCHOR_KEYS:
+            self._greeks[key][idx] = pg[key]
+        for key in ("call_price", "call_delta", "gamma", "vega"):
+            self.values[key][idx] = pg[key]
+
+        # error-bound coefficients only depend on the anchor. Speed and volga
+        # cross zero inside the chain, where the next order takes over, so
+        # they are floored at their natural scale to keep the bound an
+        # envelope: d1/(sig sqrt T) + 1 -> 1/(sig sqrt T) and d1 d2 -> 1.
+        b = self._bound
+        sig_sqrt_T = sigma * np.sqrt(T)
+        b["speed"][idx] = np.maximum(np.abs(pg["speed"]), pg["gamma"] / (S * sig_sqrt_T)) / 6
+        b["vanna"][idx] = np.abs(pg["vanna"])
+        b["volga"][idx] = 0.5 * np.maximum(np.abs(pg["volga"]), pg["vega"] / (100 * sigma))
+        b["charm"][idx] = np.abs(pg["call_charm"])
+        b["color"][idx] = 0.5 * np.abs(pg["color"])
+        # theta drift: d ln(theta) / dT ~ (d1^2 - 1) / 2T, floored the same way
+        b["theta"][idx] = np.abs(pg["call_theta"]) * np.maximum(np.abs(pg["d1"] ** 2 - 1), 1) / (2 * 365 * T)
+
+        self.error_bound[idx] = 0.0
+        self._parity(idx)
+
+    def _taylor(self, idx):
+        """Move rows ``idx`` (an index array or slice) from their anchors.
+
+        Returns the per-row error estimate, including the safety margin.
+        """
+        g = {key: val[idx] for key, val in self._greeks.items()}
+        b = {key: val[idx] for key, val in self._bound.items()}
+        dS = self.S - self._anchor["S"][idx]
+        dv = (self.sigma[idx] - self._anchor["sigma"][idx]) * 100  # vol points, like vega
+        days = (self._anchor["T"][idx] - self.T[idx]) * 365  # calendar days, like theta
+
+        self.values["call_price"][idx] = (
+            g["call_price"]
+            + (g["call_delta"] + 0.5 * g["gamma"] * dS) * dS
+            + g["vega"] * dv
+            + g["call_theta"] * days
+        )
+        self.values["call_delta"][idx] = g["call_delta"] + g["gamma"] * dS + g["vanna"] * dv + g["call_charm"] * days
+        self.values["gamma"][idx] = g["gamma"] + g["speed"] * dS + g["color"] * days
+        self.values["vega"][idx] = g["vega"] + g["vanna"] * dS + g["volga"] * dv
+        self._parity(idx)
+
+        abs_dS, abs_dv, abs_days = np.abs(dS), np.abs(dv), np.abs(days)
+        return _SAFETY * (
+            (b["speed"] * abs_dS + b["color"] * abs_days) * dS**2
+            + (b["vanna"] * abs_dv + b["charm"] * abs_days) * abs_dS
+            + b["volga"] * dv**2
+            + b["theta"] * days**2
+        )
+
+    def _shift(self):
+        """Largest move of d1 or d2 of every row since its anchor."""
+        d = _price_and_greeks(self.S, self.K, self.r, self.T, self.sigma, self.q, keys=("d1", "d2"))
+        return np.maximum(np.abs(d["d1"] - self._anchor["d1"]), np.abs(d["d2"] - self._anchor["d2"]))
+
+    def _parity(self, idx):
+        T = self.T[idx]
+        disc_q = np.exp(-self.q * T)
+        self.values["put_price"][idx] = (
+            self.values["call_price"][idx] - self.S * disc_q + self.K[idx] * np.exp(-self.r * T)
+        )
+        self.values["put_delta"][idx] = self.values["call_delta"][idx] - disc_q
+
+    def update(self, S=None, sigma=None, dt=0.0):
+        """Apply a spot, vol and/or time move and return the changed rows.
+
+        ``sigma`` is a new flat vol or grid, ``dt`` the time elapsed in years
+        since the previous update. Returns a DataFrame of the rows (indexed
+        by row number) whose prices or deltas moved by at least
+        ``display_tol`` since they were last returned.
+        """
+        if S is not None:
+            self.S = float(S)
+        if sigma is not None:
+            self.sigma[:] = np.broadcast_to(np.asarray(sigma, dtype=float), self._shape).ravel()
+        if dt:
+            if self.elapsed + dt >= self.T0.min():
+                raise ValueError("dt moves past the nearest expiry; rebuild the chain")
+            self.elapsed += dt
+
+        bound = self._taylor(slice(None))
+        full = np.flatnonzero((bound > self.tol) | (self._shift() > self.radius))
+        self.error_bound[:] = bound
+        if full.size:
+            self._reprice(full)
+
+        moved = np.zeros(self.K.size, dtype=bool)
+        for key in _WATCHED:
+            moved |= np.abs(self.values[key] - self._shown[key]) >= self.display_tol
+        changed = np.flatnonzero(moved)
+        for key in _WATCHED:
+            self._shown[key][changed] = self.values[key][changed]
+
+        n = self.K.size
+        self.last_update = {
+            "rows": n,
+            "taylor": n - full.size,
+            "full": full.size,
+            "changed": changed.size,
+            "taylor_fraction": (n - full.size) / n,
+            "full_fraction": full.size / n,
+            "changed_fraction": changed.size / n,
+        }
+        self.totals["updates"] += 1
+        for key in ("rows", "taylor", "full", "changed"):
+            self.totals[key] += self.last_update[key]
+        return self._frame(changed)
+
+    def _frame(self, idx=None):
+        idx = np.arange(self.K.size) if idx is None else idx
+        T = self.T[idx]
+        v = {key: val[idx] for key, val in self.values.items()}
+        g = self._greeks
+        return pd.DataFrame(
+            {
+                "Expiry": self.labels[idx],
+                "T": T,
+                "Strike": self.K[idx],
+                "Call Price": v["call_price"],
+                "Put Price": v["put_price"],
+                "Call Delta": v["call_delta"],
+                "Put Delta": v["put_delta"],
+                "Gamma": v["gamma"],
+                "Vega": v["vega"],
+                # rho moves slowly and is carried from the anchor
+                "Call Rho": g["call_rho"][idx],
+                "Put Rho": g["put_rho"][idx],
+                "RevCon": v["call_price"] - v["put_price"] - self.S + self.K[idx] * np.exp(-self.r * T),
+                "IV": self.sigma[idx],
+            },
+            index=idx,
+        )
+
+    @property
+    def frame(self):
+        """Current values for every row, with the columns of ``chain_frame``."""
+        return self._frame()
@@ -5,14 +5,25 @@ import numpy as np
 
 from . import option_pricing as op
 from . import greeks
+from . import pnl_attribution
+from .rng import session_service
+from .strategy import make_legs
 
 
 class LiveTrader:
     """Encapsulates the multi-stage live trading simulation."""
 
-    def __init__(self, scenario, call_delta, put_delta, call_theo, put_theo):
-        """Store scenario parameters and initialize state."""
+    # name of this simulator's stream in the session's RNG service
+    rng_stream = "live_trader"
+
+    def __init__(self, scenario, call_delta, put_delta, call_theo, put_theo, rng=None):
+        """Store scenario parameters and initialize state.
+
+        ``rng`` is the ``np.random.Generator`` for market events; by default
+        the session's :attr:`rng_stream` stream.
+        """
         self.scenario = scenario
+        self.rng = rng if rng is not None else session_service(st.session_state).stream(self.rng_stream)
         self.call_delta = call_delta
         self.put_delta = put_delta
         self.call_theo = call_theo
@@ -132,8 +143,6 @@ class LiveTrader:
         st.subheader("Market Event!")
 
         if not st.session_state.get("market_events"):
-            import random
-
             events = [
                 {
                     "type": "stock_move",
@@ -152,7 +161,7 @@ class LiveTrader:
                 {
                     "type": "time_decay",
                     "description": "Two weeks pass with sideways action",
-                    "new_spot": sc["S"] * random.uniform(0.98, 1.02),
+                    "new_spot": sc["S"] * self.rng.uniform(0.98, 1.02),
                     "vol_change": -0.03,
                     "time_passed": 0.04,
                 },
@@ -165,7 +174,7 @@ class LiveTrader:
                 },
             ]
 
-            st.session_state.market_events = [random.choice(events)]
+            st.session_state.market_events = [events[self.rng.integers(len(events))]]
 
         event = st.session_state.market_events[0]
 
@@ -183,17 +192,17 @@ class LiveTrader:
         def calculate_pnl():
             pos = st.session_state.initial_position
             pnl = 0
-            if "buy call" in pos["trade"]:
+            if "buy call" in pos["trade"].lower():
                 pnl = (new_call_theo - self.call_theo) * pos["size"] * 100
-            elif "sell call" in pos["trade"]:
+            elif "sell call" in pos["trade"].lower():
                 pnl = (self.call_theo - new_call_theo) * pos["size"] * 100
-            elif "buy put" in pos["trade"]:
+            elif "buy put" in pos["trade"].lower():
                 pnl = (new_put_theo - self.put_theo) * pos["size"] * 100
-            elif "sell put" in pos["trade"]:
+            elif "sell put" in pos["trade"].lower():
                 pnl = (self.put_theo - new_put_theo) * pos["size"] * 100
-            elif "buy straddle" in pos["trade"]:
+            elif "buy straddle" in pos["trade"].lower():
                 pnl = ((new_call_theo - self.call_theo) + (new_put_theo - self.put_theo)) * pos["size"] * 100
-            elif "sell straddle" in pos["trade"]:
+            elif "sell straddle" in pos["trade"].lower():
                 pnl = ((self.call_theo - new_call_theo) + (self.put_theo - new_put_theo)) * pos["size"] * 100
             return pnl
 
@@ -282,8 +291,38 @@ class LiveTrader:
                 }
                 self._advance_stage("feedback")
 
+    def _position_legs(self):
+        """Option legs of the initial position, per share (100 per contract)."""
+        pos = st.session_state.initial_position
+        trade = pos["trade"].lower()
+        kinds = ["call", "put"] if "straddle" in trade else [k for k in ("call", "put") if k in trade]
+        qty = (1 if trade.startswith("buy") else -1) * pos["size"] * 100
+        return make_legs(kinds, self.scenario["K"], self.scenario["T"], qty)
+
+    def _render_attribution(self, response):
+        """Greek breakdown of the event P&L, from the entry market to the event's."""
+        sc = self.scenario
+        after = response["new_market_data"]
+        parts = pnl_attribution.attribute(
+            self._position_legs(),
+            [sc["S"], after["spot"]],
+            [0.0, sc["T"] - after["time"]],
+            sc["r"],
+            [sc["sigma"], after["vol"]],
+        )
+        breakdown = {name.title(): float(parts[name].sum()) for name in pnl_attribution.COMPONENTS}
+        breakdown["Total"] = float(parts["actual"].sum())
+        st.markdown("### P&L Breakdown")
+        st.bar_chart(breakdown)
+        st.write(" | ".join(f"{name}: ${value:+,.0f}" for name, value in breakdown.items()))
+        st.caption(
+            "Greeks at entry times the event's spot, vol and time changes; "
+            "the residual is what they miss on a move this size (higher-order terms)"
+        )
+
     def _render_feedback(self):
         response = st.session_state.event_response
+        self._render_attribution(response)
 
         st.markdown("### Scorecard")
         score = 0
@@ -411,9 +450,7 @@ class LiveTrader:
             },
         ]
 
-        import random
-
-        second_event = random.choice(follow_up_events)
+        second_event = follow_up_events[self.rng.integers(len(follow_up_events))]
         st.warning(f"**SECOND EVENT**: {second_event['description']}")
 
         first_event_data = st.session_state.event_response["new_market_data"]
@@ -429,17 +466,17 @@ class LiveTrader:
         def calculate_cumulative_pnl():
             pos = st.session_state.initial_position
             pnl = 0
-            if "buy call" in pos["trade"]:
+            if "buy call" in pos["trade"].lower():
                 pnl = (second_call_theo - self.call_theo) * pos["size"] * 100
-            elif "sell call" in pos["trade"]:
+            elif "sell call" in pos["trade"].lower():
                 pnl = (self.call_theo - second_call_theo) * pos["size"] * 100
-            elif "buy put" in pos["trade"]:
+            elif "buy put" in pos["trade"].lower():
                 pnl = (second_put_theo - self.put_theo) * pos["size"] * 100
-            elif "sell put" in pos["trade"]:
+            elif "sell put" in pos["trade"].lower():
                 pnl = (self.put_theo - second_put_theo) * pos["size"] * 100
-            elif "buy straddle" in pos["trade"]:
+            elif "buy straddle" in pos["trade"].lower():
                 pnl = ((second_call_theo - self.call_theo) + (second_put_theo - self.put_theo)) * pos["size"] * 100
-            elif "sell straddle" in pos["trade"]:
+            elif "sell straddle" in pos["trade"].lower():
                 pnl = ((self.call_theo - second_call_theo) + (self.put_theo - second_put_theo)) * pos["size"] * 100
             return pnl
 
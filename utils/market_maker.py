@@ -1,4 +1,3 @@
-import numpy as np
 import streamlit as st
 
 from .live_trader import LiveTrader
@@ -8,6 +7,8 @@ from .ui_config import maker_quote_form
 class MarketMaker(LiveTrader):
     """Live trader subclass implementing market maker logic."""
 
+    rng_stream = "market_maker"
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.inventory = st.session_state.get("maker_inventory", 0)
@@ -42,7 +43,7 @@ class MarketMaker(LiveTrader):
             st.success("Quote posted")
 
         if self.quote and st.button("Simulate Fill"):
-            side = np.random.choice(["buy", "sell"])
+            side = str(self.rng.choice(["buy", "sell"]))
             price = self.quote["ask"] if side == "buy" else self.quote["bid"]
             self.execute_trade(side, self.quote["qty"], price)
             st.success(f"Filled {side} {self.quote['qty']} @ {price:.2f}")
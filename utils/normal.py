@@ -0,0 +1,142 @@
+"""Standard normal CDF/PDF backends for the pricing hot path.
+
+Two backends are available:
+
+``"exact"`` (default)
+    ``scipy.special.ndtr``, the same routine ``scipy.stats.norm.cdf`` calls,
+    without the distribution-object dispatch. SciPy is imported lazily on
+    first use, so importing this module does not pull in ``scipy.stats``.
+
+``"fast"``
+    NumPy/stdlib only. Scalars go through ``math.erfc`` (full double
+    precision); arrays use the Zelen-Severo rational approximation
+    (Abramowitz & Stegun 26.2.17), max absolute error 7.5e-8.
+
+Most of the old per-call cost was ``scipy.stats`` dispatch, which both
+backends avoid; ``benchmarks/bench_normal.py`` shows ``ndtr`` remains the
+quicker choice for large arrays, so ``"fast"`` mainly buys a SciPy-free
+import for lightweight processes.
+
+The backend is chosen at import from the ``OPTIONSMOCK_NORM_BACKEND``
+environment variable, changed with :func:`set_backend`, scoped with
+:func:`use_backend`, or overridden per call with ``backend=``. The scope of
+:func:`use_backend` is a context variable, so it only applies to the
+thread (or asyncio task) that entered it.
+"""
+
+import math
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import numpy as np
+
+BACKENDS = ("exact", "fast")
+
+_SQRT_2 = math.sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+# Abramowitz & Stegun 26.2.17
+_P = 0.2316419
+_B = (1.330274429, -1.821255978, 1.781477937, -0.356563782, 0.319381530)
+
+_backend = os.environ.get("OPTIONSMOCK_NORM_BACKEND", "exact")
+if _backend not in BACKENDS:
+    raise ValueError(f"Unknown OPTIONSMOCK_NORM_BACKEND {_backend!r}; expected one of {BACKENDS}")
+
+# backend chosen by use_backend in the current context; None defers to _backend
+_scoped = ContextVar("normal_backend", default=None)
+
+_ndtr = None
+
+
+def _exact_cdf(x, out=None):
+    global _ndtr
+    if _ndtr is None:
+        from scipy.special import ndtr
+
+        _ndtr = ndtr
+    return _ndtr(x, out=out)
+
+
+def _is_scalar(x):
+    # np.float64 subclasses float, so this skips np.ndim for the common case
+    return isinstance(x, float) or np.ndim(x) == 0
+
+
+def _fast_cdf(x, out=None, work=None):
+    if out is None and _is_scalar(x):
+        return 0.5 * math.erfc(-float(x) / _SQRT_2)
+    x = np.asarray(x)
+    if x.dtype.kind != "f":
+        x = x.astype(float)
+    # evaluated in place so that out/work are the only arrays touched
+    t = np.abs(x, out=work)
+    t *= _P
+    t += 1.0
+    np.reciprocal(t, out=t)
+    poly = np.multiply(t, _B[0], out=out)
+    for b in _B[1:]:
+        poly += b
+        poly *= t
+    tail = np.multiply(x, x, out=t)
+    tail *= -0.5
+    np.exp(tail, out=tail)
+    tail *= _INV_SQRT_2PI
+    poly *= tail
+    np.subtract(1.0, poly, out=poly, where=x >= 0)
+    return poly
+
+
+def _check(name):
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend {name!r}; expected one of {BACKENDS}")
+
+
+def get_backend():
+    """Return the name of the active backend."""
+    return _scoped.get() or _backend
+
+
+def set_backend(name):
+    """Select the process-wide backend (:func:`use_backend` scopes still win)."""
+    global _backend
+    _check(name)
+    _backend = name
+
+
+@contextmanager
+def use_backend(name):
+    """Switch backend for the current thread or task only, e.g. around a batch of pricing calls."""
+    _check(name)
+    token = _scoped.set(name)
+    try:
+        yield
+    finally:
+        _scoped.reset(token)
+
+
+def cdf(x, backend=None, out=None, work=None):
+    """Standard normal cumulative distribution function.
+
+    ``out`` receives the result in place; the fast backend also uses
+    ``work`` (same shape and dtype) as scratch instead of allocating.
+    """
+    if (backend or _scoped.get() or _backend) == "fast":
+        return _fast_cdf(x, out, work)
+    return _exact_cdf(x, out)
+
+
+def pdf(x, backend=None, out=None):
+    """Standard normal density; exact for both backends, ``backend`` is accepted for symmetry."""
+    if out is None and _is_scalar(x):
+        x = float(x)
+        return _INV_SQRT_2PI * math.exp(-0.5 * x * x)
+    x = np.asarray(x)
+    if x.dtype.kind != "f":
+        x = x.astype(float)
+    res = np.multiply(x, x, out=out)
+    res *= -0.5
+    np.exp(res, out=res)
+    res *= _INV_SQRT_2PI
+    return res
@@ -1,83 +1,237 @@
 import numpy as np
-from scipy.stats import norm
+from . import normal
+from .pricing_cache import cached
 
 
+def _bs_terms(S, K, r, T, sigma, q=0.0):
+    """Intermediates shared by every Black-Scholes formula, computed once."""
+    S, K, T, sigma = map(np.asarray, (S, K, T, sigma))
+    sqrt_T = np.sqrt(T)
+    sig_sqrt_T = sigma * sqrt_T
+    D1 = (np.log(S / K) + (r - q + 0.5 * sigma**2) * T) / sig_sqrt_T
+    return {
+        "S": S,
+        "K": K,
+        "r": r,
+        "q": q,
+        "T": T,
+        "sigma": sigma,
+        "sqrt_T": sqrt_T,
+        "sig_sqrt_T": sig_sqrt_T,
+        "d1": D1,
+        "d2": D1 - sig_sqrt_T,
+        "disc_q": np.exp(-q * T),
+        "disc_r": np.exp(-r * T),
+    }
+
+
+# Derived intermediates, evaluated on first use and then kept in the terms dict
+_LAZY_TERMS = {
+    "Nd1": lambda t: normal.cdf(t["d1"]),
+    "Nd2": lambda t: normal.cdf(t["d2"]),
+    # N(-d) directly: 1 - N(d) cancels to nothing in the tails
+    "Nmd1": lambda t: normal.cdf(-t["d1"]),
+    "Nmd2": lambda t: normal.cdf(-t["d2"]),
+    "pdf1": lambda t: normal.pdf(t["d1"]),
+    "S_q": lambda t: t["S"] * t["disc_q"],
+    "K_r": lambda t: t["K"] * t["disc_r"],
+    "decay": lambda t: -_term(t, "S_q") * _term(t, "pdf1") * t["sigma"] / (2 * t["sqrt_T"]),
+    "gamma": lambda t: t["disc_q"] * _term(t, "pdf1") / (t["S"] * t["sig_sqrt_T"]),
+    "vega_raw": lambda t: _term(t, "S_q") * _term(t, "pdf1") * t["sqrt_T"],
+    # shared by charm and color: (2 (r - q) T - d2 sigma sqrt T) / (2 T sigma sqrt T)
+    "drift_term": lambda t: (
+        (2 * (t["r"] - t["q"]) * t["T"] - t["d2"] * t["sig_sqrt_T"]) / (2 * t["T"] * t["sig_sqrt_T"])
+    ),
+}
+
+
+def _term(t, name):
+    if name not in t:
+        t[name] = _LAZY_TERMS[name](t)
+    return t[name]
+
+
+# Units follow the individual functions: vega/vanna/volga per 1% vol,
+# theta/charm/color per day, rho per 1% rate.
+_OUTPUTS = {
+    "d1": lambda t: t["d1"],
+    "d2": lambda t: t["d2"],
+    "call_price": lambda t: _term(t, "S_q") * _term(t, "Nd1") - _term(t, "K_r") * _term(t, "Nd2"),
+    "put_price": lambda t: _term(t, "K_r") * _term(t, "Nmd2") - _term(t, "S_q") * _term(t, "Nmd1"),
+    "call_delta": lambda t: t["disc_q"] * _term(t, "Nd1"),
+    "put_delta": lambda t: -t["disc_q"] * _term(t, "Nmd1"),
+    "gamma": lambda t: _term(t, "gamma"),
+    "vega": lambda t: _term(t, "vega_raw") / 100,
+    "call_theta": lambda t: (
+        _term(t, "decay")
+        + t["q"] * _term(t, "S_q") * _term(t, "Nd1")
+        - t["r"] * _term(t, "K_r") * _term(t, "Nd2")
+    ) / 365,
+    "put_theta": lambda t: (
+        _term(t, "decay")
+        - t["q"] * _term(t, "S_q") * _term(t, "Nmd1")
+        + t["r"] * _term(t, "K_r") * _term(t, "Nmd2")
+    ) / 365,
+    "call_rho": lambda t: _term(t, "K_r") * t["T"] * _term(t, "Nd2") / 100,
+    "put_rho": lambda t: -_term(t, "K_r") * t["T"] * _term(t, "Nmd2") / 100,
+    "vanna": lambda t: -t["disc_q"] * _term(t, "pdf1") * t["d2"] / t["sigma"] / 100,
+    "volga": lambda t: _term(t, "vega_raw") * t["d1"] * t["d2"] / t["sigma"] / 10_000,
+    "call_charm": lambda t: (
+        t["q"] * t["disc_q"] * _term(t, "Nd1")
+        - t["disc_q"] * _term(t, "pdf1") * _term(t, "drift_term")
+    ) / 365,
+    "put_charm": lambda t: (
+        -t["q"] * t["disc_q"] * _term(t, "Nmd1")
+        - t["disc_q"] * _term(t, "pdf1") * _term(t, "drift_term")
+    ) / 365,
+    "speed": lambda t: -_term(t, "gamma") / t["S"] * (t["d1"] / t["sig_sqrt_T"] + 1),
+    # gamma per day of calendar decay, i.e. -dGamma/dT
+    "color": lambda t: _term(t, "gamma") * (
+        t["q"] + 1 / (2 * t["T"]) + t["d1"] * _term(t, "drift_term")
+    ) / 365,
+}
+
+FIRST_ORDER_KEYS = (
+    "call_price",
+    "put_price",
+    "call_delta",
+    "put_delta",
+    "gamma",
+    "vega",
+    "call_theta",
+    "put_theta",
+    "call_rho",
+    "put_rho",
+)
+HIGHER_ORDER_KEYS = ("vanna", "volga", "call_charm", "put_charm", "speed", "color")
+
+
+@cached
+def price_and_greeks(S, K, r, T, sigma, q=0.0, keys=FIRST_ORDER_KEYS):
+    """Prices and Greeks from a single fused pass.
+
+    ``d1``, ``d2`` and the discount factors are evaluated once; ``N(d1)``,
+    ``N(d2)``, ``n(d1)`` and the other shared intermediates are computed the
+    first time a requested output needs them and reused by the rest. Pass
+    ``keys`` (any of :data:`FIRST_ORDER_KEYS` and :data:`HIGHER_ORDER_KEYS`,
+    or ``d1``/``d2``) to pay only for the outputs you need. Inputs broadcast like NumPy
+    arrays and the result is a dict of arrays (struct-of-arrays) using the
+    same units as the individual functions below.
+    """
+    unknown = [k for k in keys if k not in _OUTPUTS]
+    if unknown:
+        raise ValueError(f"Unknown outputs {unknown}; expected names from {tuple(_OUTPUTS)}")
+    t = _bs_terms(S, K, r, T, sigma, q)
+    return {k: _OUTPUTS[k](t) for k in keys}
+
+
+@cached
 def d1(S, K, r, T, sigma, q=0.0):
     """Calculate d1 for Black-Scholes formula."""
-    S, K, T, sigma = map(np.asarray, (S, K, T, sigma))
-    return (np.log(S / K) + (r - q + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
+    return _bs_terms(S, K, r, T, sigma, q)["d1"]
 
 
+@cached
 def d2(S, K, r, T, sigma, q=0.0):
     """Calculate d2 for Black-Scholes formula."""
-    return d1(S, K, r, T, sigma, q) - sigma * np.sqrt(T)
+    return _bs_terms(S, K, r, T, sigma, q)["d2"]
 
 
+@cached
 def call_price(S, K, r, T, sigma, q=0.0):
     """Black-Scholes price of a European call option."""
-    D1 = d1(S, K, r, T, sigma, q)
-    D2 = D1 - sigma * np.sqrt(T)
-    return S * np.exp(-q * T) * norm.cdf(D1) - K * np.exp(-r * T) * norm.cdf(D2)
+    return _OUTPUTS["call_price"](_bs_terms(S, K, r, T, sigma, q))
 
 
+@cached
 def put_price(S, K, r, T, sigma, q=0.0):
     """Black-Scholes price of a European put option."""
-    D1 = d1(S, K, r, T, sigma, q)
-    D2 = D1 - sigma * np.sqrt(T)
-    return K * np.exp(-r * T) * norm.cdf(-D2) - S * np.exp(-q * T) * norm.cdf(-D1)
+    return _OUTPUTS["put_price"](_bs_terms(S, K, r, T, sigma, q))
 
 
 # ---- Greeks ----
 
+@cached
 def call_delta(S, K, r, T, sigma, q=0.0):
     """Delta of a European call."""
-    return np.exp(-q * T) * norm.cdf(d1(S, K, r, T, sigma, q))
+    return _OUTPUTS["call_delta"](_bs_terms(S, K, r, T, sigma, q))
 
+
+@cached
 def put_delta(S, K, r, T, sigma, q=0.0):
     """Delta of a European put."""
-    return np.exp(-q * T) * (norm.cdf(d1(S, K, r, T, sigma, q)) - 1)
+    return _OUTPUTS["put_delta"](_bs_terms(S, K, r, T, sigma, q))
 
 
+@cached
 def gamma(S, K, r, T, sigma, q=0.0):
     """Gamma is the same for calls and puts."""
-    D1 = d1(S, K, r, T, sigma, q)
-    return np.exp(-q * T) * norm.pdf(D1) / (S * sigma * np.sqrt(T))
+    return _OUTPUTS["gamma"](_bs_terms(S, K, r, T, sigma, q))
 
 
+@cached
 def vega(S, K, r, T, sigma, q=0.0):
     """Vega: sensitivity to volatility (per 1% change)."""
-    D1 = d1(S, K, r, T, sigma, q)
-    return S * np.exp(-q * T) * norm.pdf(D1) * np.sqrt(T) / 100
+    return _OUTPUTS["vega"](_bs_terms(S, K, r, T, sigma, q))
 
 
+@cached
 def call_theta(S, K, r, T, sigma, q=0.0):
     """Theta of a European call (per day)."""
-    D1 = d1(S, K, r, T, sigma, q)
-    D2 = D1 - sigma * np.sqrt(T)
-    term1 = -S * norm.pdf(D1) * sigma * np.exp(-q * T) / (2 * np.sqrt(T))
-    term2 = q * S * norm.cdf(D1) * np.exp(-q * T)
-    term3 = r * K * np.exp(-r * T) * norm.cdf(D2)
-    return (term1 - term2 - term3) / 365
+    return _OUTPUTS["call_theta"](_bs_terms(S, K, r, T, sigma, q))
 
 
+@cached
 def put_theta(S, K, r, T, sigma, q=0.0):
     """Theta of a European put (per day)."""
-    D1 = d1(S, K, r, T, sigma, q)
-    D2 = D1 - sigma * np.sqrt(T)
-    term1 = -S * norm.pdf(D1) * sigma * np.exp(-q * T) / (2 * np.sqrt(T))
-    term2 = q * S * norm.cdf(-D1) * np.exp(-q * T)
-    term3 = r * K * np.exp(-r * T) * norm.cdf(-D2)
-    return (term1 + term2 - term3) / 365
+    return _OUTPUTS["put_theta"](_bs_terms(S, K, r, T, sigma, q))
 
 
+@cached
 def call_rho(S, K, r, T, sigma, q=0.0):
     """Rho of a European call (per 1% rate change)."""
-    D2 = d2(S, K, r, T, sigma, q)
-    return K * T * np.exp(-r * T) * norm.cdf(D2) / 100
+    return _OUTPUTS["call_rho"](_bs_terms(S, K, r, T, sigma, q))
 
 
+@cached
 def put_rho(S, K, r, T, sigma, q=0.0):
     """Rho of a European put (per 1% rate change)."""
-    D2 = d2(S, K, r, T, sigma, q)
-    return -K * T * np.exp(-r * T) * norm.cdf(-D2) / 100
+    return _OUTPUTS["put_rho"](_bs_terms(S, K, r, T, sigma, q))
+
+
+# ---- Higher-order Greeks ----
+
+@cached
+def vanna(S, K, r, T, sigma, q=0.0):
+    """Vanna: change in delta per 1% volatility change (same for calls and puts)."""
+    return _OUTPUTS["vanna"](_bs_terms(S, K, r, T, sigma, q))
+
+
+@cached
+def volga(S, K, r, T, sigma, q=0.0):
+    """Volga (vomma): change in vega per 1% volatility change."""
+    return _OUTPUTS["volga"](_bs_terms(S, K, r, T, sigma, q))
+
+
+@cached
+def call_charm(S, K, r, T, sigma, q=0.0):
+    """Charm of a European call: delta decay per day."""
+    return _OUTPUTS["call_charm"](_bs_terms(S, K, r, T, sigma, q))
+
+
+@cached
+def put_charm(S, K, r, T, sigma, q=0.0):
+    """Charm of a European put: delta decay per day."""
+    return _OUTPUTS["put_charm"](_bs_terms(S, K, r, T, sigma, q))
+
+
+@cached
+def speed(S, K, r, T, sigma, q=0.0):
+    """Speed: change in gamma per unit spot move."""
+    return _OUTPUTS["speed"](_bs_terms(S, K, r, T, sigma, q))
+
 
+@cached
+def color(S, K, r, T, sigma, q=0.0):
+    """Color: gamma decay per day."""
+    return _OUTPUTS["color"](_bs_terms(S, K, r, T, sigma, q))
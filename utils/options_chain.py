@@ -1,18 +1,37 @@
 import numpy as np
 import pandas as pd
+from collections.abc import Mapping
 from datetime import datetime
 from pandas.tseries.offsets import DateOffset
 
-from .option_pricing import (
-    call_price,
-    put_price,
-    call_delta,
-    put_delta,
-    gamma,
-    vega,
-    call_rho,
-    put_rho,
+from .option_pricing import price_and_greeks
+from .fft_pricing import fft_prices
+from .implied_vol import implied_vol, no_arbitrage_bounds
+from .vol_surface import VolSurface
+
+CHAIN_KEYS = ("call_price", "put_price", "call_delta", "put_delta", "gamma", "vega", "call_rho", "put_rho")
+# column order of chain_blocks; chain_frame has the same without "Underlying"
+CHAIN_COLUMNS = (
+    "Underlying",
+    "Expiry",
+    "T",
+    "Strike",
+    "Call Price",
+    "Put Price",
+    "Call Delta",
+    "Put Delta",
+    "Gamma",
+    "Vega",
+    "Call Rho",
+    "Put Rho",
+    "RevCon",
+    "IV",
 )
+_LABELS = ("Underlying", "Expiry")
+
+# FFT prices carry round-off of order 1e-8 S; time value below this
+# tolerance (relative to spot) says nothing about the model's smile
+_FFT_NOISE = 1e-7
 
 
 def _expiry_label(months: int) -> str:
@@ -21,44 +40,149 @@ def _expiry_label(months: int) -> str:
     return date.strftime("%b")
 
 
-def generate_chain(S, r, expiries, strikes, sigma):
-    """Return formatted DataFrame of option metrics."""
-    rows = []
-    for T in expiries:
-        label = _expiry_label(int(round(T * 12)))
-        for K in strikes:
-            K_fmt = round(K * 2) / 2  # .0 or .5 increments
-            c_price = call_price(S, K_fmt, r, T, sigma)
-            p_price = put_price(S, K_fmt, r, T, sigma)
-            c_delta = int(round(call_delta(S, K_fmt, r, T, sigma) * 100))
-            p_delta = int(round(put_delta(S, K_fmt, r, T, sigma) * 100))
-            g = gamma(S, K_fmt, r, T, sigma)
-            v = vega(S, K_fmt, r, T, sigma)
-            c_rho = call_rho(S, K_fmt, r, T, sigma)
-            p_rho = put_rho(S, K_fmt, r, T, sigma)
-            revcon = c_price - p_price - S + K_fmt * np.exp(-r * T)
-            rows.append(
-                {
+def chain_frame(S, r, expiries, strikes, sigma, heston=None):
+    """Return a numeric DataFrame with one row per (expiry, strike).
+
+    The whole ``expiries x strikes`` grid is priced in a single broadcast
+    :func:`price_and_greeks` call and the columns are assembled directly,
+    so this scales to chains of 100k+ rows. Rows are ordered by expiry,
+    then strike; ``T`` is the expiry in years and ``IV`` the volatility as
+    a fraction. Use :func:`format_chain` for the display version.
+
+    With ``heston`` (a dict of ``v0``, ``kappa``, ``theta``, ``xi``, ``rho``)
+    each expiry is priced with one Carr-Madan FFT and every row uses its own
+    implied volatility, so the chain shows the model's smile instead of the
+    flat ``sigma``. Far wings whose time value is lost in the FFT's
+    round-off take the volatility of the nearest resolved strike of their
+    expiry (``sigma`` if none is). ``sigma`` may also be a
+    :class:`~utils.vol_surface.VolSurface`, read at each row's strike and
+    expiry.
+    """
+    T = np.asarray(expiries, dtype=float)
+    K = np.round(np.asarray(strikes, dtype=float) * 2) / 2  # .0 or .5 increments
+    if heston is not None:
+        vol = _heston_vols(S, r, T, K, sigma, heston)
+    elif isinstance(sigma, VolSurface):
+        vol = sigma.sigma(K[None, :], T[:, None])
+    else:
+        vol = np.full((T.size, K.size), float(sigma))
+
+    labels = np.array([_expiry_label(int(round(t * 12))) for t in T], dtype=object)
+    columns = {
+        "Expiry": np.repeat(labels, K.size),
+        "T": np.repeat(T, K.size),
+        "Strike": np.tile(K, T.size),
+        **_priced_columns(S, r, K, T[:, None], vol),
+    }
+    return pd.DataFrame({name: np.ravel(col) for name, col in columns.items()})
+
+
+def _heston_vols(S, r, T, K, sigma, heston):
+    """Heston implied vols on the ``T x K`` grid, with noisy wings filled in."""
+    calls, _ = fft_prices(S, r, T, K, model="heston", **heston)
+    lower, upper = no_arbitrage_bounds(S, K, r, T[:, None])
+    # round-off can push the FFT price just outside the bounds
+    calls = np.clip(calls, lower, np.nextafter(upper, 0))
+    vol, _, _ = implied_vol(calls, S, K, r, T[:, None])
+    resolved = np.isfinite(vol) & (vol > 0) & (calls - lower > _FFT_NOISE * S)
+    for row, ok in zip(vol, resolved):
+        # flat extrapolation from the nearest resolved strike
+        row[~ok] = np.interp(K[~ok], K[ok], row[ok]) if ok.any() else float(sigma)
+    return vol
+
+
+def _priced_columns(S, r, K, T, vol, pricer=price_and_greeks):
+    """Price and Greek columns of the chain, broadcast over ``K``, ``T`` and ``vol``."""
+    pg = pricer(S, K, r, T, vol, keys=CHAIN_KEYS)
+    return {
+        "Call Price": pg["call_price"],
+        "Put Price": pg["put_price"],
+        "Call Delta": pg["call_delta"],
+        "Put Delta": pg["put_delta"],
+        "Gamma": pg["gamma"],
+        "Vega": pg["vega"],
+        "Call Rho": pg["call_rho"],
+        "Put Rho": pg["put_rho"],
+        "RevCon": pg["call_price"] - pg["put_price"] - S + K * np.exp(-r * T),
+        "IV": vol,
+    }
+
+
+def chain_blocks(underlyings, r, expiries, strikes, sigma, chunk_rows=65_536):
+    """Yield the chain of many underlyings as fixed-size column blocks.
+
+    ``underlyings`` maps symbol to spot (or is an iterable of ``(symbol,
+    S)`` pairs); ``sigma`` is a scalar, a :class:`VolSurface` (read in each
+    underlying's moneyness) or a mapping from symbol to either. Rows are
+    priced one (underlying, expiry) slab at a time with the same columns
+    as :func:`chain_frame` plus ``Underlying``, and packed into dicts of
+    NumPy arrays of exactly ``chunk_rows`` rows (the last may be shorter).
+    Nothing larger than one block is ever held, so memory is bounded by
+    ``chunk_rows`` however many underlyings are streamed.
+    """
+    T_all = np.asarray(expiries, dtype=float)
+    K_all = np.round(np.asarray(strikes, dtype=float) * 2) / 2  # .0 or .5 increments
+    labels = [_expiry_label(int(round(t * 12))) for t in T_all]
+    items = underlyings.items() if isinstance(underlyings, Mapping) else underlyings
+
+    block, filled = None, 0
+    for symbol, S in items:
+        source = sigma[symbol] if isinstance(sigma, Mapping) else sigma
+        for T, label in zip(T_all, labels):
+            for start in range(0, K_all.size, chunk_rows):
+                K = K_all[start:start + chunk_rows]
+                if isinstance(source, VolSurface):
+                    vol = source.sigma(K, T, S=S)
+                else:
+                    vol = np.full(K.size, float(source))
+                slab = {
+                    "Underlying": symbol,
                     "Expiry": label,
-                    "Strike": K_fmt,
-                    "Call Price": c_price,
-                    "Put Price": p_price,
-                    "Call Delta": c_delta,
-                    "Put Delta": p_delta,
-                    "Gamma": g,
-                    "Vega": v,
-                    "Call Rho": c_rho,
-                    "Put Rho": p_rho,
-                    "RevCon": revcon,
-                    "IV": f"{sigma * 100:.2f}%",
+                    "T": T,
+                    "Strike": K,
+                    # every slab is new, so keep them out of the pricing cache
+                    **_priced_columns(S, r, K, T, vol, pricer=price_and_greeks.__wrapped__),
                 }
-            )
+                offset = 0
+                while offset < K.size:
+                    if block is None:
+                        block = {name: np.empty(chunk_rows, dtype=object if name in _LABELS else float)
+                                 for name in CHAIN_COLUMNS}
+                        filled = 0
+                    take = min(K.size - offset, chunk_rows - filled)
+                    for name, col in slab.items():
+                        block[name][filled:filled + take] = col if np.ndim(col) == 0 else col[offset:offset + take]
+                    filled += take
+                    offset += take
+                    if filled == chunk_rows:
+                        yield block
+                        block = None
+    if block is not None:
+        yield {name: col[:filled] for name, col in block.items()}
+
 
-    df = pd.DataFrame(rows)
-    groups = []
-    for exp, group in df.groupby("Expiry", sort=False):
-        groups.append(group.reset_index(drop=True))
-        groups.append(pd.DataFrame([{}]))  # blank line
-    df_formatted = pd.concat(groups, ignore_index=True)
-    return df_formatted[df.columns]
+def format_chain(chain):
+    """Display version of a :func:`chain_frame` result.
 
+    Deltas are shown as rounded percentages, IV as a percent string, the
+    numeric ``T`` column is dropped and a blank line separates expiries.
+    """
+    df = chain.drop(columns="T")
+    # nullable integers, so rows without a model value show as blank
+    df["Call Delta"] = np.round(chain["Call Delta"] * 100).astype("Int64")
+    df["Put Delta"] = np.round(chain["Put Delta"] * 100).astype("Int64")
+    iv = np.array([f"{v:.2f}%" for v in (chain["IV"] * 100).tolist()], dtype=object)
+    iv[chain["IV"].isna().to_numpy()] = ""
+    df["IV"] = iv
+
+    # shift each expiry down by the number of blank lines above it
+    T = chain["T"].to_numpy()
+    group = np.concatenate(([0], np.cumsum(T[1:] != T[:-1])))
+    df.index = np.arange(len(df)) + group
+    n_groups = group[-1] + 1 if len(df) else 0
+    return df.reindex(np.arange(len(df) + n_groups))
+
+
+def generate_chain(S, r, expiries, strikes, sigma, heston=None):
+    """Return formatted DataFrame of option metrics."""
+    return format_chain(chain_frame(S, r, expiries, strikes, sigma, heston))
@@ -1,26 +1,28 @@
 import numpy as np
+import pandas as pd
 import matplotlib.pyplot as plt
 from .option_pricing import call_price, put_price
 
 
-def generate_parameters(difficulty=None):
+def generate_parameters(difficulty=None, rng=None):
+    rng = np.random.default_rng(rng)
     if difficulty == "Easy":
-        S = int(np.random.uniform(80, 120))
-        K = int(np.random.uniform(80, 120))
+        S = int(rng.uniform(80, 120))
+        K = int(rng.uniform(80, 120))
     else:
-        S = np.random.uniform(80, 120)
-        K = round(np.random.uniform(80, 120) * 2) / 2
+        S = rng.uniform(80, 120)
+        K = round(rng.uniform(80, 120) * 2) / 2
 
-    r = np.random.uniform(0.0, 0.05)
-    T = np.random.uniform(0.25, 1.0)  # in years
+    r = rng.uniform(0.0, 0.05)
+    T = rng.uniform(0.25, 1.0)  # in years
     sigma = 0.2
 
     C = call_price(S, K, r, T, sigma)
     P = put_price(S, K, r, T, sigma)
 
     # Introduce small random noise to potentially create parity violation
-    noise = np.random.normal(scale=0.5)
-    if np.random.rand() > 0.5:
+    noise = rng.normal(scale=0.5)
+    if rng.random() > 0.5:
         C += noise
     else:
         P += noise
@@ -46,6 +48,91 @@ def arbitrage_strategy(diff):
         return "No arbitrage"
 
 
+SCAN_LEGS = ("call", "put", "stock", "pvk")
+
+# legs traded by each side of parity_edges, as scan_parity labels them
+SCAN_TRADES = {
+    "conversion": "Sell call, buy put, buy stock, borrow PV(K)",
+    "reversal": "Buy call, sell put, short stock, lend PV(K)",
+}
+
+
+def discount_factors(rates, T):
+    """Discount factors ``exp(-r(T) T)`` from a flat rate or a zero curve.
+
+    ``rates`` is a continuously compounded rate, or a ``(tenors, zero_rates)``
+    pair interpolated linearly in ``T`` (flat beyond the ends).
+    """
+    T = np.asarray(T, dtype=float)
+    if isinstance(rates, tuple):
+        tenors, zeros = rates
+        rates = np.interp(T, tenors, zeros)
+    return np.exp(-rates * T)
+
+
+def leg_costs(costs=None):
+    """Per-unit cost of every leg in :data:`SCAN_LEGS`, defaulting to zero."""
+    costs = costs or {}
+    unknown = set(costs) - set(SCAN_LEGS)
+    if unknown:
+        raise ValueError(f"Unknown legs {sorted(unknown)}; expected some of {SCAN_LEGS}")
+    return {leg: costs.get(leg, 0.0) for leg in SCAN_LEGS}
+
+
+def parity_edges(call_bid, call_ask, put_bid, put_ask, spot_bid, spot_ask, K, T, rates, q=0.0, costs=None):
+    """Locked-in edge per unit of the conversion and reversal at every quote.
+
+    All quote arguments, and the dividend yield ``q``, broadcast together
+    (typically one row per strike and expiry). The conversion sells the call at the bid, buys the put at
+    the ask, buys the stock at the ask and borrows ``PV(K)``; the reversal
+    is the mirror image on the other sides of the market. ``costs`` maps
+    legs in :data:`SCAN_LEGS` to a per-unit cost (scalar or array), charged
+    once per leg traded. Returns ``(conversion, reversal)``; positive
+    entries are arbitrage net of spreads and costs.
+    """
+    T = np.asarray(T, dtype=float)
+    pvk = K * discount_factors(rates, T)
+    disc_q = np.exp(-np.asarray(q) * T)
+    fees = sum(leg_costs(costs).values())
+
+    conversion = call_bid - put_ask - spot_ask * disc_q + pvk - fees
+    reversal = put_bid - call_ask + spot_bid * disc_q - pvk - fees
+    return conversion, reversal
+
+
+def scan_parity(call_bid, call_ask, put_bid, put_ask, spot_bid, spot_ask, K, T, rates, q=0.0, costs=None, min_edge=0.0):
+    """Table of every parity violation in a chain, best edge first.
+
+    Takes the arguments of :func:`parity_edges` and keeps the rows whose
+    conversion or reversal locks in more than ``min_edge`` per unit. Each
+    row carries the side of the violation and its legs from
+    :data:`SCAN_TRADES`, indexed by the position of the quote in the
+    flattened input.
+    """
+    conversion, reversal = parity_edges(
+        call_bid, call_ask, put_bid, put_ask, spot_bid, spot_ask, K, T, rates, q, costs
+    )
+    conversion, reversal = np.broadcast_arrays(conversion, reversal)
+    conversion, reversal = conversion.ravel(), reversal.ravel()
+    # spreads are non-negative, so at most one side can be positive per row
+    is_conversion = conversion >= reversal
+    edge = np.where(is_conversion, conversion, reversal)
+    rows = np.flatnonzero(edge > min_edge)
+    rows = rows[np.argsort(-edge[rows], kind="stable")]
+
+    shape = conversion.shape
+    return pd.DataFrame(
+        {
+            "T": np.broadcast_to(T, shape).ravel()[rows],
+            "Strike": np.broadcast_to(K, shape).ravel()[rows],
+            "Side": np.where(is_conversion[rows], "conversion", "reversal"),
+            "Trade": np.where(is_conversion[rows], SCAN_TRADES["conversion"], SCAN_TRADES["reversal"]),
+            "Edge": edge[rows],
+        },
+        index=rows,
+    )
+
+
 def payoff_diagram(params, diff):
     S_vals = np.linspace(0.5 * params["K"], 1.5 * params["K"], 100)
     if diff > 0:
@@ -0,0 +1,121 @@
+"""Greek attribution ("P&L explain") of positions along spot/vol paths.
+
+Each step of a path is explained with the Greeks at its starting node:
+
+    delta    = delta * dS
+    gamma    = 1/2 gamma * dS^2
+    vega     = vega * d(sigma) * 100          (vega is per vol point)
+    theta    = theta * days elapsed            (theta is per calendar day)
+    residual = actual change in value - the four terms above
+
+so the components always add up to the repriced P&L. A stock hedge held
+over the step contributes ``hedge = shares * dS``.
+
+Paths are ``(n_paths, n_nodes)`` matrices and every node is priced once:
+each option leg takes a single :func:`~utils.option_pricing.price_and_greeks`
+call over the whole matrix, and all per-step terms are array differences
+of those nodes. :func:`path_totals` and :func:`bucket_summary` aggregate
+the ``(n_paths, n_steps)`` components per path and per block of steps.
+"""
+
+import numpy as np
+import pandas as pd
+
+from . import option_pricing as op
+from .strategy import CALL, PUT, STOCK
+
+COMPONENTS = ("delta", "gamma", "vega", "theta", "residual")
+
+_KEYS = ("call_price", "put_price", "call_delta", "put_delta", "gamma", "vega", "call_theta", "put_theta")
+
+# path matrices are one-off inputs, so skip the pricing cache
+_price_and_greeks = op.price_and_greeks.__wrapped__
+
+
+def node_greeks(legs, S, t, r, sigma, q=0.0):
+    """Value, delta, gamma, vega and theta of ``legs`` at every node.
+
+    ``S`` is ``(n_paths, n_nodes)``, ``t`` the elapsed years at each node
+    (``(n_nodes,)``) and ``sigma`` a scalar or anything broadcasting to
+    ``S``. Legs at or past expiry count at intrinsic value with zero
+    gamma, vega and theta; ``pvk`` legs are ignored.
+    """
+    S = np.atleast_2d(np.asarray(S, dtype=float))
+    t = np.asarray(t, dtype=float)
+    sigma = np.broadcast_to(np.asarray(sigma, dtype=float), S.shape)
+    out = {key: np.zeros(S.shape) for key in ("value", "delta", "gamma", "vega", "theta")}
+
+    for leg in legs:
+        kind, K, qty = int(leg["kind"]), leg["strike"], leg["qty"]
+        if kind == STOCK:
+            out["value"] += qty * S
+            out["delta"] += qty
+            continue
+        if kind not in (CALL, PUT):
+            continue
+        side = "call" if kind == CALL else "put"
+        tau = leg["expiry"] - t
+        live = tau > 0
+        pg = _price_and_greeks(S[:, live], K, r, tau[live], sigma[:, live], q, keys=_KEYS)
+        value = np.maximum(S - K, 0.0) if kind == CALL else np.maximum(K - S, 0.0)
+        delta = np.where(S > K, 1.0, 0.0) if kind == CALL else np.where(S < K, -1.0, 0.0)
+        value[:, live], delta[:, live] = pg[f"{side}_price"], pg[f"{side}_delta"]
+        out["value"] += qty * value
+        out["delta"] += qty * delta
+        out["gamma"][:, live] += qty * pg["gamma"]
+        out["vega"][:, live] += qty * pg["vega"]
+        out["theta"][:, live] += qty * pg[f"{side}_theta"]
+    return out
+
+
+def attribute(legs, S, t, r, sigma, q=0.0, hedge=None):
+    """Per-step Greek attribution of ``legs`` (and an optional stock hedge).
+
+    Arguments are as in :func:`node_greeks`; a single path may be passed
+    as 1-D arrays. ``hedge`` holds the shares held over each step,
+    ``(n_paths, n_steps)``. Returns ``(n_paths, n_steps)`` arrays for each
+    of :data:`COMPONENTS` plus ``hedge``, ``actual`` (repriced change of
+    the legs) and ``total`` (``actual + hedge``).
+    """
+    S = np.atleast_2d(np.asarray(S, dtype=float))
+    sigma = np.broadcast_to(np.asarray(sigma, dtype=float), S.shape)
+    g = node_greeks(legs, S, t, r, sigma, q)
+
+    dS = np.diff(S, axis=1)
+    days = np.diff(np.asarray(t, dtype=float)) * 365
+    parts = {
+        "delta": g["delta"][:, :-1] * dS,
+        "gamma": 0.5 * g["gamma"][:, :-1] * dS * dS,
+        "vega": g["vega"][:, :-1] * np.diff(sigma, axis=1) * 100,
+        "theta": g["theta"][:, :-1] * days,
+    }
+    actual = np.diff(g["value"], axis=1)
+    parts["residual"] = actual - parts["delta"] - parts["gamma"] - parts["vega"] - parts["theta"]
+    parts["hedge"] = np.zeros_like(dS) if hedge is None else np.atleast_2d(hedge) * dS
+    parts["actual"] = actual
+    parts["total"] = actual + parts["hedge"]
+    return parts
+
+
+def path_totals(attribution):
+    """One row per path with each component summed over the steps."""
+    return pd.DataFrame({key: val.sum(axis=1) for key, val in attribution.items()})
+
+
+def bucket_summary(attribution, n_buckets=4, step_times=None):
+    """Mean P&L per component in ``n_buckets`` consecutive blocks of steps.
+
+    Each bucket sums its steps per path and then averages across paths.
+    ``step_times`` (the elapsed years at the start of each step) labels
+    the buckets by time instead of step number.
+    """
+    n_steps = next(iter(attribution.values())).shape[1]
+    edges = np.linspace(0, n_steps, min(n_buckets, n_steps) + 1).round().astype(int)
+    rows = {
+        key: np.add.reduceat(val, edges[:-1], axis=1).mean(axis=0) for key, val in attribution.items()
+    }
+    if step_times is None:
+        index = [f"steps {a}-{b - 1}" for a, b in zip(edges[:-1], edges[1:])]
+    else:
+        index = [f"t={step_times[a]:.3f}" for a in edges[:-1]]
+    return pd.DataFrame(rows, index=index)
@@ -0,0 +1,200 @@
+"""Terminal P&L distribution of a strategy under lognormal dynamics, in closed form.
+
+At expiry the P&L of a position in calls, puts, stock and ``pvk`` (see
+:mod:`utils.strategy`) is piecewise linear in ``S_T``, with kinks at the
+option strikes. Under Black-Scholes ``ln S_T`` is normal, so on every
+linear piece both the probability mass and the partial expectation of
+``S_T`` are differences of normal CDFs. Summing those pieces gives the
+P&L CDF, its mean and tail expectations exactly, with no sampling.
+
+Quantiles (and so VaR and expected shortfall) come from bracketing the
+target probability between the P&L values at the kinks, where the CDF may
+jump, and a safeguarded Newton solve inside the bracket, where the CDF is
+smooth and its density is known in closed form. A strategy has only a
+handful of linear pieces, so the Newton iterations run on plain floats
+rather than paying NumPy's per-call overhead on tiny arrays. P&L is measured at
+expiry and not discounted, like
+:func:`utils.trade_simulation.simulate_trade`.
+"""
+
+import math
+
+import numpy as np
+
+from . import normal
+from .strategy import CALL, PUT, STOCK, pnl, trade_legs
+
+# S_T quantiles (in standard deviations of ln S_T) added to the knots: the
+# outer pair brackets the support (mass beyond is below 1e-30), the inner
+# ones keep the Newton brackets narrow
+_KNOT_Z = np.array([-12.0, -6.0, -4.0, -3.0, -2.0, -1.0, 0.0, 1.0, 2.0, 3.0, 4.0, 6.0, 12.0])
+_MAX_STEPS = 50
+_XTOL = 1e-12
+_PTOL = 1e-12
+
+
+class PnLDistribution:
+    """Distribution of a strategy's P&L at ``T`` given ``(S, r, sigma, q)``.
+
+    ``legs`` is a :data:`~utils.strategy.LEG_DTYPE` array, all assumed to
+    settle at ``T``. By default the drift is risk-neutral (``r - q``); pass
+    ``mu`` for a real-world drift instead.
+    """
+
+    def __init__(self, legs, S, r, T, sigma, q=0.0, mu=None):
+        drift = (r if mu is None else mu) - q
+        self.legs = legs
+        self._m = np.log(S) + (drift - 0.5 * sigma**2) * T
+        self._v = sigma * np.sqrt(T)
+        self._fwd = S * np.exp(drift * T)
+
+        kind, K, qty = legs["kind"], legs["strike"], legs["qty"]
+        kinks = np.unique(K[kind <= PUT])
+        self._lo = np.concatenate([[0.0], kinks])
+        self._hi = np.concatenate([kinks, [np.inf]])
+
+        # a call adds its qty to the slope right of its strike, a put
+        # subtracts it to the left
+        at = np.searchsorted(kinks, K)
+        n = kinks.size + 1
+        calls = np.bincount(at[kind == CALL] + 1, qty[kind == CALL], minlength=n)
+        puts = np.bincount(at[kind == PUT], qty[kind == PUT], minlength=n)
+        b = qty[kind == STOCK].sum() + np.cumsum(calls) - np.cumsum(puts[::-1])[::-1]
+        # P&L at the kinks, where the CDF may jump, and across the support
+        spots = np.exp(self._m + _KNOT_Z * self._v)
+        values = pnl(legs, np.concatenate([self._lo, spots]))
+        self._slope = b
+        self._intercept = values[:n] - b * self._lo
+        self._up, self._down, self._flat = b > 0, b < 0, b == 0
+        self._inv_slope = np.divide(1.0, b, out=np.zeros_like(b), where=~self._flat)
+        self._segments = list(zip(*(arr.tolist() for arr in (self._intercept, b, self._lo, self._hi))))
+
+        self._knots = np.unique(values)
+        self._knot_cdf = None
+
+    def _pieces(self, x):
+        """Per-segment ``S_T`` interval where ``PnL <= x``, as log-moneyness ``z``."""
+        x = np.asarray(x, dtype=float)[..., None]
+        a, lo, hi = self._intercept, self._lo, self._hi
+        with np.errstate(divide="ignore", invalid="ignore"):  # x = inf, log(0)
+            root = (x - a) * self._inv_slope
+            left = np.where(self._down, np.maximum(lo, root), lo)
+            right = np.where(self._up, np.minimum(hi, root), np.where(self._flat & (a > x), lo, hi))
+            right = np.maximum(right, left)
+            z = (np.log(np.stack([left, right])) - self._m) / self._v
+        return root, z
+
+    def _below(self, x):
+        """``P(PnL <= x)`` and ``E[PnL 1{PnL <= x}]`` for each ``x`` (broadcast)."""
+        _, z = self._pieces(x)
+        mass = normal.cdf(z)
+        prob = mass[1] - mass[0]
+        spot_mass = normal.cdf(z - self._v)
+        spot = self._fwd * (spot_mass[1] - spot_mass[0])
+        return prob.sum(axis=-1), (self._intercept * prob + self._slope * spot).sum(axis=-1)
+
+    def _cdf_pdf(self, x):
+        """CDF and density of the P&L at a scalar ``x`` where the CDF is continuous.
+
+        The scalar counterpart of :meth:`_pieces`, one segment at a time.
+        """
+        m, v = float(self._m), float(self._v)
+
+        def z(spot):
+            return -math.inf if spot <= 0.0 else math.inf if spot == math.inf else (math.log(spot) - m) / v
+
+        F = f = 0.0
+        for a, b, lo, hi in self._segments:
+            if b == 0.0:
+                if a <= x:
+                    F += normal.cdf(z(hi)) - normal.cdf(z(lo))
+                continue
+            root = (x - a) / b
+            left, right = (lo, min(hi, root)) if b > 0 else (max(lo, root), hi)
+            if right > left:
+                F += normal.cdf(z(right)) - normal.cdf(z(left))
+            # density: lognormal pdf at the segment's root, divided by |slope|
+            if lo < root < hi:
+                f += normal.pdf(z(root)) / (v * root * abs(b))
+        return float(F), float(f)
+
+    def cdf(self, x):
+        """``P(PnL <= x)``."""
+        return self._below(x)[0]
+
+    def mean(self):
+        """Expected P&L."""
+        return float(self._below(np.inf)[1])
+
+    def prob_profit(self):
+        """Probability that the P&L is strictly positive."""
+        return float(1.0 - self.cdf(0.0))
+
+    def quantile(self, p):
+        """Smallest P&L ``x`` with ``P(PnL <= x) >= p``."""
+        knots = self._knots
+        if self._knot_cdf is None:
+            self._knot_cdf = self.cdf(knots)
+        k = int(np.searchsorted(self._knot_cdf, p))
+        if k == 0:
+            return float(knots[0])
+        if k == knots.size:
+            return float(knots[-1])
+
+        # between two knots the CDF is smooth: safeguarded Newton, bisecting
+        # whenever a step leaves the bracket
+        lo, hi = knots[k - 1], knots[k]
+        F_lo, F_hi = self._knot_cdf[k - 1], self._knot_cdf[k]
+        if self._cdf_pdf(hi - 1e-12 * max(1.0, abs(hi)))[0] < p:
+            return float(hi)  # the quantile sits on an atom
+        x = lo + (hi - lo) * (p - F_lo) / (F_hi - F_lo)
+        for _ in range(_MAX_STEPS):
+            F, f = self._cdf_pdf(x)
+            if abs(F - p) <= _PTOL:
+                break
+            if F < p:
+                lo = x
+            else:
+                hi = x
+            step = x - (F - p) / f if f > 0 else np.nan
+            x = step if lo < step < hi else 0.5 * (lo + hi)
+            if hi - lo <= _XTOL * max(1.0, abs(x)):
+                break
+        return float(x)
+
+    def var(self, level=0.95):
+        """Value at risk: the loss not exceeded with probability ``level``."""
+        return -self.quantile(1.0 - level)
+
+    def es(self, level=0.95, var=None):
+        """Expected shortfall: the mean loss in the worst ``1 - level`` of outcomes."""
+        p = 1.0 - level
+        x = -self.var(level) if var is None else -var
+        prob, partial = self._below(x)
+        # an atom at x is only counted up to the tail probability
+        return float(-(partial - x * (prob - p)) / p)
+
+    def summary(self, level=0.95):
+        """Expected P&L, probability of profit, VaR and ES as a dict."""
+        var = self.var(level)
+        # mean, profit probability and the tail in one pass over the pieces
+        prob, partial = self._below(np.array([np.inf, 0.0, -var]))
+        p = 1.0 - level
+        return {
+            "expected_pnl": float(partial[0]),
+            "prob_profit": float(1.0 - prob[1]),
+            "var": var,
+            "es": float(-(partial[2] + var * (prob[2] - p)) / p),
+            "level": level,
+        }
+
+
+def trade_pnl_stats(params, trade, level=0.95, sigma=None):
+    """:meth:`PnLDistribution.summary` for a ``TRADE_MAP``-style trade.
+
+    ``params`` is a scenario dict as used by ``simulate_trade``; its
+    ``sigma`` is used unless ``sigma`` is given.
+    """
+    sigma = params["sigma"] if sigma is None else sigma
+    dist = PnLDistribution(trade_legs(params, trade), params["S"], params["r"], params["T"], sigma)
+    return dist.summary(level)
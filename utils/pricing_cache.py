@@ -0,0 +1,201 @@
+"""Process-wide memoization for the Black-Scholes entry points.
+
+Streamlit reruns whole pages on every widget change, so the same scenario
+is priced over and over. :func:`cached` wraps a pricing function with a
+bounded LRU keyed on its arguments, with every float quantized to
+``tolerance`` (absolute) so that values agreeing to that precision share
+an entry. Keys also carry the active :mod:`utils.normal` backend, so a
+result computed with the approximate CDF is never served to an exact
+caller. Scalar calls key on the quantized numbers directly; array
+arguments key on a hash of their quantized contents and shape. Arrays
+larger than ``max_array_size`` elements skip the cache entirely, since
+hashing a big grid costs about as much as pricing it.
+
+Array results are copied on the way in and out, so callers may mutate
+what they get back. Counters are available from :func:`cache_info`.
+
+The cache is on by default; set ``OPTIONSMOCK_PRICING_CACHE=0`` to start
+with it off, or use :func:`set_enabled` / :func:`bypass` (e.g. in tests or
+benchmarks).
+"""
+
+import functools
+import hashlib
+import math
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import numpy as np
+
+from . import normal
+
+DEFAULT_MAXSIZE = 4096
+DEFAULT_TOLERANCE = 1e-10
+DEFAULT_MAX_ARRAY_SIZE = 4096
+
+_NOT_CACHEABLE = object()
+
+
+class PricingCache:
+    """Bounded LRU of pricing results with hit/miss/eviction counters."""
+
+    def __init__(
+        self,
+        maxsize=DEFAULT_MAXSIZE,
+        tolerance=DEFAULT_TOLERANCE,
+        max_array_size=DEFAULT_MAX_ARRAY_SIZE,
+        enabled=True,
+    ):
+        self.maxsize = maxsize
+        self.tolerance = tolerance
+        self.max_array_size = max_array_size
+        self.enabled = enabled
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def _quantize(self, value):
+        # exact type check first: plain floats are the common case on reruns
+        if type(value) is float or type(value) is int:
+            if value - value == 0:
+                return round(value / self.tolerance)
+            return _NOT_CACHEABLE
+        if isinstance(value, (float, int)) and not isinstance(value, bool):
+            if not math.isfinite(value):
+                return _NOT_CACHEABLE
+            return round(value / self.tolerance)
+        if isinstance(value, (np.ndarray, np.generic, list)):
+            arr = np.asarray(value)
+            if arr.dtype.kind not in "fiu":
+                return _NOT_CACHEABLE
+            if arr.ndim == 0:
+                return self._quantize(float(arr))
+            if arr.size > self.max_array_size or not np.isfinite(arr).all():
+                return _NOT_CACHEABLE
+            quantized = np.rint(arr / self.tolerance).astype(np.int64)
+            digest = hashlib.blake2b(quantized.tobytes(), digest_size=16).digest()
+            return ("array", arr.shape, digest)
+        try:
+            hash(value)
+        except TypeError:
+            return _NOT_CACHEABLE
+        return value
+
+    def key(self, fn, args, kwargs):
+        """Cache key for ``fn(*args, **kwargs)``, or ``None`` if uncacheable.
+
+        A per-call ``backend=`` keyword is part of the arguments; the
+        backend active in the caller's context is added separately.
+        """
+        names = tuple(sorted(kwargs))
+        values = [self._quantize(v) for v in args]
+        values += [self._quantize(kwargs[name]) for name in names]
+        if any(v is _NOT_CACHEABLE for v in values):
+            return None
+        return (fn.__module__, fn.__qualname__, normal.get_backend(), len(args), names, *values)
+
+    def get(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, _copy(self._entries[key])
+            self.misses += 1
+            return False, None
+
+    def put(self, key, result):
+        with self._lock:
+            self._entries[key] = _copy(result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "enabled": self.enabled,
+        }
+
+
+def _copy(result):
+    if isinstance(result, np.ndarray):
+        return result.copy()
+    if isinstance(result, dict):
+        return {k: _copy(v) for k, v in result.items()}
+    return result
+
+
+_cache = PricingCache(enabled=os.environ.get("OPTIONSMOCK_PRICING_CACHE", "1") != "0")
+
+
+def cached(fn):
+    """Memoize ``fn`` in the process-wide pricing cache.
+
+    The undecorated function stays reachable as ``fn.__wrapped__`` for
+    callers that evaluate many one-off inputs, such as iterative solvers.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not _cache.enabled:
+            return fn(*args, **kwargs)
+        key = _cache.key(fn, args, kwargs)
+        if key is None:
+            return fn(*args, **kwargs)
+        hit, result = _cache.get(key)
+        if hit:
+            return result
+        result = fn(*args, **kwargs)
+        _cache.put(key, result)
+        return result
+
+    return wrapper
+
+
+def configure(maxsize=None, tolerance=None, max_array_size=None):
+    """Change cache limits; clears the cache since old keys may no longer match."""
+    if maxsize is not None:
+        _cache.maxsize = maxsize
+    if tolerance is not None:
+        _cache.tolerance = tolerance
+    if max_array_size is not None:
+        _cache.max_array_size = max_array_size
+    _cache.clear()
+
+
+def cache_info():
+    """Return hit/miss/eviction counters and the current size."""
+    return _cache.info()
+
+
+def clear_cache():
+    """Drop every entry and reset the counters."""
+    _cache.clear()
+
+
+def set_enabled(enabled):
+    """Turn the process-wide cache on or off."""
+    _cache.enabled = bool(enabled)
+
+
+@contextmanager
+def bypass():
+    """Temporarily disable the cache, restoring the previous state on exit."""
+    previous = _cache.enabled
+    _cache.enabled = False
+    try:
+        yield
+    finally:
+        _cache.enabled = previous
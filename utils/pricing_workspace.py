@@ -0,0 +1,157 @@
+"""Preallocated buffers for repricing a fixed-shape grid without allocating."""
+
+import numpy as np
+
+from . import normal
+
+OUTPUT_KEYS = (
+    "call_price",
+    "put_price",
+    "call_delta",
+    "put_delta",
+    "gamma",
+    "vega",
+    "call_theta",
+    "put_theta",
+    "call_rho",
+    "put_rho",
+)
+
+_INPUTS = ("S", "K", "T", "sigma")
+_SCRATCH = (
+    "sqrt_T",
+    "sig_sqrt_T",
+    "d1",
+    "d2",
+    "neg_d",
+    "disc_q",
+    "disc_r",
+    "S_q",
+    "K_r",
+    "Nd1",
+    "Nd2",
+    "Nmd1",
+    "Nmd2",
+    "pdf1",
+    "tmp",
+)
+
+
+class PricingWorkspace:
+    """Owns input, scratch and output buffers for one grid shape and dtype.
+
+    Size it once, then call :meth:`price_and_greeks` on every slider move
+    or chain rebuild. Every step is an in-place ufunc on the owned buffers,
+    so with scalar ``r``/``q`` a reprice allocates nothing proportional to
+    the grid and float32 workspaces stay float32 end to end.
+
+    The returned arrays are the workspace's own ``out`` buffers (or the
+    caller's ``out`` dict) and are overwritten by the next call.
+    """
+
+    def __init__(self, shape, dtype=np.float64):
+        self.shape = tuple(int(n) for n in np.atleast_1d(shape))
+        self.dtype = np.dtype(dtype)
+        if self.dtype.kind != "f":
+            raise ValueError(f"PricingWorkspace needs a floating dtype, got {self.dtype}")
+        self._in = {name: np.empty(self.shape, self.dtype) for name in _INPUTS}
+        self._scratch = {name: np.empty(self.shape, self.dtype) for name in _SCRATCH}
+        self.out = {key: np.empty(self.shape, self.dtype) for key in OUTPUT_KEYS}
+
+    def load(self, S=None, K=None, T=None, sigma=None):
+        """Copy (broadcasting and casting) grid inputs into the owned buffers.
+
+        ``None`` keeps the value already loaded, e.g. when only spot moves.
+        """
+        for name, value in zip(_INPUTS, (S, K, T, sigma)):
+            if value is not None:
+                np.copyto(self._in[name], value, casting="same_kind")
+
+    def price_and_greeks(self, S, K, r, T, sigma, q=0.0, out=None):
+        """In-place equivalent of :func:`utils.option_pricing.price_and_greeks`.
+
+        ``S``, ``K``, ``T`` and ``sigma`` go through :meth:`load`, so ``None``
+        reuses the previously loaded grid.
+        """
+        self.load(S, K, T, sigma)
+        out = self.out if out is None else out
+        S, K, T, sigma = (self._in[name] for name in _INPUTS)
+        w = self._scratch
+
+        np.sqrt(T, out=w["sqrt_T"])
+        np.multiply(sigma, w["sqrt_T"], out=w["sig_sqrt_T"])
+
+        d1 = np.multiply(sigma, sigma, out=w["d1"])
+        d1 *= 0.5
+        d1 += r - q
+        d1 *= T
+        np.divide(S, K, out=w["tmp"])
+        np.log(w["tmp"], out=w["tmp"])
+        d1 += w["tmp"]
+        d1 /= w["sig_sqrt_T"]
+        np.subtract(d1, w["sig_sqrt_T"], out=w["d2"])
+
+        np.multiply(T, -q, out=w["disc_q"])
+        np.exp(w["disc_q"], out=w["disc_q"])
+        np.multiply(T, -r, out=w["disc_r"])
+        np.exp(w["disc_r"], out=w["disc_r"])
+        np.multiply(S, w["disc_q"], out=w["S_q"])
+        np.multiply(K, w["disc_r"], out=w["K_r"])
+
+        normal.cdf(d1, out=w["Nd1"], work=w["tmp"])
+        normal.cdf(w["d2"], out=w["Nd2"], work=w["tmp"])
+        # N(-d) directly, as in the fused kernel: parity cancels in the tails
+        np.negative(d1, out=w["neg_d"])
+        normal.cdf(w["neg_d"], out=w["Nmd1"], work=w["tmp"])
+        np.negative(w["d2"], out=w["neg_d"])
+        normal.cdf(w["neg_d"], out=w["Nmd2"], work=w["tmp"])
+        normal.pdf(d1, out=w["pdf1"])
+
+        np.multiply(w["S_q"], w["Nd1"], out=out["call_price"])
+        np.multiply(w["K_r"], w["Nd2"], out=w["tmp"])
+        out["call_price"] -= w["tmp"]
+        np.multiply(w["K_r"], w["Nmd2"], out=out["put_price"])
+        np.multiply(w["S_q"], w["Nmd1"], out=w["tmp"])
+        out["put_price"] -= w["tmp"]
+
+        np.multiply(w["disc_q"], w["Nd1"], out=out["call_delta"])
+        np.multiply(w["disc_q"], w["Nmd1"], out=out["put_delta"])
+        np.negative(out["put_delta"], out=out["put_delta"])
+
+        np.multiply(S, w["sig_sqrt_T"], out=out["gamma"])
+        np.divide(w["pdf1"], out["gamma"], out=out["gamma"])
+        out["gamma"] *= w["disc_q"]
+
+        np.multiply(w["S_q"], w["pdf1"], out=out["vega"])
+        out["vega"] *= w["sqrt_T"]
+        out["vega"] /= 100
+
+        # both thetas share the decay term -S_q n(d1) sigma / (2 sqrt T)
+        theta = np.multiply(w["S_q"], w["pdf1"], out=out["call_theta"])
+        theta *= sigma
+        theta /= w["sqrt_T"]
+        theta *= -0.5
+        np.copyto(out["put_theta"], theta)
+        # call: + q S_q N(d1) - r K_r N(d2)
+        np.multiply(w["S_q"], w["Nd1"], out=w["tmp"])
+        w["tmp"] *= q
+        theta += w["tmp"]
+        np.multiply(w["K_r"], w["Nd2"], out=w["tmp"])
+        w["tmp"] *= r
+        theta -= w["tmp"]
+        theta /= 365
+        # put: - q S_q N(-d1) + r K_r N(-d2)
+        np.multiply(w["S_q"], w["Nmd1"], out=w["tmp"])
+        w["tmp"] *= q
+        out["put_theta"] -= w["tmp"]
+        np.multiply(w["K_r"], w["Nmd2"], out=w["tmp"])
+        w["tmp"] *= r
+        out["put_theta"] += w["tmp"]
+        out["put_theta"] /= 365
+
+        np.multiply(w["K_r"], T, out=w["tmp"])
+        w["tmp"] /= 100
+        np.multiply(w["tmp"], w["Nd2"], out=out["call_rho"])
+        np.multiply(w["tmp"], w["Nmd2"], out=out["put_rho"])
+        np.negative(out["put_rho"], out=out["put_rho"])
+        return out
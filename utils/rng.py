@@ -0,0 +1,150 @@
+"""Named, reproducible random streams for the simulators.
+
+An :class:`RNGService` owns one root :class:`numpy.random.SeedSequence`.
+Every named stream is a child of it keyed by the name, so ``"scenario"``
+draws the same numbers for a given seed no matter which other streams
+exist or in what order they were created, and differently named streams
+are independent. Process or thread workers take their own children of a
+stream from :meth:`RNGService.worker_seeds`.
+
+Keeping :attr:`RNGService.seed` is enough to replay a whole session;
+:meth:`RNGService.snapshot` also records how far each stream has advanced
+so a run can resume mid-way. :class:`NormalBuffer` serves standard normals
+from blocks drawn in bulk, in exactly the order single draws would give.
+"""
+
+import zlib
+
+import numpy as np
+
+# st.session_state key used by session_service
+SESSION_KEY = "rng_service"
+
+
+def _name_key(name):
+    """Stable integer for a stream name (``hash`` is salted per process)."""
+    return zlib.crc32(name.encode())
+
+
+def as_seed_sequence(seed=None):
+    """``seed`` (``None``, an int, a ``SeedSequence`` or a ``Generator``) as a ``SeedSequence``.
+
+    A ``Generator`` is drawn from for fresh entropy, so it advances like
+    any other consumer and the same generator never seeds the same
+    sequence twice. A ``SeedSequence`` is copied, because ``spawn``
+    advances it: passing the same one twice should give the same children
+    both times.
+    """
+    if isinstance(seed, np.random.Generator):
+        return np.random.SeedSequence(seed.integers(2**63, size=4))
+    if isinstance(seed, np.random.SeedSequence):
+        return np.random.SeedSequence(
+            seed.entropy,
+            spawn_key=seed.spawn_key,
+            pool_size=seed.pool_size,
+            n_children_spawned=seed.n_children_spawned,
+        )
+    return np.random.SeedSequence(seed)
+
+
+class NormalBuffer:
+    """Standard normals from ``rng``, drawn ``block`` at a time.
+
+    ``standard_normal`` mirrors the ``Generator`` method, so a buffer can
+    stand in for the generator of a loop that draws a few values per step.
+    """
+
+    def __init__(self, rng, block=65_536):
+        self.rng = rng
+        self.block = block
+        self._buf = np.empty(0)
+        self._pos = 0
+
+    def standard_normal(self, size=None):
+        """Next ``size`` normals (a float when ``size`` is ``None``)."""
+        n = 1 if size is None else int(np.prod(size))
+        if self._pos + n > self._buf.size:
+            rest = self._buf[self._pos :]
+            self._buf = np.concatenate([rest, self.rng.standard_normal(max(self.block, n - rest.size))])
+            self._pos = 0
+        z = self._buf[self._pos : self._pos + n]
+        self._pos += n
+        return float(z[0]) if size is None else z.reshape(size)
+
+
+class RNGService:
+    """Independent named ``np.random.Generator`` streams under one seed.
+
+    ``seed`` is anything ``SeedSequence`` accepts; ``None`` draws fresh
+    entropy, which :attr:`seed` then exposes for replay.
+    """
+
+    def __init__(self, seed=None):
+        self._root = as_seed_sequence(seed)
+        self._streams = {}
+        self._buffers = {}
+
+    @property
+    def seed(self):
+        """Root entropy; ``RNGService(service.seed)`` replays every stream."""
+        return self._root.entropy
+
+    def seed_sequence(self, name):
+        """Seed sequence of the stream ``name``."""
+        root = self._root
+        return np.random.SeedSequence(root.entropy, spawn_key=(*root.spawn_key, _name_key(name)))
+
+    def stream(self, name):
+        """Generator for ``name``, created on first use and shared after that."""
+        if name not in self._streams:
+            self._streams[name] = np.random.default_rng(self.seed_sequence(name))
+        return self._streams[name]
+
+    def normals(self, name, block=65_536):
+        """:class:`NormalBuffer` over the stream ``name``.
+
+        The buffer reads ahead, so don't draw from ``stream(name)``
+        directly once it is in use.
+        """
+        if name not in self._buffers:
+            self._buffers[name] = NormalBuffer(self.stream(name), block)
+        return self._buffers[name]
+
+    def worker_seeds(self, name, n):
+        """``n`` independent child seeds of stream ``name``, one per worker.
+
+        Seed sequences pickle cheaply; each worker builds its generator
+        with ``np.random.default_rng(seed)``. The same ``(name, n)`` always
+        gives the same seeds.
+        """
+        return self.seed_sequence(name).spawn(n)
+
+    def snapshot(self):
+        """Root seed and the position of every stream, as plain data.
+
+        Normals a :class:`NormalBuffer` has drawn but not yet served are
+        not part of the snapshot.
+        """
+        return {
+            "seed": self.seed,
+            "streams": {name: rng.bit_generator.state for name, rng in self._streams.items()},
+        }
+
+    @classmethod
+    def restore(cls, snapshot):
+        """Service whose streams continue from a :meth:`snapshot`."""
+        service = cls(snapshot["seed"])
+        for name, state in snapshot["streams"].items():
+            service.stream(name).bit_generator.state = state
+        return service
+
+
+def session_service(state, seed=None):
+    """The :class:`RNGService` kept in ``state`` (e.g. ``st.session_state``).
+
+    Created with ``seed`` on first use, so each user session gets its own
+    streams.
+    """
+    if SESSION_KEY not in state:
+        state[SESSION_KEY] = RNGService(seed)
+    return state[SESSION_KEY]
@@ -1,33 +1,67 @@
+"""Random put-call parity scenarios, one at a time or in bulk.
+
+:func:`generate_scenarios` draws every parameter as a column, prices all
+calls and puts in one vectorized Black-Scholes pass and labels each row
+with its parity trade, returning a columnar table. :func:`generate_scenario`
+is its one-row case for the interactive pages.
+"""
+
 import numpy as np
+import pandas as pd
+import pyarrow as pa
 
-from .option_pricing import call_price, put_price
+from . import option_pricing as op
+from .vol_surface import VolSurface
 
+# uniform draw ranges; override any of them as keyword arguments
+RANGES = {"S": (50, 150), "K": (50, 150), "T": (0.1, 1.0), "r": (0.01, 0.05), "sigma": (0.1, 0.7)}
 
-def generate_scenario():
-    """Return random option scenario with theoretical and market prices."""
-    S = np.round(np.random.uniform(50, 150), 2)
-    K = np.round(np.random.uniform(50, 150) / 0.5) * 0.5
-    T = np.round(np.random.uniform(0.1, 1.0), 2)
-    r = np.round(np.random.uniform(0.01, 0.05), 4)
-    sigma = np.round(np.random.uniform(0.1, 0.7), 2)
+# parity trade per sign of the parity difference: > 0, < 0, otherwise
+ARB_LABELS = (
+    "Sell call, buy put, short stock, lend PV(K)",
+    "Buy call, sell put, buy stock, borrow PV(K)",
+    "No arbitrage",
+)
 
-    C_theo = call_price(S, K, r, T, sigma)
-    P_theo = put_price(S, K, r, T, sigma)
+OUTPUTS = ("pandas", "arrow")
 
-    # Add small noise to create market prices
-    C_mkt = C_theo + np.random.normal(scale=0.25)
-    P_mkt = P_theo + np.random.normal(scale=0.25)
+# bulk tables are one-off, so skip the pricing cache
+_price_and_greeks = op.price_and_greeks.__wrapped__
 
-    pvk = K * np.exp(-r * T)
-    parity = S - pvk
-    diff = C_mkt - P_mkt - parity
 
-    if diff > 0:
-        arb = "Sell call, buy put, short stock, lend PV(K)"
-    elif diff < 0:
-        arb = "Buy call, sell put, buy stock, borrow PV(K)"
+def _scenario_columns(n, rng, sigma, noise, ranges):
+    """Scenario columns as arrays, with ``arb`` as codes into :data:`ARB_LABELS`."""
+    unknown = set(ranges) - set(RANGES)
+    if unknown:
+        raise ValueError(f"Unknown ranges {sorted(unknown)}; expected some of {tuple(RANGES)}")
+    ranges = {**RANGES, **ranges}
+    rng = np.random.default_rng(rng)
+
+    def draw(name):
+        return rng.uniform(*ranges[name], size=n)
+
+    S = np.round(draw("S"), 2)
+    K = np.round(draw("K") / 0.5) * 0.5
+    T = np.round(draw("T"), 2)
+    r = np.round(draw("r"), 4)
+    if sigma is None:
+        sigma = np.round(draw("sigma"), 2)
+    elif isinstance(sigma, VolSurface):
+        # the surface is quoted in moneyness, so follow each scenario's spot
+        sigma = np.round(np.sqrt(np.maximum(sigma.total_variance(K, T, S), 0.0) / T), 4)
     else:
-        arb = "No arbitrage"
+        sigma = np.full(n, float(sigma))
+
+    pg = _price_and_greeks(S, K, r, T, sigma, keys=("call_price", "put_price"))
+    C_theo, P_theo = pg["call_price"], pg["put_price"]
+
+    # Add small noise to create market prices
+    C_mkt = C_theo + rng.normal(scale=noise, size=n)
+    P_mkt = P_theo + rng.normal(scale=noise, size=n)
+
+    pvk = K * np.exp(-r * T)
+    diff = C_mkt - P_mkt - (S - pvk)
+    arb = np.select([diff > 0, diff < 0], [0, 1], 2).astype(np.int8)
 
     return {
         "S": S,
@@ -43,3 +77,40 @@ def generate_scenario():
         "parity_diff": diff,
         "arb": arb,
     }
+
+
+def generate_scenarios(n, rng=None, sigma=None, noise=0.25, output="pandas", **ranges):
+    """``n`` random scenarios as a columnar table, one row per scenario.
+
+    ``rng`` is a ``np.random.Generator`` (or a seed); ``None`` uses fresh
+    entropy. ``sigma`` is ``None`` (drawn per row), a fixed volatility or a
+    :class:`VolSurface` read at each row's moneyness and expiry. ``noise``
+    is the standard deviation of the market-price noise, and ``ranges``
+    overrides any of the uniform :data:`RANGES` as ``name=(low, high)``.
+
+    ``output`` is ``"pandas"`` for a DataFrame or ``"arrow"`` for a
+    ``pyarrow.Table``; either way ``arb`` is a dictionary-encoded column
+    of :data:`ARB_LABELS`.
+    """
+    if output not in OUTPUTS:
+        raise ValueError(f"Unknown output {output!r}; expected one of {OUTPUTS}")
+    cols = _scenario_columns(n, rng, sigma, noise, ranges)
+    if output == "arrow":
+        cols["arb"] = pa.DictionaryArray.from_arrays(cols["arb"], pa.array(ARB_LABELS))
+        return pa.table(cols)
+    cols["arb"] = pd.Categorical.from_codes(cols["arb"], ARB_LABELS)
+    return pd.DataFrame(cols)
+
+
+def generate_scenario(sigma=None, rng=None):
+    """Return random option scenario with theoretical and market prices.
+
+    ``sigma`` fixes the volatility; a :class:`VolSurface` is read at the
+    scenario's moneyness and expiry. By default it is drawn at random.
+    ``rng`` is a ``np.random.Generator`` (or a seed); ``None`` uses fresh
+    entropy. This is the first row of :func:`generate_scenarios`.
+    """
+    cols = _scenario_columns(1, rng, sigma, 0.25, {})
+    scenario = {name: col[0] for name, col in cols.items()}
+    scenario["arb"] = ARB_LABELS[scenario["arb"]]
+    return scenario
@@ -0,0 +1,233 @@
+"""Multi-strike static arbitrage search over a quoted chain.
+
+Single-strike put-call parity lives in :mod:`utils.parity`; this module
+looks for the trades that need two or more quotes:
+
+* **box spreads** on every strike pair ``K_i < K_j`` of an expiry: the
+  long box (call spread plus put spread) pays ``K_j - K_i`` for sure, so
+  it is mispriced whenever its cost is outside that amount discounted;
+* **butterflies** on strike triples ``K_i < K_j < K_k`` spaced the same
+  number of strikes apart: a long fly never pays out less than zero, so
+  one that can be opened for a credit violates convexity;
+* **calendars** on every expiry pair at a fixed strike: a longer-dated
+  call is worth at least a shorter one (no dividends, ``r >= 0``).
+
+Quotes are ``expiries x strikes`` grids. Strikes are sorted once and the
+pairs (or triples) are enumerated with index arrays in blocks of about
+:data:`BLOCK_SIZE` edges across all expiries, each block a few broadcast
+operations. Only a running ``top_k`` per kind is kept between blocks, so
+memory is bounded by the block size rather than by ``nK**2`` per expiry.
+Those best candidates are turned into legs, which use the
+:data:`utils.trade_simulation.TRADE_MAP` vocabulary: ``call``, ``put`` and
+``pvk`` (``+1`` borrows, ``-1`` lends), with strike and expiry per leg.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .parity import discount_factors, leg_costs
+
+KINDS = ("box", "butterfly", "calendar")
+
+# edges (expiries x combinations) evaluated per block by find_arbitrage
+BLOCK_SIZE = 1 << 18
+
+
+def _sorted_quotes(quotes, K):
+    """Reorder the strike axis of every ``(nT, nK)`` quote grid ascending."""
+    K = np.asarray(K, dtype=float)
+    order = np.argsort(K, kind="stable")
+    return {name: np.asarray(q, dtype=float)[:, order] for name, q in quotes.items()}, K[order]
+
+
+def _ragged_blocks(counts, size):
+    """``(row, pos)`` arrays enumerating ``pos < counts[row]``, about ``size`` at a time.
+
+    Blocks hold whole rows, at least one each, and there is always at least
+    one (possibly empty) block.
+    """
+    counts = np.asarray(counts, dtype=np.intp)
+    if not counts.size:
+        yield np.empty(0, np.intp), np.empty(0, np.intp)
+        return
+    ends = np.cumsum(counts)
+    start = 0
+    while start < counts.size:
+        base = ends[start - 1] if start else 0
+        stop = max(start + 1, int(np.searchsorted(ends, base + size, side="right")))
+        c = counts[start:stop]
+        row = np.repeat(np.arange(start, stop), c)
+        yield row, np.arange(row.size) - np.repeat(np.cumsum(c) - c, c)
+        start = stop
+
+
+def _pair_blocks(n, size):
+    """Index pairs ``i < j < n`` in blocks of about ``size``."""
+    for i, pos in _ragged_blocks(np.arange(n - 1, -1, -1), size):
+        yield i, i + 1 + pos
+
+
+def box_edges(call_bid, call_ask, put_bid, put_ask, K, T, rates, costs=None, pairs=None):
+    """Long- and short-box edges for strike pairs ``i < j`` per expiry.
+
+    ``K`` must be sorted. ``pairs`` is an ``(i, j)`` pair of index arrays,
+    every pair by default. Returns ``(i, j, long, short)``: the pair
+    indices and two ``(nT, n_pairs)`` arrays of the edge locked in per box
+    after the bid/ask and four option legs plus the ``pvk`` leg of costs.
+    """
+    c = leg_costs(costs)
+    i, j = np.triu_indices(len(K), k=1) if pairs is None else pairs
+    pv_width = (K[j] - K[i]) * discount_factors(rates, np.asarray(T, dtype=float))[:, None]
+    fees = 2 * c["call"] + 2 * c["put"] + c["pvk"]
+    # buy call K_i, sell call K_j, buy put K_j, sell put K_i; borrow the payoff
+    long = pv_width - (call_ask[:, i] - call_bid[:, j] + put_ask[:, j] - put_bid[:, i]) - fees
+    short = (call_bid[:, i] - call_ask[:, j] + put_bid[:, j] - put_ask[:, i]) - pv_width - fees
+    return i, j, long, short
+
+
+def _fly_blocks(n, size):
+    """Index triples ``(i, j, k)`` with ``j - i == k - j >= 1``, about ``size`` at a time."""
+    centers = np.arange(n)
+    for j, pos in _ragged_blocks(np.minimum(centers, n - 1 - centers), size):
+        w = pos + 1
+        yield j - w, j, j + w
+
+
+def _fly_triples(n):
+    """Every index triple ``(i, j, k)`` with ``j - i == k - j >= 1``."""
+    return next(_fly_blocks(n, max(n * n, 1)))
+
+
+def butterfly_edges(bid, ask, K, costs=None, leg="call", triples=None):
+    """Credit from opening a long butterfly on symmetric index triples.
+
+    ``bid``/``ask`` are the ``(nT, nK)`` quotes of one option type and
+    ``K`` is sorted. ``triples`` is an ``(i, j, k)`` triple of index
+    arrays, every symmetric triple by default. The fly buys ``lam`` at
+    ``K_i`` and ``1 - lam`` at ``K_k`` against one sold at ``K_j``, with
+    ``lam`` making the payoff vanish at both wings. Returns
+    ``(i, j, k, lam, edge)``.
+    """
+    i, j, k = _fly_triples(len(K)) if triples is None else triples
+    lam = (K[k] - K[j]) / (K[k] - K[i])
+    fees = 2 * leg_costs(costs)[leg]
+    edge = bid[:, j] - lam * ask[:, i] - (1 - lam) * ask[:, k] - fees
+    return i, j, k, lam, edge
+
+
+def calendar_edges(call_bid, call_ask, T, costs=None):
+    """Credit from selling the near call and buying the far one at each strike.
+
+    Returns ``(a, b, edge)`` with expiry pairs ``T[a] < T[b]`` and
+    ``edge`` shaped ``(n_pairs, nK)``.
+    """
+    T = np.asarray(T, dtype=float)
+    order = np.argsort(T, kind="stable")
+    a, b = np.triu_indices(len(T), k=1)
+    a, b = order[a], order[b]
+    edge = call_bid[a] - call_ask[b] - 2 * leg_costs(costs)["call"]
+    return a, b, edge
+
+
+def _top(edge, top_k, min_edge):
+    """Flat indices of the ``top_k`` largest entries above ``min_edge``."""
+    flat = np.where(np.isfinite(edge), edge, -np.inf).ravel()
+    if flat.size > top_k:
+        flat_idx = np.argpartition(-flat, top_k - 1)[:top_k]
+    else:
+        flat_idx = np.arange(flat.size)
+    flat_idx = flat_idx[flat[flat_idx] > min_edge]
+    return np.unravel_index(flat_idx, edge.shape), flat[flat_idx]
+
+
+def _merge_top(best, edge, columns, top_k, min_edge):
+    """Fold one block into a running ``(rows, columns, values)`` top ``top_k``.
+
+    ``edge`` is ``(n_rows, m)`` and ``columns`` maps names to length-``m``
+    arrays describing its columns; ``best`` is ``None`` before the first
+    block. At most ``top_k`` candidates are kept, so memory stays bounded
+    however many blocks are folded in.
+    """
+    (r, c), v = _top(edge, top_k, min_edge)
+    picked = {name: col[c] for name, col in columns.items()}
+    if best is not None:
+        r, v = np.concatenate([best[0], r]), np.concatenate([best[2], v])
+        picked = {name: np.concatenate([best[1][name], col]) for name, col in picked.items()}
+    if v.size > top_k:
+        keep = np.argpartition(-v, top_k - 1)[:top_k]
+        r, v = r[keep], v[keep]
+        picked = {name: col[keep] for name, col in picked.items()}
+    return r, picked, v
+
+
+def _leg(leg, qty, K, T):
+    return {"leg": leg, "qty": float(qty), "K": float(K), "T": float(T)}
+
+
+def find_arbitrage(
+    call_bid, call_ask, put_bid, put_ask, K, T, rates, costs=None, kinds=KINDS, top_k=20, min_edge=0.0
+):
+    """Best multi-strike arbitrage opportunities in a quoted chain.
+
+    Quotes are ``(len(T), len(K))`` grids (NaN for a missing quote);
+    ``rates`` and ``costs`` are as in :func:`utils.parity.parity_edges`.
+    Returns up to ``top_k`` rows sorted by edge, each with the trade type,
+    the strikes and expiries involved, and its legs.
+    """
+    unknown = set(kinds) - set(KINDS)
+    if unknown:
+        raise ValueError(f"Unknown kinds {sorted(unknown)}; expected some of {KINDS}")
+    quotes, K = _sorted_quotes(
+        {"call_bid": call_bid, "call_ask": call_ask, "put_bid": put_bid, "put_ask": put_ask}, K
+    )
+    T = np.asarray(T, dtype=float)
+    block = max(1, BLOCK_SIZE // max(T.size, 1))
+    rows = []
+
+    if "box" in kinds:
+        best = {1: None, -1: None}
+        for pairs in _pair_blocks(len(K), block):
+            i, j, long, short = box_edges(**quotes, K=K, T=T, rates=rates, costs=costs, pairs=pairs)
+            for sign, edges in ((1, long), (-1, short)):
+                best[sign] = _merge_top(best[sign], edges, {"i": i, "j": j}, top_k, min_edge)
+        for sign, (t, picked, values) in best.items():
+            for t_, i_, j_, edge in zip(t, picked["i"], picked["j"], values):
+                lo, hi, tt = K[i_], K[j_], T[t_]
+                legs = [
+                    _leg("call", sign, lo, tt),
+                    _leg("call", -sign, hi, tt),
+                    _leg("put", sign, hi, tt),
+                    _leg("put", -sign, lo, tt),
+                    _leg("pvk", sign, hi - lo, tt),
+                ]
+                name = "long box" if sign > 0 else "short box"
+                rows.append((name, edge, (lo, hi), (tt,), legs))
+
+    if "butterfly" in kinds:
+        for leg in ("call", "put"):
+            bid, ask = quotes[f"{leg}_bid"], quotes[f"{leg}_ask"]
+            best = None
+            for triples in _fly_blocks(len(K), block):
+                i, j, k, lam, edges = butterfly_edges(bid, ask, K, costs, leg, triples)
+                best = _merge_top(best, edges, {"i": i, "j": j, "k": k, "lam": lam}, top_k, min_edge)
+            t, picked, values = best
+            for t_, i_, j_, k_, lam_, edge in zip(t, *picked.values(), values):
+                strikes, tt = (K[i_], K[j_], K[k_]), T[t_]
+                legs = [
+                    _leg(leg, lam_, strikes[0], tt),
+                    _leg(leg, -1, strikes[1], tt),
+                    _leg(leg, 1 - lam_, strikes[2], tt),
+                ]
+                rows.append((f"{leg} butterfly", edge, strikes, (tt,), legs))
+
+    if "calendar" in kinds:
+        a, b, edges = calendar_edges(quotes["call_bid"], quotes["call_ask"], T, costs)
+        (p, s), values = _top(edges, top_k, min_edge)
+        for p_, s_, edge in zip(p, s, values):
+            near, far = T[a[p_]], T[b[p_]]
+            legs = [_leg("call", -1, K[s_], near), _leg("call", 1, K[s_], far)]
+            rows.append(("calendar", edge, (K[s_],), (near, far), legs))
+
+    table = pd.DataFrame(rows, columns=["Type", "Edge", "Strikes", "Expiries", "Legs"])
+    table["Edge"] = table["Edge"].astype(float)
+    return table.sort_values("Edge", ascending=False, kind="stable").head(top_k).reset_index(drop=True)
@@ -0,0 +1,153 @@
+"""Multi-leg strategies as NumPy structured arrays.
+
+A position is an array of :data:`LEG_DTYPE` records, one per leg:
+``kind`` (an index into :data:`LEG_KINDS`), ``strike``, ``expiry`` (years),
+``qty`` (signed) and ``price`` (entry value per unit). The kinds follow the
+:data:`utils.trade_simulation.TRADE_MAP` legs; ``pvk`` is the financing
+leg, where ``+1`` borrows ``PV(K)`` now and repays ``K`` at expiry (so its
+unit payoff is ``-K`` and its entry value ``-PV(K)``).
+
+Terminal payoffs and P&L are evaluated for a whole vector of terminal
+prices in one broadcast: option legs contribute ``max(+-(S_T - K), 0)``
+columns combined with a single matrix product, and stock and ``pvk`` legs
+reduce to a slope and a constant. :func:`model_pnl` marks a position
+before expiry with Black-Scholes.
+"""
+
+import numpy as np
+
+from . import option_pricing as op
+
+LEG_KINDS = ("call", "put", "stock", "pvk")
+CALL, PUT, STOCK, PVK = range(len(LEG_KINDS))
+
+LEG_DTYPE = np.dtype(
+    [
+        ("kind", np.int8),
+        ("strike", np.float64),
+        ("expiry", np.float64),
+        ("qty", np.float64),
+        ("price", np.float64),
+    ]
+)
+
+# marks are usually one-off grids, so skip the pricing cache
+_price_and_greeks = op.price_and_greeks.__wrapped__
+
+
+def _kind_code(kind):
+    if kind not in LEG_KINDS:
+        raise ValueError(f"Unknown leg kind {kind!r}; expected one of {LEG_KINDS}")
+    return LEG_KINDS.index(kind)
+
+
+def make_legs(kind, strike=0.0, expiry=0.0, qty=1.0, price=0.0):
+    """Build a leg array from per-leg sequences (or scalars, broadcast).
+
+    ``kind`` holds names from :data:`LEG_KINDS`.
+    """
+    kind, *values = np.broadcast_arrays(
+        np.atleast_1d(kind), *(np.asarray(v, dtype=float) for v in (strike, expiry, qty, price))
+    )
+    legs = np.empty(kind.size, dtype=LEG_DTYPE)
+    legs["kind"] = [_kind_code(k) for k in kind.ravel()]
+    legs["strike"], legs["expiry"], legs["qty"], legs["price"] = (v.ravel() for v in values)
+    return legs
+
+
+def trade_legs(params, trade):
+    """Legs of a :data:`~utils.trade_simulation.TRADE_MAP`-style trade on one strike.
+
+    ``params`` holds ``S``, ``K``, ``r``, ``T`` and the option prices as
+    ``C``/``P`` (or ``C_mkt``/``P_mkt``); legs with zero quantity are kept.
+    """
+    C = params.get("C", params.get("C_mkt"))
+    P = params.get("P", params.get("P_mkt"))
+    K, T = params["K"], params["T"]
+    pvk = K * np.exp(-params["r"] * T)
+    return make_legs(
+        LEG_KINDS,
+        strike=K,
+        expiry=T,
+        qty=[trade["call"], trade["put"], trade["stock"], trade["pvk"]],
+        price=[C, P, params["S"], -pvk],
+    )
+
+
+def entry_cash_flow(legs):
+    """Cash received on entry (negative when the position costs money)."""
+    return 0.0 - np.dot(legs["qty"], legs["price"])  # +0.0, not -0.0, for a flat position
+
+
+def payoff(legs, ST):
+    """Value of the legs at expiry for each terminal price in ``ST``.
+
+    ``legs`` may also be a batch of positions, ``(n_positions, n_legs)``,
+    with ``ST`` holding one row of terminal prices per position; the
+    result is then ``(n_positions, n_spots)``.
+    """
+    ST = np.asarray(ST, dtype=float)
+    if legs.ndim > 1:
+        return _batch_payoff(legs, ST)
+    kind, K, qty = legs["kind"], legs["strike"], legs["qty"]
+    opt = kind <= PUT
+    # +1 for calls, -1 for puts: max(sign * (S_T - K), 0) covers both
+    sign = np.where(kind[opt] == CALL, 1.0, -1.0)
+    x = np.subtract.outer(ST, K[opt])
+    x *= sign
+    value = np.maximum(x, 0.0, out=x) @ qty[opt]
+    value += ST * qty[kind == STOCK].sum() - np.dot(qty[kind == PVK], K[kind == PVK])
+    return value
+
+
+def _batch_payoff(legs, ST):
+    """:func:`payoff` for ``(n_positions, n_legs)`` legs and ``(n_positions, n_spots)`` prices."""
+    kind, K, qty = legs["kind"], legs["strike"], legs["qty"]
+    value = ST * np.where(kind == STOCK, qty, 0.0).sum(axis=-1)[..., None]
+    value -= np.where(kind == PVK, qty * K, 0.0).sum(axis=-1)[..., None]
+    # positions have few legs, so loop over leg columns, skipping any
+    # column that holds no option in any position
+    for leg in range(kind.shape[-1]):
+        k = kind[..., leg]
+        is_opt = k <= PUT
+        if not is_opt.any():
+            continue
+        x = ST - K[..., leg, None]
+        x *= np.where(k == CALL, 1.0, -1.0)[..., None]
+        np.maximum(x, 0.0, out=x)
+        x *= np.where(is_opt, qty[..., leg], 0.0)[..., None]
+        value += x
+    return value
+
+
+def pnl(legs, ST):
+    """P&L at expiry: :func:`payoff` plus the entry cash flow."""
+    return payoff(legs, ST) + entry_cash_flow(legs)
+
+
+def mark(legs, S, r, sigma, t=0.0, q=0.0):
+    """Black-Scholes value of the legs at spots ``S``, ``t`` years after entry.
+
+    ``sigma`` is a flat vol or one per leg. Legs already past expiry are
+    worth their intrinsic value.
+    """
+    S = np.asarray(S, dtype=float)[..., None]
+    kind, K, qty = legs["kind"], legs["strike"], legs["qty"]
+    tau = legs["expiry"] - t
+    unit = np.where(kind == STOCK, S, np.where(kind == PVK, -K * np.exp(-r * np.maximum(tau, 0.0)), 0.0))
+
+    live = (kind <= PUT) & (tau > 0)
+    if live.any():
+        vol = np.broadcast_to(np.asarray(sigma, dtype=float), K.shape)[live]
+        pg = _price_and_greeks(S, K[live], r, tau[live], vol, q, keys=("call_price", "put_price"))
+        unit[..., live] = np.where(kind[live] == CALL, pg["call_price"], pg["put_price"])
+    expired = (kind <= PUT) & ~live
+    if expired.any():
+        sign = np.where(kind[expired] == CALL, 1.0, -1.0)
+        unit[..., expired] = np.maximum(sign * (S - K[expired]), 0.0)
+    return unit @ qty
+
+
+def model_pnl(legs, S, r, sigma, t=0.0, q=0.0):
+    """Mark-to-model P&L: :func:`mark` plus the entry cash flow."""
+    return mark(legs, S, r, sigma, t, q) + entry_cash_flow(legs)
@@ -1,5 +1,7 @@
 import numpy as np
 
+from .strategy import entry_cash_flow, pnl, trade_legs
+
 TRADE_MAP = {
     "Buy call, sell put, buy stock, borrow PV(K)": {
         "call": 1,
@@ -44,31 +46,6 @@ def trade_from_choices(call_choice, put_choice, stock_choice, pvk_choice, call_q
 
 def simulate_trade(params, trade, S_future=(90, 100, 110, 120, 130)):
     """Return initial cash flow and P&L for each future stock price."""
-    C = params.get("C", params.get("C_mkt"))
-    P = params.get("P", params.get("P_mkt"))
-    S0 = params["S"]
-    K = params["K"]
-    r = params["r"]
-    T = params["T"]
-    pvk = pv_k(K, r, T)
-
-    cf0 = (
-        -trade["call"] * C
-        - trade["put"] * P
-        - trade["stock"] * S0
-        + trade["pvk"] * pvk
-    )
-
-    results = {}
-    for ST in S_future:
-        call_payoff = max(ST - K, 0)
-        put_payoff = max(K - ST, 0)
-        end = (
-            trade["call"] * call_payoff
-            + trade["put"] * put_payoff
-            + trade["stock"] * ST
-            - trade["pvk"] * K
-        )
-        results[ST] = cf0 + end
-
-    return cf0, results
\ No newline at end of file
+    legs = trade_legs(params, trade)
+    pnls = pnl(legs, S_future)
+    return entry_cash_flow(legs), dict(zip(S_future, pnls.tolist()))
@@ -0,0 +1,206 @@
+"""SVI volatility surface: per-expiry smiles calibrated from a quote grid.
+
+Each expiry slice is a raw SVI smile in total implied variance,
+
+    w(k) = a + b * (rho * (k - m) + sqrt((k - m)^2 + s^2)),
+
+with ``k = ln(K / F)`` the log-forward moneyness. Calibration uses the
+quasi-explicit method: for fixed ``(m, s)`` the slice is linear in
+``(a, b rho s, b s)``, so those come from a weighted least-squares solve
+and only ``(m, s)`` are searched. The linear solves are batched over all
+expiries and a grid of ``(m, s)`` candidates, and the grid is zoomed in
+around the best point a few times.
+
+Total variance is tabulated on a fixed log-moneyness grid when the surface
+is built, so :meth:`VolSurface.sigma` is a table lookup plus linear
+interpolation in ``k`` and, between expiries, in total variance. Recent
+query grids are memoized as well, so repeated chain builds on the same
+strikes and expiries skip the lookup entirely.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+SVI_PARAMS = ("a", "b", "rho", "m", "s")
+
+_MEMO_SIZE = 8
+
+
+def svi_total_variance(k, a, b, rho, m, s):
+    """Raw SVI total implied variance at log-forward moneyness ``k``."""
+    x = k - m
+    return a + b * (rho * x + np.sqrt(x * x + s * s))
+
+
+def _fit_linear(k, w, wt, m, s):
+    """Best ``(a, d, c)`` per candidate for ``w = a + d y + c sqrt(y^2 + 1)``.
+
+    ``k``, ``w``, ``wt`` are ``(nT, nK)``; ``m``, ``s`` are ``(nT, G)``.
+    Returns the clipped coefficients and the weighted squared error, each
+    ``(nT, G)``.
+    """
+    y = (k[:, None, :] - m[..., None]) / s[..., None]
+    z = np.sqrt(y * y + 1)
+    X = (np.ones_like(y), y, z)
+    A = np.empty(y.shape[:2] + (3, 3))
+    rhs = np.empty(y.shape[:2] + (3,))
+    for i in range(3):
+        wx = wt[:, None, :] * X[i]
+        rhs[..., i] = (wx * w[:, None, :]).sum(axis=-1)
+        for j in range(i, 3):
+            A[..., i, j] = A[..., j, i] = (wx * X[j]).sum(axis=-1)
+    A += 1e-12 * np.eye(3)  # keeps degenerate candidates solvable
+    a, d, c = np.moveaxis(np.linalg.solve(A, rhs[..., None])[..., 0], -1, 0)
+
+    # b >= 0, |rho| <= 1 and a non-negative minimum variance
+    c = np.maximum(c, 0.0)
+    d = np.clip(d, -c, c)
+    a = np.maximum(a, -np.sqrt(c * c - d * d))
+    fit = a[..., None] + d[..., None] * y + c[..., None] * z
+    err = (wt[:, None, :] * (fit - w[:, None, :]) ** 2).sum(axis=-1)
+    return a, d, c, err
+
+
+def _search(k, w, wt, valid, grid, rounds):
+    """Zooming ``(m, s)`` grid search for a block of slices."""
+    big = np.where(valid, k, np.nan)
+    m_lo, m_hi = np.nanmin(big, axis=1), np.nanmax(big, axis=1)
+    log_s_lo = np.full(len(k), np.log(1e-3))
+    log_s_hi = np.full(len(k), np.log(2.0))
+    u = np.linspace(0.0, 1.0, grid)
+    rows = np.arange(len(k))
+
+    for _ in range(rounds):
+        m_grid = m_lo[:, None] + (m_hi - m_lo)[:, None] * u
+        log_s_grid = log_s_lo[:, None] + (log_s_hi - log_s_lo)[:, None] * u
+        m = np.repeat(m_grid, grid, axis=1)
+        s = np.exp(np.tile(log_s_grid, (1, grid)))
+        a, d, c, err = _fit_linear(k, w, wt, m, s)
+
+        best = np.argmin(err, axis=1)
+        m_best, s_best = m[rows, best], s[rows, best]
+        # zoom to two grid steps either side of the best candidate
+        m_step = 2 * (m_hi - m_lo) / (grid - 1)
+        s_step = 2 * (log_s_hi - log_s_lo) / (grid - 1)
+        m_lo, m_hi = m_best - m_step, m_best + m_step
+        log_s_lo, log_s_hi = np.log(s_best) - s_step, np.log(s_best) + s_step
+
+    a, d, c = a[rows, best], d[rows, best], c[rows, best]
+    b = c / s_best
+    rho = np.divide(d, c, out=np.zeros_like(d), where=c > 0)
+    return np.column_stack([a, b, rho, m_best, s_best])
+
+
+def calibrate_svi(k, w, weights=None, grid=15, rounds=5):
+    """Fit one SVI slice per row of ``k``/``w`` (each ``(nT, nK)``).
+
+    ``w`` is observed total variance; NaNs are ignored. Returns an array of
+    ``(nT, 5)`` raw parameters ordered as :data:`SVI_PARAMS`.
+    """
+    k, w = np.atleast_2d(k).astype(float), np.atleast_2d(w).astype(float)
+    wt = np.ones_like(w) if weights is None else np.broadcast_to(weights, w.shape).astype(float)
+    valid = np.isfinite(w) & np.isfinite(k)
+    wt = np.where(valid, wt, 0.0)
+    w = np.where(valid, w, 0.0)
+    k = np.where(valid, k, 0.0)
+
+    # the search materialises (slices, grid^2, strikes) arrays; bound their size
+    block = max(1, 2_000_000 // (grid * grid * k.shape[1]))
+    return np.concatenate(
+        [
+            _search(k[i:i + block], w[i:i + block], wt[i:i + block], valid[i:i + block], grid, rounds)
+            for i in range(0, len(k), block)
+        ]
+    )
+
+
+class VolSurface:
+    """SVI slices per expiry with a cached total-variance table.
+
+    ``params`` is ``(nT, 5)`` raw SVI (see :data:`SVI_PARAMS`) for
+    ``expiries``; ``S``, ``r`` and ``q`` fix the forwards used for
+    moneyness. Use :meth:`calibrate` to build one from market vols.
+    """
+
+    def __init__(self, S, r, expiries, params, q=0.0, k_max=3.0, n_grid=4001):
+        order = np.argsort(expiries)
+        self.S, self.r, self.q = float(S), r, q
+        self.expiries = np.asarray(expiries, dtype=float)[order]
+        self.params = np.asarray(params, dtype=float).reshape(-1, 5)[order]
+        self.k_grid = np.linspace(-k_max, k_max, n_grid)
+        self._dk = self.k_grid[1] - self.k_grid[0]
+        self._w_grid = svi_total_variance(self.k_grid[None, :], *self.params.T[..., None])
+        self._memo = OrderedDict()
+
+    @classmethod
+    def calibrate(cls, S, r, expiries, strikes, ivs, q=0.0, weights=None, **kwargs):
+        """Fit a surface to an ``expiries x strikes`` grid of implied vols.
+
+        NaN quotes (e.g. failed implied-vol solves) are skipped. Extra
+        keyword arguments go to the constructor.
+        """
+        T = np.asarray(expiries, dtype=float)[:, None]
+        K = np.asarray(strikes, dtype=float)
+        K = np.broadcast_to(K if K.ndim == 2 else K[None, :], (T.shape[0], K.shape[-1]))
+        k = np.log(K / (S * np.exp((r - q) * T)))
+        w = np.asarray(ivs, dtype=float) ** 2 * T
+        return cls(S, r, T.ravel(), calibrate_svi(k, w, weights), q, **kwargs)
+
+    def total_variance(self, K, T, S=None):
+        """Total implied variance at strikes ``K`` and expiries ``T`` (broadcast).
+
+        Between expiries total variance is interpolated linearly at constant
+        log-forward moneyness; before the first and after the last expiry it
+        is scaled in proportion to ``T``. ``S`` overrides the surface spot
+        (sticky moneyness); by default vols are sticky to strike.
+        """
+        S = self.S if S is None else S
+        K, T = np.broadcast_arrays(np.asarray(K, dtype=float), np.asarray(T, dtype=float))
+        k = np.log(K / (S * np.exp((self.r - self.q) * T)))
+
+        # one (index, weight) pair in k serves both bracketing slices
+        n_k = len(self.k_grid)
+        pos = (k - self.k_grid[0]) / self._dk
+        j = np.clip(pos.astype(np.intp), 0, n_k - 2)
+        f = pos - j
+
+        Ts = self.expiries
+        hi = np.clip(np.searchsorted(Ts, T), 1, max(len(Ts) - 1, 1)) if len(Ts) > 1 else np.zeros_like(j)
+        lo = np.maximum(hi - 1, 0)
+        table = self._w_grid.ravel()
+        at_lo = lo * n_k + j
+        w_lo = table[at_lo] + (table[at_lo + 1] - table[at_lo]) * f
+        at_hi = hi * n_k + j
+        w_hi = table[at_hi] + (table[at_hi + 1] - table[at_hi]) * f
+
+        # beyond the table the wings are evaluated exactly
+        outside = (pos < 0) | (pos > n_k - 1)
+        if outside.any():
+            w_lo = np.where(outside, svi_total_variance(k, *np.moveaxis(self.params[lo], -1, 0)), w_lo)
+            w_hi = np.where(outside, svi_total_variance(k, *np.moveaxis(self.params[hi], -1, 0)), w_hi)
+
+        if len(Ts) == 1:
+            return w_lo * T / Ts[0]
+        w = w_lo + (w_hi - w_lo) * ((T - Ts[lo]) / (Ts[hi] - Ts[lo]))
+        w = np.where(T < Ts[0], w_lo * T / Ts[0], w)
+        return np.where(T > Ts[-1], w_hi * T / Ts[-1], w)
+
+    def sigma(self, K, T, S=None):
+        """Implied volatility at strikes ``K`` and expiries ``T`` (broadcast).
+
+        The last few query grids are memoized by content, so rebuilding the
+        same chain returns a copy of the previous answer.
+        """
+        K, T = np.asarray(K, dtype=float), np.asarray(T, dtype=float)
+        digest = hashlib.blake2b(K.tobytes() + T.tobytes(), digest_size=16).digest()
+        key = (S, K.shape, T.shape, digest)
+        if key in self._memo:
+            self._memo.move_to_end(key)
+            return self._memo[key].copy()[()]
+        vol = np.sqrt(np.maximum(self.total_variance(K, T, S), 0.0) / T)
+        self._memo[key] = vol
+        if len(self._memo) > _MEMO_SIZE:
+            self._memo.popitem(last=False)
+        return vol.copy()[()]